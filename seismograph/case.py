@@ -11,9 +11,11 @@ from . import steps
 from . import loader
 from . import reason
 from . import runnable
+from . import timeouts
 from .utils import pyv
 from . import extensions
 from .exceptions import Skip
+from .utils.common import maybe_await
 from .utils.common import measure_time
 from .utils.common import call_to_chain
 from .exceptions import ExtensionNotRequired
@@ -43,17 +45,26 @@ def prepare(case, method):
     return case.__prepare__(method)
 
 
+def rounds_of_case(case):
+    """
+    How many times case is running by REPEAT option
+    """
+    if case.__repeatable__ and case.config.REPEAT > 0:
+        return case.config.REPEAT
+    return 1
+
+
 def setup_class_proxy(case):
     if getattr(case.__class__, '__setup_class_was_called__', False):
         return
-    case.setup_class()
+    maybe_await(case.setup_class())
     setattr(case.__class__, '__setup_class_was_called__', True)
 
 
 def teardown_class_proxy(case):
     if getattr(case.__class__, '__teardown_class_was_called__', False):
         return
-    case.teardown_class()
+    maybe_await(case.teardown_class())
     setattr(case.__class__, '__teardown_class_was_called__', True)
 
 
@@ -189,14 +200,46 @@ class CaseBox(object):
     def __getattr__(self, item):
         return getattr(self.__current, item)
 
+    @property
+    def is_parallel(self):
+        """
+        Cases of box are running concurrently between
+        setup_class and teardown_class if it is allowed by class
+        """
+        cases = list(self.__cases)
+        return len(cases) > 1 and getattr(cases[0], '__parallel_methods__', False)
+
     def __run_current__(self, result):
-        if self.__current.__repeatable__ and self.__current.config.REPEAT > 0:
-            for _ in pyv.xrange(self.__current.config.REPEAT):
-                self.__current(result)
-        else:
+        for _ in pyv.xrange(rounds_of_case(self.__current)):
             self.__current(result)
 
+    def __run_parallel__(self, result):
+        from .groups import make_case_group
+
+        cases = list(self.__cases)
+        self.__current = cases[0]
+
+        try:
+            setup_class_proxy(self.__current)
+        except BaseException as error:
+            runnable.stopped_on(self.__current, 'setup_class')
+            raise error
+
+        # each instance is running once at a time,
+        # so cases are repeated by rounds
+        for _ in pyv.xrange(rounds_of_case(self.__current)):
+            make_case_group(cases, self.__current.config)(result)
+
+        try:
+            teardown_class_proxy(self.__current)
+        except BaseException as error:
+            runnable.stopped_on(self.__current, 'teardown_class')
+            raise error
+
     def __run__(self, result):
+        if self.is_parallel:
+            return self.__run_parallel__(result)
+
         for case in self.__cases:
             self.__current = case
             try:
@@ -216,14 +259,24 @@ class CaseBox(object):
 
 class MountData(object):
 
-    def __init__(self, suite_name=None, require=None):
+    def __init__(self, suite_name=None, require=None, resources=None, timeout=None):
+        self.__timeout = timeout
         self.__require = require
+        self.__resources = resources
         self.__suite_name = suite_name
 
     @property
     def require(self):
         return self.__require
 
+    @property
+    def resources(self):
+        return self.__resources
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
     @property
     def suite_name(self):
         return self.__suite_name
@@ -625,8 +678,11 @@ class Case(with_metaclass(steps.CaseMeta, runnable.RunnableObject, runnable.Moun
 
     __flows__ = None
     __layers__ = None
+    __parallel_methods__ = False
     __static__ = False
+    __timeout__ = None
     __require__ = None
+    __resources__ = None
     __repeatable__ = True
     __create_reason__ = True
     __always_success__ = False
@@ -653,11 +709,28 @@ class Case(with_metaclass(steps.CaseMeta, runnable.RunnableObject, runnable.Moun
             self.__mount_data__.suite_name, self.__class__.__name__,
         )
 
-    def __reason__(self):
-        reasons = []
+    def __reason_data__(self):
+        """
+        Step history and reason storage of case at the moment of error
+        """
+        step_data = None
 
         if steps.is_step_by_step_case(self):
-            history = steps.get_case_history(self) or [None]
+            step_data = (
+                tuple(steps.get_case_history(self) or [None]),
+                steps.get_current_step(self),
+                steps.get_current_flow(self),
+            )
+
+        return step_data, tuple(self.reason_storage.items())
+
+    @classmethod
+    def __format_reason_data__(cls, data):
+        step_data, reason_storage = data
+        reasons = []
+
+        if step_data:
+            history, current_step, current_flow = step_data
 
             reasons.append(
                 reason.join(
@@ -670,23 +743,23 @@ class Case(with_metaclass(steps.CaseMeta, runnable.RunnableObject, runnable.Moun
                         reason.item(
                             'Current step',
                             'when exception was raised',
-                            steps.get_current_step(self),
+                            current_step,
                         ),
                         reason.item(
                             'Current flow',
                             'context of steps execution',
-                            steps.get_current_flow(self),
+                            current_flow,
                         ),
                     ),
                 ),
             )
 
-        if self.reason_storage:
+        if reason_storage:
             reasons.append(
                 reason.item(
                     'Case',
                     'info from test case',
-                    *(u'{}: {}'.format(k, v) for k, v in self.reason_storage.items())
+                    *(u'{}: {}'.format(k, v) for k, v in reason_storage)
                 ),
             )
 
@@ -725,13 +798,13 @@ class Case(with_metaclass(steps.CaseMeta, runnable.RunnableObject, runnable.Moun
                 was_success = True
 
                 for _ in iter(repeat(self)):
-                    with self.__context(self):
+                    with timeouts.watch(self), self.__context(self):
                         try:
                             test_method = prepare(
                                 self, getattr(self, runnable.method_name(self)),
                             )
                             for _ in iter(repeat_method(self)):
-                                test_method()
+                                maybe_await(test_method())
                         except ALLOW_RAISED_EXCEPTIONS:
                             result_proxy.current_state.should_stop = True
                             raise
@@ -871,6 +944,8 @@ class Case(with_metaclass(steps.CaseMeta, runnable.RunnableObject, runnable.Moun
         cls.__mount_data__ = MountData(
             suite_name=suite.name,
             require=common_require,
+            resources=suite.resources,
+            timeout=suite.timeout,
         )
 
         return cls
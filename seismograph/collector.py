@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import zlib
 import logging
 from random import Random
 
 from . import loader
 from . import extensions
 from .suite import BuildRule
+from .history import RuntimeHistory
 from .exceptions import CollectError
 from .utils.common import call_to_chain
 
@@ -20,6 +22,12 @@ def get_shuffle(config):
     return None
 
 
+def get_history(config):
+    if config.RUNTIME_HISTORY:
+        return RuntimeHistory(config.RUNTIME_HISTORY)
+    return None
+
+
 def get_suite_name_from_command(command):
     try:
         suite_name, _ = command.split(':')
@@ -53,55 +61,171 @@ def get_test_name_from_command(command):
         return None
 
 
-def try_apply_rules(suite, rules):
-    for rule in rules[::-1]:
-        if rule.is_of(suite):
-            suite.assign_build_rule(rule)
-            rules.remove(rule)
+def stable_hash(string):
+    return zlib.crc32(string.encode('utf-8')) & 0xffffffff
 
 
-def base_generator(suites, shuffle=None):
-    call_to_chain(suites, 'build', shuffle=shuffle)
-    extensions.clear()
+def split_to_shards(units, count, weight):
+    """
+    Greedy balanced partition of units.
+    The heaviest unit is taken first and goes to the lightest shard.
+    Partition is the same on each machine for the same units and weights.
+    """
+    shards = [[] for _ in range(count)]
+    loads = [float() for _ in range(count)]
 
-    if shuffle:
-        shuffle(suites)
+    units = sorted(
+        units, key=lambda u: (-weight(u), stable_hash(str(u)), str(u)),
+    )
 
-    for suite in suites:
-        yield suite
+    for unit in units:
+        index = loads.index(min(loads))
+        shards[index].append(unit)
+        loads[index] += weight(unit)
+
+    return shards
+
+
+def get_weight_of_rule(suites, history=None, index=None):
+    if index is None:
+        index = loader.make_suite_index(suites)
+
+    def weight(rule):
+        suite = loader.load_suite_by_name(rule.suite_name, suites, index=index)
+
+        if rule.case_name:
+            classes = [loader.load_case_from_suite(rule.case_name, suite)]
+        else:
+            classes = suite.cases
+
+        tests = [
+            str(BuildRule(suite.name, cls.__name__, test_name))
+            for cls in classes
+            for test_name in (
+                [rule.test_name] if rule.test_name else loader.get_test_names_of_case(cls)
+            )
+        ]
+
+        if history:
+            return sum(history.get(t, history.average) for t in tests)
+
+        return len(tests)
+
+    return weight
+
+
+def get_rules_of_shard(suites, rules, config, history=None, index=None):
+    if rules is None:
+        rules = [
+            BuildRule(
+                suite_name=suite.name,
+                case_name=cls.__name__,
+            )
+            for suite in suites
+            for cls in suite.cases
+        ]
+
+    shards = split_to_shards(
+        rules, config.SHARD_COUNT, get_weight_of_rule(suites, history=history, index=index),
+    )
+
+    logger.debug(
+        'Shard {} of {} got {} from {} units'.format(
+            config.SHARD_INDEX, config.SHARD_COUNT, len(shards[config.SHARD_INDEX]), len(rules),
+        ),
+    )
 
+    return shards[config.SHARD_INDEX]
+
+
+def apply_rules(suites, rules, index=None):
+    """
+    Assign build rules to suites by one pass of rules.
+    Return suites of rules and rules which were not applied.
+    """
+    if index is None:
+        index = loader.make_suite_index(suites)
 
-def generator_by_commands(suites, rules, shuffle=None):
     loaded_suites = []
+    loaded_ids = set()
+    not_applied = []
 
     for rule in rules[::-1]:
-        suite = loader.load_suite_by_name(rule.suite_name, suites)
+        suite = loader.load_suite_by_name(rule.suite_name, suites, index=index)
+
+        if not rule.is_of(suite):
+            not_applied.append(rule)
+            continue
+
+        suite.assign_build_rule(rule)
 
-        try_apply_rules(suite, rules)
-        if suite not in loaded_suites:
+        if id(suite) not in loaded_ids:
+            loaded_ids.add(id(suite))
             loaded_suites.append(suite)
 
-    if rules:
+    return loaded_suites, not_applied
+
+
+def base_generator(suites, shuffle=None, history=None, lazy=False):
+    call_to_chain(
+        suites, 'build',
+        shuffle=shuffle,
+        order=history.order_cases if history else None,
+        lazy=lazy,
+    )
+
+    # extensions are installed to cases while build of lazy suite
+    if not lazy:
+        extensions.clear()
+
+    if shuffle:
+        shuffle(suites)
+
+    if history:
+        history.order_suites(suites)
+
+    for suite in suites:
+        yield suite
+
+
+def generator_by_commands(suites, rules, shuffle=None, history=None, lazy=False, index=None):
+    loaded_suites, not_applied = apply_rules(suites, rules, index=index)
+
+    if not_applied:
         raise CollectError(
             'incorrect commands to collect "{}"'.format(
-                ', '.join(str(r) for r in rules),
+                ', '.join(str(r) for r in not_applied),
             ),
         )
 
-    call_to_chain(loaded_suites, 'build', shuffle=shuffle)
-    extensions.clear()
+    call_to_chain(
+        loaded_suites, 'build',
+        shuffle=shuffle,
+        order=history.order_cases if history else None,
+        lazy=lazy,
+    )
+
+    if not lazy:
+        extensions.clear()
 
     if shuffle:
         shuffle(loaded_suites)
 
+    if history:
+        history.order_suites(loaded_suites)
+
     for suite in loaded_suites:
         yield suite
 
 
-def create_generator(suites, config):
-    if config.TESTS:
-        logger.debug('Create suite generator by commands')
+def create_generator(suites, config, index=None):
+    """
+    :param index: dict of suites by name
+    """
+    rules = None
+    history = get_history(config)
 
+    if config.TESTS:
         rules = [
             BuildRule(
                 suite_name=get_suite_name_from_command(c),
@@ -110,12 +234,30 @@ def create_generator(suites, config):
             )
             for c in config.TESTS
         ]
+
+    if config.SHARD_COUNT > 1:
+        logger.debug('Split suites to shards')
+
+        rules = get_rules_of_shard(
+            suites, rules, config, history=history, index=index,
+        )
+
+    if rules is not None:
+        logger.debug('Create suite generator by commands')
+
         return generator_by_commands(
-            suites, rules, shuffle=get_shuffle(config),
+            suites, rules,
+            shuffle=get_shuffle(config),
+            history=history,
+            lazy=config.LAZY_BUILD,
+            index=index,
         )
 
     logger.debug('Create base suite generator')
 
     return base_generator(
-        suites, shuffle=get_shuffle(config),
+        suites,
+        shuffle=get_shuffle(config),
+        history=history,
+        lazy=config.LAZY_BUILD,
     )
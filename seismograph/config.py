@@ -26,6 +26,26 @@ def create_option_parser():
         default=None,
         help='Path to xml file to store the xunit report in.',
     )
+    result_group.add_option(
+        '--events-file',
+        dest='EVENTS_FILE',
+        default=None,
+        help='Path to file to write events of run in JSON lines.',
+    )
+    result_group.add_option(
+        '--events-fd',
+        dest='EVENTS_FD',
+        type=int,
+        default=None,
+        help='Descriptor of opened file or pipe to write events of run in JSON lines.',
+    )
+    result_group.add_option(
+        '--low-memory',
+        dest='LOW_MEMORY',
+        action='store_true',
+        default=False,
+        help='Release cases after run and keep compact data of results only.',
+    )
     parser.add_option_group(result_group)
 
     console_group = OptionGroup(parser, 'Output options')
@@ -146,6 +166,56 @@ def create_option_parser():
         default=time.time(),
         help='Seed for random tests and suites.',
     )
+    run_group.add_option(
+        '--runtime-history',
+        dest='RUNTIME_HISTORY',
+        type=str,
+        default=None,
+        help='Path to json file with runtimes of tests. '
+             'It is updated after run and used to start the longest tests first. '
+             'Shard is not updating it, runtimes of shard are written with '
+             '".shard<index>" suffix.',
+    )
+    run_group.add_option(
+        '--discovery-cache',
+        dest='DISCOVERY_CACHE',
+        type=str,
+        default=None,
+        help='Path to json file with suites of modules. '
+             'Unchanged modules without required suites are not imported.',
+    )
+    run_group.add_option(
+        '--prescan',
+        dest='PRESCAN',
+        action='store_true',
+        default=False,
+        help='Scan sources of modules before import and '
+             'import only modules which can define suites of "-t" option.',
+    )
+    run_group.add_option(
+        '--lazy-build',
+        dest='LAZY_BUILD',
+        action='store_true',
+        default=False,
+        help='Create cases of suite just before run of the suite. '
+             'Cases are created before start for multiprocessing group.',
+    )
+    run_group.add_option(
+        '--shard-count',
+        type=int,
+        dest='SHARD_COUNT',
+        default=0,
+        help='Split tests to this num of balanced shards and run one of them. '
+             'Shards are balanced by runtime history which should be the same for each shard. '
+             'Xunit report of shard is written with ".shard<index>" suffix.',
+    )
+    run_group.add_option(
+        '--shard-index',
+        type=int,
+        dest='SHARD_INDEX',
+        default=0,
+        help='Index of shard to run (from 0).',
+    )
     run_group.add_option(
         '--no-skip',
         dest='NO_SKIP',
@@ -174,6 +244,21 @@ def create_option_parser():
         default=0,
         help='Num tests from suite to async run.',
     )
+    run_group.add_option(
+        '--resource',
+        dest='RESOURCE_CAPACITY',
+        action='append',
+        default=None,
+        help='Capacity of resource from "__resources__" of cases as NAME=N. '
+             'Undeclared capacity is 1. Can be used many times.',
+    )
+    run_group.add_option(
+        '--test-timeout',
+        type=float,
+        dest='TEST_TIMEOUT',
+        default=None,
+        help='Timeout of test in sec. if "__timeout__" is not set on case or suite.',
+    )
     run_group.add_option(
         '--mp-timeout',
         type=float,
@@ -188,6 +273,13 @@ def create_option_parser():
         default=False,
         help='Use gevent groups for run. Allow for python 2 only.',
     )
+    run_group.add_option(
+        '--asyncio',
+        dest='ASYNCIO',
+        action='store_true',
+        default=False,
+        help='Use asyncio groups for run. Coroutines of tests are awaited on one event loop. Allow for python 3 only.',
+    )
     run_group.add_option(
         '--threading',
         dest='THREADING',
@@ -214,13 +306,37 @@ def prepare_config(config):
         from logging.config import dictConfig
         dictConfig(logging_settings)
 
-    if not config.GEVENT and not config.THREADING and (
+    if not config.GEVENT and not config.THREADING and not config.ASYNCIO and (
             config.ASYNC_SUITES or config.ASYNC_TESTS):
         config.MULTIPROCESSING = True
 
     if (config.STEPS_LOG or config.FLOWS_LOG) and not config.VERBOSE:
         config.VERBOSE = True
 
+    if config.RESOURCE_CAPACITY:
+        resources = dict(config.get('RESOURCES') or {})
+
+        for item in config.RESOURCE_CAPACITY:
+            try:
+                name, capacity = item.rsplit('=', 1)
+                resources[name] = int(capacity)
+            except ValueError:
+                raise ConfigError(
+                    'incorrect capacity of resource "{}", should be NAME=N'.format(item),
+                )
+
+        config.RESOURCES = resources
+
+    if config.SHARD_COUNT > 1:
+        if not 0 <= config.SHARD_INDEX < config.SHARD_COUNT:
+            raise ConfigError(
+                'shard index should be from 0 to {}'.format(config.SHARD_COUNT - 1),
+            )
+
+        if config.XUNIT_REPORT:
+            path, ext = os.path.splitext(config.XUNIT_REPORT)
+            config.XUNIT_REPORT = '{}.shard{}{}'.format(path, config.SHARD_INDEX, ext)
+
 
 def get_config_path_by_env(env_name, default=None, base_path=None):
     config_path = os.getenv(env_name, default)
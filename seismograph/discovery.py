@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+
+"""
+Cache of suite discovery.
+It is using for skip of modules while loading of suites from path.
+
+Suites of module are recorded by path, mtime and size of file.
+Module is imported again if file was changed only. Modules without
+suites are not imported at all and modules without requested
+suites are not imported for run by "-t" option.
+
+Sources of modules can be scanned before import for run by "-t" option.
+Suites are found by calls of classes which names are ending by "Suite"
+and module is imported if name of suite is requested or it is not literal.
+Module is imported too if suites of it can not be known by source:
+it does not create suites, it imports names from other modules
+(except of seismograph) or it registers cases on suite of other module.
+"""
+
+import os
+import ast
+import json
+import logging
+
+from . import loader
+from .utils import pyv
+from .collector import get_suite_name_from_command
+
+
+logger = logging.getLogger(__name__)
+
+
+# Min num of modules to scan them in pool of processes
+SCAN_POOL_THRESHOLD = 256
+
+
+def get_cache(config):
+    if config.DISCOVERY_CACHE:
+        return DiscoveryCache(config.DISCOVERY_CACHE)
+    return None
+
+
+def get_suite_names(config):
+    """
+    Names of suites which are required for run or None for all of them
+    """
+    if config.TESTS:
+        return set(get_suite_name_from_command(c) for c in config.TESTS)
+    return None
+
+
+def is_suite_call(node, class_names=()):
+    if isinstance(node.func, ast.Name):
+        name = node.func.id
+    elif isinstance(node.func, ast.Attribute):
+        name = node.func.attr
+    else:
+        return False
+
+    return name.endswith('Suite') or name in class_names
+
+
+def get_string_of_node(node, module_name):
+    if isinstance(node, ast.Name) and node.id == '__name__':
+        return module_name
+
+    if node.__class__.__name__ == 'Str':
+        return node.s
+
+    if node.__class__.__name__ == 'Constant' and isinstance(node.value, pyv.basestring):
+        return node.value
+
+    return None
+
+
+def get_suite_name_of_call(node, module_name):
+    if node.args:
+        return get_string_of_node(node.args[0], module_name)
+
+    for keyword in node.keywords:
+        if keyword.arg == 'name':
+            return get_string_of_node(keyword.value, module_name)
+
+    return None
+
+
+def is_import_of_names(node):
+    """
+    Names imported from other module can be suites
+    """
+    if not isinstance(node, ast.ImportFrom):
+        return False
+
+    if node.level == 0 and node.module and node.module.split('.')[0] == 'seismograph':
+        return False
+
+    return True
+
+
+def get_suite_variables(tree, class_names=()):
+    variables = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) \
+                and isinstance(node.value, ast.Call) \
+                and is_suite_call(node.value, class_names):
+            variables.update(t.id for t in node.targets if isinstance(t, ast.Name))
+
+    return variables
+
+
+def is_register_on_other_suite(node, variables):
+    """
+    Cases can be registered on suite of other module
+    """
+    if isinstance(node, ast.Attribute) and node.attr == 'register':
+        return not isinstance(node.value, ast.Name) or node.value.id not in variables
+    return False
+
+
+def parse_module(file_path):
+    try:
+        with open(file_path, 'rb') as fp:
+            return ast.parse(fp.read(), file_path)
+    except (IOError, OSError, SyntaxError, ValueError):
+        # error will be raised on import
+        return None
+
+
+def registers_on_other_suites(file_path):
+    tree = parse_module(file_path)
+
+    if tree is None:
+        return True
+
+    variables = get_suite_variables(tree)
+
+    return any(is_register_on_other_suite(node, variables) for node in ast.walk(tree))
+
+
+def scan_module(args):
+    """
+    Set of suite names which are created in source of module.
+    None is returned if suites of module are unknown before import.
+    """
+    file_path, module_name, class_names = args
+    tree = parse_module(file_path)
+
+    if tree is None:
+        return None
+
+    names = set()
+    variables = get_suite_variables(tree, class_names)
+
+    for node in ast.walk(tree):
+        if is_import_of_names(node):
+            return None
+
+        if is_register_on_other_suite(node, variables):
+            return None
+
+        if isinstance(node, ast.Call) and is_suite_call(node, class_names):
+            name = get_suite_name_of_call(node, module_name)
+
+            if name is None:
+                return None
+
+            names.add(name)
+
+    return names or None
+
+
+def scan_modules(modules, class_names=(), processes=None):
+    """
+    :param modules: pairs of path to file and name of module
+    :return: dict of suite names by absolute path to file
+    """
+    tasks = [
+        (os.path.abspath(file_path), module_name, tuple(class_names))
+        for file_path, module_name in modules
+    ]
+
+    logger.debug(
+        'Scan sources of {} modules'.format(len(tasks)),
+    )
+
+    if len(tasks) < SCAN_POOL_THRESHOLD:
+        results = [scan_module(task) for task in tasks]
+    else:
+        from multiprocessing import Pool
+
+        pool = Pool(processes)
+
+        try:
+            results = pool.map(scan_module, tasks, chunksize=max(1, SCAN_POOL_THRESHOLD // 4))
+        finally:
+            pool.close()
+            pool.join()
+
+    return dict((task[0], names) for task, names in zip(tasks, results))
+
+
+def prescan(path, suite_class, recursive=True, cache=None):
+    """
+    Scan modules of path which are not known by discovery cache
+    """
+    modules = loader.iter_module_files(path, recursive=recursive)
+
+    if cache is not None:
+        modules = [(f, m) for f, m in modules if cache.get(f) is None]
+
+    return scan_modules(modules, class_names=(suite_class.__name__, ))
+
+
+def stat_of_file(file_path):
+    stat = os.stat(file_path)
+    return stat.st_mtime, stat.st_size
+
+
+class DiscoveryCache(object):
+    """
+    Suites of modules by path to file:
+
+        {"/path/to/suites/module.py": {"mtime": 1500000000.0, "size": 100, "suites": {"attribute": "suite_name"}, "registers": false}}
+
+    Module without suites is imported anyway if it registers cases
+    on suite of other module. Cache is shared by all loads of program,
+    entries are dropped for removed modules of loaded paths only.
+    """
+
+    def __init__(self, path):
+        self.__path = path
+        self.__modules = {}
+        self.__seen = set()
+        self.__roots = set()
+        self.__is_changed = False
+
+        if os.path.isfile(path):
+            self.load()
+
+    def __len__(self):
+        return len(self.__modules)
+
+    def __contains__(self, file_path):
+        return os.path.abspath(file_path) in self.__modules
+
+    @property
+    def path(self):
+        return self.__path
+
+    @property
+    def is_changed(self):
+        return self.__is_changed or bool(self.__get_stale())
+
+    def __get_stale(self):
+        """
+        Modules of loaded paths which were not seen
+        """
+        return set(
+            file_path for file_path in self.__modules
+            if file_path not in self.__seen
+            and any(self.__is_under(file_path, root, recursive) for root, recursive in self.__roots)
+        )
+
+    @staticmethod
+    def __is_under(file_path, root, recursive):
+        if recursive:
+            return file_path.startswith(root)
+        return os.path.join(os.path.dirname(file_path), '') == root
+
+    def add_root(self, path, recursive=True):
+        """
+        Path which is loaded with the cache
+        """
+        self.__roots.add((os.path.join(os.path.abspath(path), ''), recursive))
+
+    def load(self):
+        logger.debug(
+            'Load discovery cache from "{}"'.format(self.__path),
+        )
+
+        try:
+            with open(self.__path) as fp:
+                self.__modules = json.load(fp)
+        except ValueError:
+            logger.debug(
+                'Discovery cache "{}" is broken and will be rebuilt'.format(self.__path),
+            )
+            self.__modules = {}
+
+    def save(self):
+        """
+        Modules of loaded paths which were not seen while loading are dropped
+        """
+        logger.debug(
+            'Save discovery cache to "{}"'.format(self.__path),
+        )
+
+        stale = self.__get_stale()
+        modules = dict(
+            (file_path, entry)
+            for file_path, entry in self.__modules.items()
+            if file_path not in stale
+        )
+        tmp_path = '{}.tmp'.format(self.__path)
+
+        with open(tmp_path, 'w') as fp:
+            json.dump(modules, fp, indent=1, sort_keys=True)
+
+        os.rename(tmp_path, self.__path)
+
+        self.__modules = modules
+        self.__is_changed = False
+
+    def __get_entry(self, file_path):
+        file_path = os.path.abspath(file_path)
+        self.__seen.add(file_path)
+
+        entry = self.__modules.get(file_path)
+
+        if entry is None:
+            return None
+
+        mtime, size = stat_of_file(file_path)
+
+        if entry['mtime'] != mtime or entry['size'] != size:
+            return None
+
+        return entry
+
+    def get(self, file_path):
+        """
+        Dict of suites by attribute name or None if file was changed
+        """
+        entry = self.__get_entry(file_path)
+        return entry['suites'] if entry is not None else None
+
+    def should_load(self, file_path, suite_names=None):
+        entry = self.__get_entry(file_path)
+
+        if entry is None or entry.get('registers', True):
+            return True
+
+        suites = entry['suites']
+
+        if not suites:
+            return False
+
+        if suite_names is None:
+            return True
+
+        return any(name in suite_names for name in suites.values())
+
+    def update(self, file_path, suites):
+        """
+        :param suites: dict of suites by attribute name
+        """
+        file_path = os.path.abspath(file_path)
+        mtime, size = stat_of_file(file_path)
+        names = dict((attribute, suite.name) for attribute, suite in suites.items())
+        entry = self.__modules.get(file_path)
+
+        self.__seen.add(file_path)
+
+        if entry and entry['mtime'] == mtime and entry['size'] == size \
+                and entry['suites'] == names and 'registers' in entry:
+            return
+
+        self.__modules[file_path] = {
+            'mtime': mtime,
+            'size': size,
+            'suites': names,
+            'registers': registers_on_other_suites(file_path),
+        }
+        self.__is_changed = True
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+"""
+Events of run as JSON lines for external tools.
+One line is written for each event:
+
+    {"class_name":"suite.Case","event":"success","method_name":"test","runtime":0.1,"time":1500000000.0,"worker":1234}
+
+Events: begin, suite_start, case_start, success, fail, error, skip, suite_stop, final.
+Worker is id of process which did run test.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+# Interval in seconds to write buffered events
+FLUSH_INTERVAL = 0.5
+# Max size of one write. Lines of one write are not mixed
+# with lines of other processes which are writing to the same pipe
+WRITE_SIZE = 4096
+
+# flush before events which can be followed by a long wait
+FLUSH_ON_EVENTS = ('begin', 'suite_start', 'suite_stop', 'final')
+
+
+writer = None
+
+
+def open_writer(config):
+    global writer
+
+    if config.EVENTS_FILE:
+        fd = os.open(
+            config.EVENTS_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND,
+        )
+        writer = EventWriter(fd, close_fd=True)
+    elif config.EVENTS_FD is not None:
+        writer = EventWriter(config.EVENTS_FD)
+
+    return writer
+
+
+def close_writer():
+    global writer
+
+    if writer is not None:
+        writer.close()
+
+    writer = None
+
+
+def emit(event, **data):
+    if writer is not None:
+        writer.emit(event, **data)
+
+
+class EventWriter(object):
+    """
+    Lines are buffered and written by chunks on events of suite start
+    or by own thread after flush interval, so events are coming while run
+    and result of test is written during long teardown too.
+    Worker of multiprocessing group does not write events of main process,
+    buffer is dropped after fork.
+    """
+
+    def __init__(self, fd, close_fd=False):
+        self.__fd = fd
+        self.__close_fd = close_fd
+
+        self.__reset()
+
+    def __reset(self):
+        self.__lines = []
+        self.__pid = os.getpid()
+        self.__thread = None
+        self.__is_closed = False
+        self.__first_line_time = None
+        self.__condition = threading.Condition()
+
+    def __start(self):
+        self.__thread = threading.Thread(target=self.__work)
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def __work(self):
+        with self.__condition:
+            while not self.__is_closed:
+                if not self.__lines:
+                    self.__condition.wait()
+                    continue
+
+                timeout = self.__first_line_time + FLUSH_INTERVAL - time.time()
+
+                if timeout > 0:
+                    self.__condition.wait(timeout)
+                else:
+                    self.__flush()
+
+    def __flush(self):
+        chunk = []
+        chunk_size = 0
+
+        for line in self.__lines:
+            if chunk and chunk_size + len(line) > WRITE_SIZE:
+                os.write(self.__fd, b''.join(chunk))
+                chunk, chunk_size = [], 0
+
+            chunk.append(line)
+            chunk_size += len(line)
+
+        if chunk:
+            os.write(self.__fd, b''.join(chunk))
+
+        self.__lines = []
+
+    def emit(self, event, **data):
+        data.update(
+            event=event,
+            time=round(time.time(), 3),
+            worker=os.getpid(),
+        )
+        line = json.dumps(data, separators=(',', ':'), sort_keys=True) + '\n'
+
+        if not isinstance(line, bytes):
+            line = line.encode('utf-8')
+
+        if self.__pid != os.getpid():
+            self.__reset()
+
+        with self.__condition:
+            if self.__thread is None:
+                self.__start()
+
+            if not self.__lines:
+                self.__first_line_time = time.time()
+                self.__condition.notify()
+
+            self.__lines.append(line)
+
+            if event in FLUSH_ON_EVENTS:
+                self.__flush()
+
+    def flush(self):
+        with self.__condition:
+            self.__flush()
+
+    def close(self):
+        with self.__condition:
+            if self.__is_closed:
+                return
+
+            self.__is_closed = True
+            self.__condition.notify()
+
+        if self.__thread is not None:
+            self.__thread.join()
+
+        self.flush()
+
+        if self.__close_fd:
+            os.close(self.__fd)
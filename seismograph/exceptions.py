@@ -37,6 +37,17 @@ class TimeoutException(SeismographError):
     pass
 
 
+class CaseTimeout(TimeoutException):
+
+    # can be raised as class without message in thread
+    def __init__(self, message='Timeout of test was exceeded', *args, **kwargs):
+        super(CaseTimeout, self).__init__(message, *args, **kwargs)
+
+
+class WorkerError(SeismographError):
+    pass
+
+
 class ExtensionNotFound(SeismographError):
     pass
 
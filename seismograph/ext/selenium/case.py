@@ -311,11 +311,12 @@ class SeleniumCase(case.Case):
 
             self.page = None
 
-    def __reason__(self):
+    def __reason_data__(self):
+        """
+        Screen is taken when error is added
+        """
         selenium = self.ext(EX_NAME)
-        reasons = [
-            super(SeleniumCase, self).__reason__(),
-        ]
+        reasons = []
 
         try:
             screen_url = selenium.config.get('SCREEN_URL', None)
@@ -347,7 +348,16 @@ class SeleniumCase(case.Case):
         except BaseException as error:
             logger.error(error, exc_info=True)
 
-        return reason.join(reasons)
+        return super(SeleniumCase, self).__reason_data__(), reason.join(reasons)
+
+    @classmethod
+    def __format_reason_data__(cls, data):
+        case_data, selenium_reason = data
+
+        return reason.join(
+            super(SeleniumCase, cls).__format_reason_data__(case_data),
+            selenium_reason,
+        )
 
     def __repeat__(self):
         if self.config.SELENIUM_BROWSERS and self.__repeatable__:
@@ -7,6 +7,11 @@ Combine runnable objects and run their.
 
 from __future__ import absolute_import
 
+import logging
+
+
+logger = logging.getLogger(__name__)
+
 
 def get_pool_size_of_value(value, in_two=False):
     from multiprocessing import cpu_count
@@ -20,3 +25,49 @@ def get_pool_size_of_value(value, in_two=False):
         return int(round(size / 2)) or 2
 
     return size
+
+
+def make_case_group(cases, config):
+    """
+    Group of cases for type of run from config
+    """
+    from ..utils import pyv
+
+    if config.GEVENT:
+        logger.debug(
+            'Use "GeventCaseGroup" to making case group',
+        )
+
+        pyv.check_gevent_supported()
+
+        from .gevent import GeventCaseGroup
+
+        return GeventCaseGroup(cases, config)
+
+    if config.ASYNCIO:
+        logger.debug(
+            'Use "AsyncioCaseGroup" to making case group',
+        )
+
+        pyv.check_asyncio_supported()
+
+        from .asyncio import AsyncioCaseGroup
+
+        return AsyncioCaseGroup(cases, config)
+
+    if config.THREADING or config.MULTIPROCESSING:
+        logger.debug(
+            'Use "ThreadingCaseGroup" to making case group',
+        )
+
+        from .threading import ThreadingCaseGroup
+
+        return ThreadingCaseGroup(cases, config)
+
+    logger.debug(
+        'Use "DefaultCaseGroup" to making case group',
+    )
+
+    from .default import DefaultCaseGroup
+
+    return DefaultCaseGroup(cases, config)
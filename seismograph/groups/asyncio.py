@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+Groups for run on asyncio event loop. Allow for python 3 only.
+
+Suites and cases are running by threading groups, so code of run
+is the same for all groups. Coroutine of test, setup/teardown or
+callback of layer is awaited on one event loop which is running
+in own thread, thread of case is waiting for result of coroutine
+and timeout of case is raised in it.
+"""
+
+from __future__ import absolute_import
+
+import os
+import asyncio
+import logging
+import threading
+from concurrent import futures
+
+from .threading import ThreadingCaseGroup
+from .threading import ThreadingSuiteGroup
+
+
+logger = logging.getLogger(__name__)
+
+
+# exception of timeout is raised in waiting thread between polls
+POLL_INTERVAL = 0.1
+
+
+loop = None
+loop_pid = None
+loop_thread = None
+loop_lock = threading.Lock()
+
+
+async def wrap(awaitable):
+    return await awaitable
+
+
+def get_loop():
+    """
+    Event loop is created once for process.
+    Worker of multiprocessing group is getting own loop after fork.
+    """
+    global loop, loop_pid, loop_thread
+
+    with loop_lock:
+        if loop is None or loop_pid != os.getpid():
+            logger.debug('Start event loop of asyncio groups')
+
+            loop = asyncio.new_event_loop()
+            loop_pid = os.getpid()
+            loop_thread = threading.Thread(target=loop.run_forever)
+            loop_thread.daemon = True
+            loop_thread.start()
+
+        return loop
+
+
+def stop_loop(wait=True):
+    global loop, loop_pid, loop_thread
+
+    with loop_lock:
+        if loop is not None and loop_pid == os.getpid():
+            loop.call_soon_threadsafe(loop.stop)
+
+            if wait:
+                loop_thread.join()
+                loop.close()
+
+        loop = None
+        loop_pid = None
+        loop_thread = None
+
+
+def run_awaitable(awaitable):
+    """
+    Wait for result of awaitable object in current thread.
+    Loop is started on demand for coroutines out of asyncio groups.
+    """
+    future = asyncio.run_coroutine_threadsafe(wrap(awaitable), get_loop())
+
+    try:
+        while not future.done():
+            futures.wait((future,), POLL_INTERVAL)
+
+        return future.result()
+    finally:
+        future.cancel()
+
+
+class AsyncioSuiteGroup(ThreadingSuiteGroup):
+
+    def __run__(self, result):
+        try:
+            super(AsyncioSuiteGroup, self).__run__(result)
+        except BaseException:
+            stop_loop(wait=False)
+            raise
+
+        stop_loop()
+
+
+class AsyncioCaseGroup(ThreadingCaseGroup):
+    """
+    Loop is started by first coroutine of cases
+    """
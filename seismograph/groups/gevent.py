@@ -5,6 +5,7 @@ from __future__ import absolute_import
 from gevent.pool import Pool
 
 from .. import runnable
+from .. import resources
 from ..groups import get_pool_size_of_value
 from ..exceptions import ALLOW_RAISED_EXCEPTIONS
 
@@ -13,6 +14,13 @@ def target(runnable_object, result):
     runnable_object(result)
 
 
+def target_with_resources(limiter, case, result):
+    try:
+        case(result)
+    finally:
+        limiter.release(resources.get_resources(case))
+
+
 class GeventSuiteGroup(runnable.RunnableGroup):
 
     def __run__(self, result):
@@ -45,9 +53,20 @@ class GeventCaseGroup(runnable.RunnableGroup):
             ),
         )
 
+        limiter = resources.get_limiter(self.config)
+
         try:
-            for case in self.objects:
-                pool.spawn(target, case, result)
+            acquired = limiter.iter_acquired(self.objects)
+
+            while True:
+                # resources should not be held while slot of pool is busy
+                pool.wait_available()
+                case = next(acquired, None)
+
+                if case is None:
+                    break
+
+                pool.spawn(target_with_resources, limiter, case, result)
 
             pool.join()
         except ALLOW_RAISED_EXCEPTIONS:
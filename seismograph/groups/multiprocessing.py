@@ -2,29 +2,109 @@
 
 from __future__ import absolute_import
 
+import time
+import marshal
+import threading
+
 from .. import runnable
+from .. import timeouts
+from .. import resources
+from ..utils import pyv
 from ..case import CaseBox
 from ..xunit import XUnitData
-from ..utils.common import waiting_for
+from ..utils.mp import Heartbeat
+from ..utils.mp import SharedMemory
+from ..utils.mp import wait_connections
+from ..exceptions import CaseTimeout
+from ..exceptions import WorkerError
+from ..exceptions import TimeoutException
 from ..groups import get_pool_size_of_value
 
 
-MPProcess = mp_manager = None
+RECORD_BEGIN = 'begin'
+RECORD_END = 'end'
+
+
+MPPipe = MPQueue = MPProcess = mp_memory = None
 
 
 def import_mp():
-    global MPProcess, mp_manager
+    global MPPipe, MPQueue, MPProcess, mp_memory
 
+    from multiprocessing import Pipe
+    from multiprocessing import Queue
     from multiprocessing import Process
-    from multiprocessing import Manager
 
+    MPPipe = Pipe
+    MPQueue = Queue
     MPProcess = Process
-    mp_manager = Manager()
+    mp_memory = SharedMemory()
+
+
+def target(suites, tasks, mp_result, connection, heartbeat, resume=None):
+    mp_result.connect(connection, heartbeat)
+
+    try:
+        # rest of suite of killed worker is run at first
+        if resume is not None:
+            index, done = resume
+            suites[index]._exclude_cases(done)
+            mp_result.run_suite(suites[index])
+
+        while True:
+            index = tasks.get()
+
+            if index is None:
+                break
+
+            mp_result.run_suite(suites[index])
+    finally:
+        mp_result.disconnect()
+
+
+class ResultChannel(object):
+    """
+    Sends records about results from worker to main process.
+
+    Records are packed by marshal and sent through the pipe of the worker
+    before put is returned, so main process is getting results as tests
+    are finished and results are not lost if worker will be killed or exited.
+    Records which were put by other threads while previous batch was sending
+    are sent by one batch.
+    """
 
+    def __init__(self, connection):
+        self.__batch = []
+        self.__lock = threading.Lock()
+        self.__send_lock = threading.Lock()
+        self.__connection = connection
 
-def target(suite, mp_result):
-    suite(mp_result)
-    mp_result.save_result()
+    def send(self, status, runnable_object, xunit_data):
+        self.put(
+            (status, runnable_object.id, xunit_data.to_dict()),
+        )
+
+    def put(self, record):
+        with self.__lock:
+            self.__batch.append(record)
+
+        self.flush()
+
+    def flush(self):
+        # record of thread is sent when it takes lock of sending,
+        # or it was sent already by thread which was holding the lock
+        with self.__send_lock:
+            with self.__lock:
+                batch, self.__batch = self.__batch, []
+
+            if batch:
+                self.__connection.send_bytes(
+                    marshal.dumps(batch),
+                )
+
+    def close(self):
+        self.flush()
+        self.__connection.close()
 
 
 class MPResult(object):
@@ -33,95 +113,289 @@ class MPResult(object):
 
     def __init__(self, result):
         self.result = result
-        self.queue = mp_manager.Queue()
+        self.channel = None
 
-        self.result.support_mp(mp_manager)
+        # results of suites which were stopped by kill of worker
+        # and runtime of them before kill by id of suite
+        self.suspended = {}
+
+        self.result.support_mp(mp_memory)
 
     def __getattr__(self, item):
         return getattr(self.result, item)
 
-    @staticmethod
-    def pack_result_storage(storage):
-        return [
-            (runnable.id, xunit_data.to_marshal())
-            for runnable, xunit_data in storage
-        ]
+    def release(self, suite_id):
+        """
+        Forget suite and its cases in main process
+        after results of the suite were received
+        """
+        suite = self.MATCH.get(suite_id)
+
+        if suite is None or not suite.config.LOW_MEMORY:
+            return
+
+        for case in suite:
+            for c in (case if isinstance(case, CaseBox) else [case]):
+                self.MATCH.pop(c.id, None)
 
-    def unpack_result_storage(self, storage):
-        for runnable_id, xunit_data in storage:
-            yield self.MATCH[runnable_id], XUnitData.from_marshal(xunit_data)
+        suite._release_cases()
 
     def match(self, suite):
         self.MATCH[suite.id] = suite
-        suite.support_mp(mp_manager)
+        suite.support_mp(mp_memory)
 
         for case in suite:
             if isinstance(case, CaseBox):
                 for c in case:
                     self.MATCH[c.id] = c
-                    c.support_mp(mp_manager)
+                    c.support_mp(mp_memory)
             else:
                 self.MATCH[case.id] = case
-                case.support_mp(mp_manager)
-
-    def save_result(self):
-        if self.result.proxies:
-            self.queue.put(
-                (
-                    self.result.proxies[0].name,
-                    self.result.proxies[0].runtime,
-
-                    self.pack_result_storage(
-                        self.result.successes,
-                    ),
-                    self.pack_result_storage(
-                        self.result.skipped,
-                    ),
-                    self.pack_result_storage(
-                        self.result.failures,
-                    ),
-                    self.pack_result_storage(
-                        self.result.errors,
-                    ),
-                ),
-            )
+                case.support_mp(mp_memory)
 
-    def sync(self):
-        while not self.queue.empty():
-            name, runtime, successes, skipped, failures, errors = self.queue.get()
+    #
+    # Worker side
+    #
 
-            result_proxy = self.create_proxy(
-                name=name,
-            )
-            result_proxy.runtime = runtime
+    def connect(self, connection, heartbeat):
+        self.channel = ResultChannel(connection)
+        self.result.channel = self.channel
+
+        # replacement of worker is forked from main process
+        # which has proxies of suites were received already
+        del self.result.proxies[:]
+
+        timeouts.watcher = timeouts.ThreadWatcher(heartbeat=heartbeat)
+
+    def disconnect(self):
+        self.result.channel = None
+        self.channel.close()
+
+    def run_suite(self, suite):
+        # main process should know suite of worker
+        # even if worker will be exited before flush of results
+        self.channel.put((RECORD_BEGIN, suite.id))
+
+        suite(self)
+
+        # worker is living for many suites,
+        # so proxy of suite should not be sent twice
+        runtime = None
+        while self.result.proxies:
+            runtime = self.result.proxies.pop().runtime
+
+        self.channel.put((RECORD_END, suite.id, runtime))
+
+    #
+    # Main process side
+    #
+
+    def receive(self, worker, records):
+        for record in records:
+            status = record[0]
 
-            result_proxy.errors.extend(
-                self.unpack_result_storage(errors),
+            if status == RECORD_BEGIN:
+                _, suite_id = record
+
+                if suite_id in self.suspended:
+                    worker.result_proxy, worker.suite_runtime = self.suspended.pop(suite_id)
+                else:
+                    worker.result_proxy = self.create_proxy(
+                        name=runnable.class_name(self.MATCH[suite_id]),
+                    )
+                    worker.suite_runtime = float()
+
+                worker.suite_id = suite_id
+                worker.suite_started = time.time()
+            elif status == RECORD_END:
+                _, suite_id, runtime = record
+
+                if runtime is not None:
+                    worker.result_proxy.runtime = worker.suite_runtime + runtime
+                    self.result.proxies.append(worker.result_proxy)
+                    self.result.write_to_report(worker.result_proxy)
+
+                worker.result_proxy = None
+                self.release(suite_id)
+            else:
+                _, runnable_id, xunit_data = record
+
+                item = (
+                    self.MATCH[runnable_id], XUnitData.from_dict(xunit_data),
+                )
+
+                getattr(worker.result_proxy, status).append(item)
+                getattr(self.result, status).append(item)
+
+    def get_done(self, worker):
+        """
+        Ids of cases which have result in proxy of worker
+        """
+        return set(
+            runnable_object.id
+            for storage in (
+                worker.result_proxy.errors,
+                worker.result_proxy.skipped,
+                worker.result_proxy.failures,
+                worker.result_proxy.successes,
             )
-            result_proxy.successes.extend(
-                self.unpack_result_storage(successes),
+            for runnable_object, _ in storage
+        )
+
+    def get_not_run(self, worker):
+        done = self.get_done(worker)
+        suite = self.MATCH.get(worker.suite_id)
+
+        return [
+            c
+            for case in (suite or [])
+            for c in (case if isinstance(case, CaseBox) else [case])
+            if c.id not in done
+        ]
+
+    def skip_not_run(self, worker, reason):
+        for case in self.get_not_run(worker):
+            worker.result_proxy.add_skip(
+                case, reason, float(),
             )
-            result_proxy.skipped.extend(
-                self.unpack_result_storage(skipped),
+            self.result.skipped.append(worker.result_proxy.skipped[-1])
+
+    def kill(self, worker, running):
+        """
+        Record errors for tests which were exceeded timeout in killed worker.
+        Result of suite is suspended if other tests of suite were not run,
+        ids of done cases are returned to run the rest of suite by replacement
+        of worker. Otherwise result of suite is closed and None is returned.
+        """
+        now = time.time()
+        is_begun = worker.result_proxy is not None
+
+        for runnable_id, started, deadline in running:
+            case = self.MATCH.get(runnable_id)
+
+            if case is None:
+                continue
+
+            resources.limiter.release(resources.get_resources(case))
+
+            # other tests which were running in worker are run again
+            if deadline > now and is_begun:
+                continue
+
+            # begin of suite was not sent by worker
+            if worker.result_proxy is None:
+                worker.result_proxy = self.create_proxy(
+                    name=case.__mount_data__.suite_name,
+                )
+                worker.suite_started = started
+                worker.suite_runtime = float()
+
+            if deadline <= now:
+                message = 'Timeout of test was exceeded, worker process was killed'
+            else:
+                message = 'Worker process was killed on timeout of other test'
+
+            worker.result_proxy.add_error(
+                case,
+                '{}: {}\n'.format(CaseTimeout.__name__, message),
+                now - started,
+                CaseTimeout(message),
             )
-            result_proxy.failures.extend(
-                self.unpack_result_storage(failures),
+            self.result.errors.append(worker.result_proxy.errors[-1])
+
+        if worker.result_proxy is None:
+            return None
+
+        if is_begun and self.get_not_run(worker):
+            self.suspended[worker.suite_id] = (
+                worker.result_proxy,
+                worker.suite_runtime + now - worker.suite_started,
             )
+            done = self.get_done(worker)
+            worker.result_proxy = None
+
+            return done
+
+        self.close_suite(
+            worker, 'Not run, worker process was killed on timeout', now,
+        )
+        return None
+
+    def lose(self, worker):
+        """
+        Record error of suite which was running in worker
+        when it was exited unexpectedly. Result of suite is closed.
+        """
+        if worker.result_proxy is None:
+            return
+
+        now = time.time()
+        message = 'Worker process was exited with code "{}" while run of suite'.format(
+            worker.process.exitcode,
+        )
+
+        worker.result_proxy.add_error(
+            self.MATCH.get(worker.suite_id),
+            '{}: {}\n'.format(WorkerError.__name__, message),
+            now - worker.suite_started,
+            WorkerError(message),
+        )
+        self.result.errors.append(worker.result_proxy.errors[-1])
+
+        self.close_suite(
+            worker, 'Not run, worker process was exited', now,
+        )
+
+    def close_suite(self, worker, reason, now):
+        self.skip_not_run(worker, reason)
 
-            self.result.extend(result_proxy)
-            self.result.proxies.append(result_proxy)
+        worker.result_proxy.runtime = worker.suite_runtime + now - worker.suite_started
+        self.result.proxies.append(worker.result_proxy)
+        self.result.write_to_report(worker.result_proxy)
+        worker.result_proxy = None
+
+        self.release(worker.suite_id)
+
+
+class Worker(object):
+
+    def __init__(self, process, connection, heartbeat):
+        self.process = process
+        self.heartbeat = heartbeat
+        self.connection = connection
+
+        self.suite_id = None
+        self.result_proxy = None
+        self.suite_started = None
+        # runtime of suite in killed workers before
+        self.suite_runtime = float()
 
 
 class Multiprocessing(object):
+    """
+    Pool of long-lived worker processes.
+
+    Each worker takes index of the next suite from shared queue of tasks
+    as soon as it is free, so a count of forks is depending on size of pool only.
+    """
 
     def __init__(self, result, config, suites=None):
-        self.queue = []
-        self.stack = []
+        self.suites = []
+        self.indexes = {}
+        self.workers = []
+        self.tasks = MPQueue()
 
         self.mp_result = MPResult(result)
         self.release_timeout = config.MULTIPROCESSING_TIMEOUT
+        self.last_received = None
         self.max_processes = get_pool_size_of_value(config.ASYNC_SUITES)
 
+        # max num of tests which are running in worker at a time
+        self.heartbeat_size = max(
+            get_pool_size_of_value(config.ASYNC_SUITES),
+            get_pool_size_of_value(config.ASYNC_TESTS, in_two=True),
+        )
+
         if suites:
             self.add_suites(suites)
 
@@ -131,57 +405,159 @@ class Multiprocessing(object):
     def __exit__(self, *args, **kwargs):
         self.terminate_all()
         self.join_all()
-        self.mp_result.sync()
 
     def add_suite(self, suite):
         self.mp_result.match(suite)
-
-        self.queue.append(
-            MPProcess(
-                target=target,
-                args=(suite, self.mp_result),
-            ),
-        )
+        self.indexes[suite.id] = len(self.suites)
+        self.suites.append(suite)
 
     def add_suites(self, suites):
         for suite in suites:
             self.add_suite(suite)
 
-    def try_release(self):
-        for process in self.stack[::-1]:
-            if not process.is_alive():
-                process.join(timeout=self.release_timeout)
-                self.stack.remove(process)
-
-    def is_release(self):
-        self.try_release()
-        return len(self.stack) < self.max_processes
-
-    def wait_release(self):
-        waiting_for(
-            self.is_release,
-            timeout=self.release_timeout,
-            message='Process list have not been release for "{}" sec.'.format(
-                self.release_timeout,
-            )
+    def start_worker(self, resume=None):
+        # replacement of worker is forked when feeder thread
+        # of queue is running already. It is safe because worker
+        # is getting tasks only: state of feeder is reset in child
+        # after fork and lock of reading is shared between processes
+        reader, writer = MPPipe(duplex=False)
+        heartbeat = Heartbeat(self.heartbeat_size)
+
+        process = MPProcess(
+            target=target,
+            args=(self.suites, self.tasks, self.mp_result, writer, heartbeat, resume),
+        )
+        process.start()
+
+        # main process should not hold end of pipe for writing,
+        # otherwise we will not get EOF when worker is done
+        writer.close()
+
+        self.workers.append(
+            Worker(process, reader, heartbeat),
         )
 
     def join_all(self):
-        for process in self.stack:
-            process.join(timeout=self.release_timeout)
+        for worker in self.workers:
+            worker.process.join(timeout=self.release_timeout)
 
     def terminate_all(self):
-        for process in self.stack:
-            process.terminate()
+        for worker in self.workers:
+            if worker.process.is_alive():
+                worker.process.terminate()
+
+    def read(self, worker):
+        """
+        Return False if worker is done
+        """
+        try:
+            records = marshal.loads(worker.connection.recv_bytes())
+        except EOFError:
+            worker.connection.close()
+            worker.process.join(timeout=self.release_timeout)
+            self.workers.remove(worker)
+
+            # suite is not ended if worker was exited unexpectedly
+            self.mp_result.lose(worker)
+
+            # worker is exited with zero code after stop signal only
+            if worker.process.exitcode:
+                # new worker takes task or stop signal
+                # which were not taken by exited worker
+                self.start_worker()
+
+            return False
+
+        self.mp_result.receive(worker, records)
+        return True
+
+    def kill_worker(self, worker):
+        running = worker.heartbeat.running()
+
+        # results which were sent before kill
+        while worker.connection.poll():
+            if not self.read(worker):
+                return
+
+        worker.process.terminate()
+        worker.process.join(timeout=self.release_timeout)
+        worker.connection.close()
+        self.workers.remove(worker)
+
+        done = self.mp_result.kill(worker, running)
+
+        # new worker runs the rest of suite, then it takes task
+        # or stop signal which were not taken by killed worker.
+        # The rest of suite is not put to queue of tasks because
+        # stop signals can be in front of it.
+        if done is not None:
+            self.start_worker(
+                resume=(self.indexes[worker.suite_id], done),
+            )
+        else:
+            self.start_worker()
+
+    def kill_hanging_workers(self):
+        now = time.time()
+
+        for worker in list(self.workers):
+            next_deadline = worker.heartbeat.next_deadline()
+
+            if next_deadline is not None and next_deadline <= now:
+                self.kill_worker(worker)
+
+    def receive(self):
+        started = time.time()
+
+        # deadline of test which was begun in worker while waiting
+        # is not known, so it is checked after "KILL_DELAY" at most
+        timeout = min(self.release_timeout, timeouts.KILL_DELAY)
+
+        deadlines = [
+            d for d in (w.heartbeat.next_deadline() for w in self.workers) if d is not None
+        ]
+
+        if deadlines:
+            timeout = max(min(timeout, min(deadlines) - started), 0)
+
+        connections = wait_connections(
+            [w.connection for w in self.workers],
+            timeout=timeout,
+        )
+
+        self.kill_hanging_workers()
+
+        if connections:
+            self.last_received = time.time()
+        elif time.time() - self.last_received >= self.release_timeout:
+            raise TimeoutException(
+                'Workers have not sent results for "{}" sec.'.format(
+                    self.release_timeout,
+                ),
+            )
+
+        for worker in [w for w in self.workers if w.connection in connections]:
+            self.read(worker)
 
     def serve(self):
-        while self.queue:
-            process = self.queue.pop()
-            process.start()
-            self.stack.append(process)
-            self.wait_release()
+        num_workers = min(self.max_processes, len(self.suites))
 
-        self.join_all()
+        # workers are forked before the first "put"
+        # because queue is starting feeder thread on it,
+        # see "start_worker" about replacement of worker
+        for _ in pyv.xrange(num_workers):
+            self.start_worker()
+
+        for index in pyv.xrange(len(self.suites)):
+            self.tasks.put(index)
+
+        for _ in pyv.xrange(num_workers):
+            self.tasks.put(None)
+
+        self.last_received = time.time()
+
+        while self.workers:
+            self.receive()
 
 
 class MultiprocessingSuiteGroup(runnable.RunnableGroup):
@@ -191,5 +567,8 @@ class MultiprocessingSuiteGroup(runnable.RunnableGroup):
 
         import_mp()
 
-        with Multiprocessing(result, self.config, suites=self.objects) as mp:
+        suites = list(self.objects)
+        resources.support_mp(self.config, suites)
+
+        with Multiprocessing(result, self.config, suites=suites) as mp:
             mp.serve()
@@ -2,52 +2,272 @@
 
 from __future__ import absolute_import
 
-from multiprocessing.pool import ThreadPool
+import os
+import logging
+import threading
+from functools import partial
+from collections import deque
 
 from .. import runnable
+from .. import resources
+from ..utils import pyv
 from ..groups import get_pool_size_of_value
 from ..exceptions import ALLOW_RAISED_EXCEPTIONS
 
 
+logger = logging.getLogger(__name__)
+
+
+executor = None
+
+
 def target(runnable_object, result):
     runnable_object(result)
 
 
-class ThreadingSuiteGroup(runnable.RunnableGroup):
+def get_executor(config):
+    """
+    Executor is created once for process.
+    Worker of multiprocessing group is getting own executor after fork.
+    """
+    global executor
+
+    if executor is None or executor.pid != os.getpid():
+        executor = SharedExecutor(
+            max(
+                get_pool_size_of_value(config.ASYNC_SUITES),
+                get_pool_size_of_value(config.ASYNC_TESTS, in_two=True),
+            ),
+            limiter=resources.get_limiter(config),
+        )
+        executor.start()
+
+    return executor
+
+
+def stop_executor(wait=True):
+    global executor
+
+    if executor is not None and executor.pid == os.getpid():
+        executor.stop(wait=wait)
+
+    executor = None
+
+
+class Task(object):
+
+    def __init__(self, func, resources=None):
+        self.func = func
+        self.resources = resources
+
+    def __call__(self):
+        return self.func()
 
-    def __run__(self, result):
-        self._is_run = True
 
-        pool = ThreadPool(
-            get_pool_size_of_value(self.config.ASYNC_SUITES),
+class TaskGroup(object):
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.running = 0
+        self.error = None
+        self.tasks = deque()
+
+    @property
+    def is_done(self):
+        return not self.tasks and not self.running
+
+    def take(self, limiter=None):
+        """
+        Take first task which resources are free
+        """
+        if self.running >= self.limit:
+            return None
+
+        for task in self.tasks:
+            if limiter is None or limiter.try_acquire(getattr(task, 'resources', None)):
+                self.tasks.remove(task)
+                self.running += 1
+                return task
+
+        return None
+
+
+class SharedExecutor(object):
+    """
+    One bounded pool of threads for all threading groups of program.
+
+    Groups are submitting tasks to own queue and tasks are taken
+    from queues by round robin, so one suite can not take all of threads.
+    Thread of pool which is waiting for group is running tasks
+    of the group itself, so nested groups are not locking the pool.
+    Task which resources are held by others is skipped until release.
+    """
+
+    def __init__(self, size, limiter=None):
+        self.__size = size
+        self.__limiter = limiter
+        self.__pid = os.getpid()
+
+        self.__threads = []
+        self.__groups = deque()
+        self.__is_stopped = False
+
+        self.__local = threading.local()
+        self.__condition = threading.Condition()
+
+    @property
+    def pid(self):
+        return self.__pid
+
+    @property
+    def size(self):
+        return self.__size
+
+    def start(self):
+        logger.debug(
+            'Start shared executor with "{}" threads'.format(self.__size),
         )
 
+        for _ in pyv.xrange(self.__size):
+            thread = threading.Thread(target=self.__work)
+            thread.daemon = True
+            thread.start()
+            self.__threads.append(thread)
+
+    def stop(self, wait=True):
+        """
+        Threads are daemons, so they should not be joined
+        on emergency stop while tasks are running
+        """
+        with self.__condition:
+            self.__is_stopped = True
+            self.__condition.notify_all()
+
+        if wait:
+            for thread in self.__threads:
+                thread.join()
+
+        self.__threads = []
+
+    def run(self, tasks, limit=None):
+        """
+        Run tasks and wait for them.
+        First exception of tasks is raised after all of them were done.
+        """
+        group = TaskGroup(limit or self.__size)
+        group.tasks.extend(tasks)
+
+        with self.__condition:
+            self.__groups.append(group)
+            self.__condition.notify_all()
+
+        try:
+            self.__wait(group)
+        finally:
+            with self.__condition:
+                group.tasks.clear()
+                self.__groups.remove(group)
+
+        if group.error is not None:
+            raise group.error
+
+    def __take(self):
+        for _ in pyv.xrange(len(self.__groups)):
+            group = self.__groups[0]
+            self.__groups.rotate(-1)
+
+            task = group.take(self.__limiter)
+
+            if task is not None:
+                return group, task
+
+        return None, None
+
+    def __sleep(self):
+        # resources can be released by other process without notify,
+        # so waiting is limited while there are not taken tasks
+        if self.__limiter is not None and any(g.tasks for g in self.__groups):
+            self.__condition.wait(resources.POLL_INTERVAL)
+        else:
+            self.__condition.wait()
+
+    def __execute(self, group, task):
         try:
-            for suite in self.objects:
-                pool.apply_async(target, args=(suite, result))
+            task()
+        except BaseException as error:
+            with self.__condition:
+                if group.error is None:
+                    group.error = error
+
+                if isinstance(error, ALLOW_RAISED_EXCEPTIONS):
+                    group.tasks.clear()
+        finally:
+            if self.__limiter is not None:
+                self.__limiter.release(getattr(task, 'resources', None))
+
+            with self.__condition:
+                group.running -= 1
+                self.__condition.notify_all()
+
+    def __wait(self, group):
+        is_worker = getattr(self.__local, 'is_worker', False)
+
+        while True:
+            with self.__condition:
+                if group.is_done:
+                    return
+
+                task = group.take(self.__limiter) if is_worker else None
+
+                if task is None:
+                    self.__sleep()
+                    continue
+
+            self.__execute(group, task)
 
-            pool.close()
-            pool.join()
-        except ALLOW_RAISED_EXCEPTIONS:
-            pool.terminate()
+    def __work(self):
+        self.__local.is_worker = True
+
+        while True:
+            with self.__condition:
+                group, task = self.__take()
+
+                while task is None:
+                    if self.__is_stopped:
+                        return
+
+                    self.__sleep()
+                    group, task = self.__take()
+
+            self.__execute(group, task)
+
+
+class ThreadingSuiteGroup(runnable.RunnableGroup):
+
+    def __run__(self, result):
+        self._is_run = True
+
+        try:
+            get_executor(self.config).run(
+                (Task(partial(target, suite, result)) for suite in self.objects),
+                limit=get_pool_size_of_value(self.config.ASYNC_SUITES),
+            )
+        except BaseException:
+            stop_executor(wait=False)
             raise
 
+        stop_executor()
+
 
 class ThreadingCaseGroup(runnable.RunnableGroup):
 
     def __run__(self, result):
         self._is_run = True
 
-        pool = ThreadPool(
-            get_pool_size_of_value(self.config.ASYNC_TESTS, in_two=True),
+        get_executor(self.config).run(
+            (
+                Task(partial(target, case, result), resources=resources.get_resources(case))
+                for case in self.objects
+            ),
+            limit=get_pool_size_of_value(self.config.ASYNC_TESTS, in_two=True),
         )
-
-        try:
-            for case in self.objects:
-                pool.apply_async(target, args=(case, result))
-
-            pool.close()
-            pool.join()
-        except ALLOW_RAISED_EXCEPTIONS:
-            pool.terminate()
-            raise
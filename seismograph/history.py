@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+Runtime history of tests.
+It is using for scheduling the longest suites and cases first.
+"""
+
+import os
+import json
+import logging
+
+from . import runnable
+from .case import Case
+from .case import CaseBox
+from .suite import BuildRule
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_case(runnable_object):
+    if isinstance(runnable_object, runnable.RunnableSnapshot):
+        return runnable_object.case_name is not None
+    return isinstance(runnable_object, Case)
+
+
+def get_rule_of_case(case):
+    if isinstance(case, runnable.RunnableSnapshot):
+        return str(
+            BuildRule(
+                suite_name=case.suite_name,
+                case_name=case.case_name,
+                test_name=case.method_name,
+            ),
+        )
+
+    return str(
+        BuildRule(
+            suite_name=case.__mount_data__.suite_name,
+            case_name=case.__class__.__name__,
+            test_name=runnable.method_name(case),
+        ),
+    )
+
+
+def get_path_to_save(config):
+    """
+    Runtime history is partitioning tests to shards,
+    so shard is not writing it. Runtimes of shard are
+    saved with ".shard<index>" suffix like xunit report.
+    """
+    if config.SHARD_COUNT > 1:
+        path, ext = os.path.splitext(config.RUNTIME_HISTORY)
+        return '{}.shard{}{}'.format(path, config.SHARD_INDEX, ext)
+
+    return config.RUNTIME_HISTORY
+
+
+class RuntimeHistory(object):
+    """
+    Runtimes of tests by string of build rule (suite:case.test).
+    """
+
+    def __init__(self, path):
+        self.__path = path
+        self.__average = None
+        self.__runtimes = {}
+
+        if os.path.isfile(path):
+            self.load()
+
+    def __len__(self):
+        return len(self.__runtimes)
+
+    def __contains__(self, rule):
+        return rule in self.__runtimes
+
+    @property
+    def path(self):
+        return self.__path
+
+    @property
+    def average(self):
+        if self.__average is None:
+            if self.__runtimes:
+                self.__average = sum(self.__runtimes.values()) / len(self.__runtimes)
+            else:
+                self.__average = float()
+
+        return self.__average
+
+    def load(self):
+        logger.debug(
+            'Load runtime history from "{}"'.format(self.__path),
+        )
+
+        try:
+            with open(self.__path) as fp:
+                self.__runtimes = json.load(fp)
+        except ValueError:
+            logger.debug(
+                'Runtime history "{}" is broken and will be rebuilt'.format(self.__path),
+            )
+            self.__runtimes = {}
+
+        self.__average = None
+
+    def save(self):
+        logger.debug(
+            'Save runtime history to "{}"'.format(self.__path),
+        )
+
+        tmp_path = '{}.tmp'.format(self.__path)
+
+        with open(tmp_path, 'w') as fp:
+            json.dump(self.__runtimes, fp, indent=1, sort_keys=True)
+
+        os.rename(tmp_path, self.__path)
+
+    def get(self, rule, default=None):
+        return self.__runtimes.get(rule, default)
+
+    def update(self, result):
+        runtimes = {}
+
+        for storage in (result.successes, result.failures, result.errors):
+            for runnable_object, xunit_data in storage:
+                if is_case(runnable_object):
+                    rule = get_rule_of_case(runnable_object)
+                    runtimes[rule] = runtimes.get(rule, float()) + xunit_data.runtime
+
+        self.__runtimes.update(runtimes)
+        self.__average = None
+
+    def cost(self, case_or_box):
+        """
+        Expected runtime of case or box of cases.
+        Average runtime is used for unknown tests.
+        """
+        if isinstance(case_or_box, CaseBox):
+            return sum(self.cost(case) for case in case_or_box)
+
+        return self.get(get_rule_of_case(case_or_box), self.average)
+
+    def order_cases(self, cases):
+        cases.sort(key=self.cost, reverse=True)
+
+    def cost_of_suite(self, suite):
+        return sum(
+            self.get(str(BuildRule(suite.name, cls.__name__, test_name)), self.average)
+            for cls, test_name in suite.iter_tests()
+        )
+
+    def order_suites(self, suites):
+        suites.sort(key=self.cost_of_suite, reverse=True)
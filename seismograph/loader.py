@@ -16,6 +16,11 @@ logger = logging.getLogger(__name__)
 TEST_NAME_PREFIX = 'test'
 DEFAULT_TEST_NAME = 'test'
 
+# Attribute of case class with names of tests.
+# It is filled on creation of class and dropped
+# when test method is set to class or deleted from it.
+TEST_NAMES_ATTRIBUTE_NAME = '__test_names__'
+
 
 def check_path_is_exist(path):
     if not os.path.exists(path):
@@ -60,23 +65,50 @@ def load_module(module_name, package=None):
     return module
 
 
+def is_test_name(name, test_name_prefix=None, default_test_name=None):
+    return name.startswith((test_name_prefix or TEST_NAME_PREFIX)) \
+        or \
+        name == (default_test_name or DEFAULT_TEST_NAME)
+
+
+def get_test_names_of_case(cls, test_name_prefix=None, default_test_name=None, attributes=None):
+    """
+    Sorted tuple of test names which is computed once for class.
+    Names are computed again if prefix or default name was changed.
+
+    :param attributes: result of dir for class if it is known already
+    """
+    key = (test_name_prefix or TEST_NAME_PREFIX, default_test_name or DEFAULT_TEST_NAME)
+    table = cls.__dict__.get(TEST_NAMES_ATTRIBUTE_NAME)
+
+    if table is None or table[0] != key:
+        names = tuple(
+            name for name in sorted(dir(cls) if attributes is None else attributes)
+            if is_test_name(name, *key)
+        )
+        table = (key, names)
+        type.__setattr__(cls, TEST_NAMES_ATTRIBUTE_NAME, table)
+
+    return table[1]
+
+
 def load_test_names_from_case(
         cls,
         test_name_prefix=None,
         default_test_name=None):
-    def is_test_name(name):
-        return name.startswith((test_name_prefix or TEST_NAME_PREFIX)) \
-            or \
-            name == (default_test_name or DEFAULT_TEST_NAME)
-
-    for name in sorted(dir(cls)):
-        if is_test_name(name):
-            logger.debug(
-                'Load test "{}" from case "{}.{}"'.format(
-                    name, cls.__module__, cls.__name__,
-                ),
-            )
-            yield name
+    names = get_test_names_of_case(
+        cls,
+        test_name_prefix=test_name_prefix,
+        default_test_name=default_test_name,
+    )
+
+    for name in names:
+        logger.debug(
+            'Load test "{}" from case "{}.{}"'.format(
+                name, cls.__module__, cls.__name__,
+            ),
+        )
+        yield name
 
 
 def load_tests_from_case(
@@ -93,19 +125,19 @@ def load_tests_from_case(
     )
 
     if method_name:
-        for name in filter(lambda n: n == method_name, dir(cls)):
-            case = cls(name, config=config)
-            if box_class:
-                yield box_class((case, ))
-            else:
-                yield case
-            raise StopIteration
-        else:
+        if method_name not in get_test_names_of_case(cls) and not hasattr(cls, method_name):
             raise LoaderError(
                 'Test "{}" not found in "{}"'.format(
                     method_name, cls.__name__,
                 ),
             )
+
+        case = cls(method_name, config=config)
+
+        if box_class:
+            yield box_class((case, ))
+        else:
+            yield case
     else:
         names = load_test_names_from_case(
             cls,
@@ -127,11 +159,30 @@ def load_tests_from_case(
                 yield cls(name, config=config)
 
 
-def load_suite_by_name(name, suites):
+def make_suite_index(suites):
+    """
+    Dict of suites by name, first suite is taken for duplicate name
+    """
+    index = {}
+
+    for suite in suites:
+        index.setdefault(suite.name, suite)
+
+    return index
+
+
+def load_suite_by_name(name, suites, index=None):
+    """
+    :param index: dict of suites by name, list is scanned
+                  for suites which were not indexed only
+    """
     logger.debug(
         'Load suite "{}" from list'.format(name),
     )
 
+    if index is not None and name in index:
+        return index[name]
+
     for suite in filter(lambda s: s.name == name, suites):
         return suite
     else:
@@ -147,13 +198,15 @@ def load_case_from_suite(class_name, suite):
         ),
     )
 
-    for case_cls in filter(lambda c: c.__name__ == class_name, suite.cases):
-        return case_cls
-    else:
+    case_cls = suite.get_case(class_name)
+
+    if case_cls is None:
         raise LoaderError(
             'Test case "{}" not found'.format(class_name),
         )
 
+    return case_cls
+
 
 def load_suites_from_module(module, suite_class):
     logger.debug(
@@ -162,13 +215,73 @@ def load_suites_from_module(module, suite_class):
         ),
     )
 
+    for _, suite in iter_suites_of_module(module, suite_class):
+        yield suite
+
+
+def iter_suites_of_module(module, suite_class, attributes=None):
+    """
+    Yield pairs of attribute name and suite.
+    Known attributes are checked first, module is scanned
+    by dir if some of them is not suite any more.
+    """
+    if attributes is not None:
+        values = [(a, getattr(module, a, None)) for a in attributes]
+
+        if all(isinstance(v, suite_class) for _, v in values):
+            for attribute, value in values:
+                yield attribute, value
+            return
+
     for attribute in dir(module):
         value = getattr(module, attribute, None)
         if isinstance(value, suite_class):
-            yield value
+            yield attribute, value
 
 
-def load_suites_from_path(path_to_dir, suite_class, package=None, recursive=True):
+def iter_module_files(path_to_dir, package=None, recursive=True):
+    """
+    Yield pairs of path to file and name of module
+    in order of loading suites from path
+    """
+    check_path_is_exist(path_to_dir)
+
+    lst_dir = os.listdir(path_to_dir)
+    full_path = lambda *n: os.path.join(path_to_dir, *n)
+
+    for file_name in lst_dir:
+        if is_py_module(file_name):
+            module_name = file_name.replace('.py', '')
+
+            yield full_path(file_name), '{}{}'.format(
+                package + '.' if package else '', module_name,
+            )
+
+    if recursive:
+        packs = (n for n in lst_dir if is_package(full_path(n)))
+
+        for pack in packs:
+
+            for file_path, module_name in iter_module_files(
+                    full_path(pack),
+                    recursive=recursive,
+                    package='{}.{}'.format(package, pack) if package else pack):
+                yield file_path, module_name
+
+
+def load_suites_from_path(path_to_dir,
+                          suite_class,
+                          package=None,
+                          recursive=True,
+                          cache=None,
+                          scan=None,
+                          suite_names=None):
+    """
+    :param cache: discovery cache to skip modules without required suites
+    :param scan: names of suites which can be defined by module
+                 by path to file, None is for unknown names
+    :param suite_names: names of required suites or None for all of them
+    """
     logger.debug(
         'Load suites from path "{}"'.format(path_to_dir),
     )
@@ -181,10 +294,35 @@ def load_suites_from_path(path_to_dir, suite_class, package=None, recursive=True
     modules = (n.replace('.py', '') for n in lst_dir if is_py_module(n))
 
     for module_name in modules:
+        file_path = full_path(module_name + '.py')
+        attributes = None
+
+        if cache is not None:
+            if not cache.should_load(file_path, suite_names):
+                logger.debug(
+                    'Skip module "{}" by discovery cache'.format(file_path),
+                )
+                continue
+
+            attributes = cache.get(file_path)
+
+        if scan is not None and suite_names is not None:
+            names = scan.get(os.path.abspath(file_path))
+
+            if names is not None and not names & suite_names:
+                logger.debug(
+                    'Skip module "{}" by scan of source'.format(file_path),
+                )
+                continue
+
         module = load_module(module_name, package=package)
+        suites = dict(iter_suites_of_module(module, suite_class, attributes=attributes))
+
+        if cache is not None:
+            cache.update(file_path, suites)
 
-        for suite in load_suites_from_module(module, suite_class):
-            yield suite
+        for attribute in sorted(suites):
+            yield suites[attribute]
 
     if recursive:
         packs = (n for n in lst_dir if is_package(full_path(n)))
@@ -195,5 +333,8 @@ def load_suites_from_path(path_to_dir, suite_class, package=None, recursive=True
                     full_path(pack),
                     suite_class,
                     recursive=recursive,
-                    package='{}.{}'.format(package, pack) if package else pack):
+                    package='{}.{}'.format(package, pack) if package else pack,
+                    cache=cache,
+                    scan=scan,
+                    suite_names=suite_names):
                 yield suite
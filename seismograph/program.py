@@ -12,6 +12,8 @@ from . import runnable
 from .utils import pyv
 from . import collector
 from . import extensions
+from . import discovery
+from . import resources
 from .suite import Suite
 from .result import Result
 from .utils.common import measure_time
@@ -212,8 +214,10 @@ class Program(runnable.RunnableObject):
                 'No suites or scripts for execution',
             )
 
+        resources.check(self.__config, self.__suites)
+
         self.__suites = collector.create_generator(
-            self.__suites, self.__config,
+            self.__suites, self.__config, index=self.__suites_by_name,
         )
 
         if self.__config.TREE:
@@ -268,6 +272,8 @@ class Program(runnable.RunnableObject):
 
         self.__suites = []
         self.__scripts = []
+        self.__suites_by_name = {}
+        self.__discovery_cache = None
         self.__exit = exit
         self.__is_run = False
         self.__stream = stream
@@ -385,6 +391,19 @@ class Program(runnable.RunnableObject):
                 self.__suites, self.__config,
             )
 
+        if self.config.ASYNCIO:
+            logger.debug(
+                'Use "AsyncioSuiteGroup" to making suite group',
+            )
+
+            pyv.check_asyncio_supported()
+
+            from .groups.asyncio import AsyncioSuiteGroup
+
+            return AsyncioSuiteGroup(
+                self.__suites, self.__config,
+            )
+
         logger.debug(
             'Use "DefaultSuiteGroup" to making suite group',
         )
@@ -476,6 +495,7 @@ class Program(runnable.RunnableObject):
                 ),
             )
             suite.mount_to(self)
+            self.__suites_by_name.setdefault(suite.name, suite)
 
     def register_suites(self, suites):
         for suite in suites:
@@ -496,14 +516,40 @@ class Program(runnable.RunnableObject):
                 if path not in sys.path:
                     sys.path.append(path)
 
+                scan = None
+
+                # one cache for all loads, otherwise loads are erasing entries of each other
+                if self.__discovery_cache is None:
+                    self.__discovery_cache = discovery.get_cache(self.__config)
+
+                cache = self.__discovery_cache
+                suite_names = discovery.get_suite_names(self.__config)
+
+                if cache is not None:
+                    cache.add_root(path, recursive=self.recursive_load)
+
+                if self.__config.PRESCAN and suite_names:
+                    scan = discovery.prescan(
+                        path,
+                        self.__suite_class__,
+                        recursive=self.recursive_load,
+                        cache=cache,
+                    )
+
                 self.register_suites(
                     loader.load_suites_from_path(
                         path,
                         self.__suite_class__,
                         recursive=self.recursive_load,
+                        cache=cache,
+                        scan=scan,
+                        suite_names=suite_names,
                     ),
                 )
 
+                if cache is not None and cache.is_changed:
+                    cache.save()
+
     def run_scripts(self, result=None, run_point=None):
         if run_point:
             scripts = filter(
@@ -14,14 +14,21 @@ def format_reason_to_output(reason):
 
 class Reason(object):
 
-    def __init__(self, runnable_object, reason, config):
+    def __init__(self, runnable_object, reason, config, with_data=True):
         self.__config = config
-        self.__runnable_object = runnable_object
+        self.__runnable_ref = runnable.RunnableRef(runnable_object)
         self.__reason = pyv.unicode_string(reason)
 
+        # data of object is taken now, it is joined
+        # to string on format only. Snapshot of object has not data.
+        if with_data and getattr(runnable_object, '__create_reason__', False):
+            self.__data, self.__format_data = runnable.reason_data(runnable_object)
+        else:
+            self.__data = self.__format_data = None
+
     @property
     def runnable_object(self):
-        return self.__runnable_object
+        return self.__runnable_ref()
 
     @property
     def reason(self):
@@ -32,9 +39,14 @@ class Reason(object):
         return self.__config
 
     def __format_reason__(self):
-        if self.__runnable_object.__create_reason__:
+        if self.__format_data is not None:
+            formatted_reason = (
+                self.__format_data(self.__data),
+                self.__reason,
+            )
+        elif self.__data is not None:
             formatted_reason = (
-                runnable.reason(self.__runnable_object),
+                self.__data,
                 self.__reason,
             )
         else:
@@ -47,7 +59,7 @@ class Reason(object):
     def __format_reason_to_output__(self):
         tmp = []
 
-        runnable_repr = repr(self.__runnable_object)
+        runnable_repr = repr(self.runnable_object)
         sep_line = ''.join(
             '=' for _ in pyv.xrange(
                 len(runnable_repr),
@@ -62,8 +74,8 @@ class Reason(object):
         return u'\n'.join(tmp)
 
 
-def create(runnable_object, reason, config=None):
-    return Reason(runnable_object, reason, config)
+def create(runnable_object, reason, config=None, with_data=True):
+    return Reason(runnable_object, reason, config, with_data=with_data)
 
 
 def item(name, desc, *args):
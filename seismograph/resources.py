@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+"""
+Limits of resources for concurrent run of cases.
+
+Case declares resources which it is holding while run:
+
+    class MyCase(seismograph.Case):
+        __resources__ = {'db:default': 1, 'selenium': 1}
+
+Resources of suite are applied to each case of the suite.
+Capacities are taken from "RESOURCES" section of config
+or from "--resource" option, undeclared capacity is 1.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+
+from .case import Case
+from .case import CaseBox
+from .exceptions import ConfigError
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CAPACITY = 1
+# Interval in seconds to check resources
+# which can be released from other process
+POLL_INTERVAL = 0.1
+
+
+limiter = None
+
+
+def get_resources(runnable_object):
+    """
+    Dict of resources to hold while run of case or box of cases.
+    Suites and groups are not holding resources,
+    box of parallel methods too, because each case is holding them.
+    """
+    if isinstance(runnable_object, CaseBox):
+        resources = {}
+
+        if runnable_object.is_parallel:
+            return resources
+
+        for case in runnable_object:
+            for name, count in get_resources(case).items():
+                resources[name] = max(resources.get(name, 0), count)
+
+        return resources
+
+    if not isinstance(runnable_object, Case):
+        return {}
+
+    resources = dict(runnable_object.__mount_data__.resources or {})
+    resources.update(runnable_object.__resources__ or {})
+
+    return resources
+
+
+def check(config, suites):
+    """
+    Raise ConfigError if case is requiring more of resource
+    than its capacity. Should be called before run of suites,
+    classes of cases are checked, so lazy suites are not built.
+    """
+    capacities = ResourceLimiter(config.get('RESOURCES'))
+
+    for suite in suites:
+        for case_class in suite.cases:
+            required = dict(suite.resources)
+            required.update(case_class.__resources__ or {})
+
+            for name, count in required.items():
+                if count > capacities.capacity(name):
+                    raise ConfigError(
+                        'resource "{}" has capacity {}, but {} is required by "{}:{}"'.format(
+                            name, capacities.capacity(name), count, suite.name, case_class.__name__,
+                        ),
+                    )
+
+
+def get_limiter(config):
+    global limiter
+
+    if limiter is None:
+        limiter = ResourceLimiter(config.get('RESOURCES'))
+
+    return limiter
+
+
+def support_mp(config, suites):
+    """
+    Replace limiter to shared between processes one.
+    Should be called before fork of processes.
+    """
+    global limiter
+
+    from multiprocessing import Condition
+    from multiprocessing.sharedctypes import RawArray
+
+    names = set((config.get('RESOURCES') or {}).keys())
+
+    for suite in suites:
+        for case in suite:
+            for c in (case if isinstance(case, CaseBox) else [case]):
+                names.update(get_resources(c).keys())
+
+    names = sorted(names)
+    counters = RawArray('i', len(names))
+
+    limiter = ResourceLimiter(
+        config.get('RESOURCES'),
+        condition=Condition(),
+        counters=SharedCounters(names, counters),
+    )
+
+    return limiter
+
+
+class SharedCounters(object):
+    """
+    Mapping of names to int values in shared memory.
+    All names should be known before fork of processes.
+    """
+
+    def __init__(self, names, array):
+        self.__array = array
+        self.__index = dict((name, i) for i, name in enumerate(names))
+
+    def get(self, name, default=None):
+        if name not in self.__index:
+            return default
+        return self.__array[self.__index[name]]
+
+    def __setitem__(self, name, value):
+        self.__array[self.__index[name]] = value
+
+
+class ResourceLimiter(object):
+
+    def __init__(self, capacities=None, condition=None, counters=None):
+        self.__capacities = capacities or {}
+        self.__condition = condition or threading.Condition()
+        self.__used = counters if counters is not None else {}
+
+    def capacity(self, name):
+        return self.__capacities.get(name, DEFAULT_CAPACITY)
+
+    def count_to_hold(self, name, count):
+        """
+        Case which is requiring more than capacity was not checked
+        before run, it is holding whole resource instead of error
+        in thread of pool.
+        """
+        return min(count, self.capacity(name))
+
+    def try_acquire(self, resources):
+        """
+        Take all of resources or nothing.
+        """
+        if not resources:
+            return True
+
+        with self.__condition:
+            for name, count in resources.items():
+                if self.__used.get(name, 0) + self.count_to_hold(name, count) > self.capacity(name):
+                    return False
+
+            for name, count in resources.items():
+                self.__used[name] = self.__used.get(name, 0) + self.count_to_hold(name, count)
+
+        return True
+
+    def acquire(self, resources):
+        with self.__condition:
+            while not self.try_acquire(resources):
+                self.__condition.wait(POLL_INTERVAL)
+
+    def release(self, resources):
+        if not resources:
+            return
+
+        with self.__condition:
+            for name, count in resources.items():
+                self.__used[name] = self.__used.get(name, 0) - self.count_to_hold(name, count)
+
+            self.__condition.notify_all()
+
+    def wait(self, timeout=POLL_INTERVAL):
+        with self.__condition:
+            self.__condition.wait(timeout)
+
+    @contextmanager
+    def hold(self, resources):
+        self.acquire(resources)
+
+        try:
+            yield
+        finally:
+            self.release(resources)
+
+    def iter_acquired(self, objects):
+        """
+        Yield objects as soon as resources of them were acquired.
+        Object is yielded before objects which are waiting for resources.
+        Resources should be released by consumer.
+        """
+        pending = list(objects)
+
+        while pending:
+            for obj in pending:
+                if self.try_acquire(get_resources(obj)):
+                    pending.remove(obj)
+                    yield obj
+                    break
+            else:
+                self.wait()
@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
 
+import os
 import sys
+import weakref
 import logging
+import tempfile
+import threading
 from threading import Lock
+from functools import wraps
+from collections import deque
 from contextlib import contextmanager
 
 from . import xunit
+from . import events
 from . import reason
 from . import runnable
 from .utils import pyv
@@ -13,12 +20,33 @@ from .utils import colors
 from .utils.mp import MPSupportedValue
 
 
+try:
+    from contextvars import ContextVar
+except ImportError:  # python 2
+    ContextVar = None
+
+
 lock = Lock()
+sink = None
 logger = logging.getLogger(__name__)
 
 
 DEFAULT_NAME = 'seismograph'
 
+# captured log of test is spilled to
+# temporary file after this count of bytes
+CAPTURE_MEMORY_LIMIT = 64 * 1024
+# tail of captured log which is attached
+# to result of failed test, bytes
+CAPTURE_OUTPUT_LIMIT = 1024 * 1024
+
+# names of result storages,
+# they are using as statuses of results too
+ERRORS = 'errors'
+SKIPPED = 'skipped'
+FAILURES = 'failures'
+SUCCESSES = 'successes'
+
 
 def get_runnable_from_storage_item(item):
     runnable_object, _ = item
@@ -37,55 +65,588 @@ def get_last_item_from_storage(storage):
 
 
 def get_xunit_data_from_storage(storage, runnable_object):
-    for item in storage:
-        if get_runnable_from_storage_item(item) == runnable_object:
-            return get_xunit_data_from_storage_item(item)
-    return None
+    return storage.get(runnable_object)
 
 
 def reset_item_of_storage(storage, runnable_object, xunit_data):
     assert isinstance(xunit_data, xunit.XUnitData)
 
-    for item in storage:
-        if get_runnable_from_storage_item(item) == runnable_object:
-            storage.remove(item)
-            storage.append((runnable_object, xunit_data))
-            return True
-
-    return False
+    return storage.reset(runnable_object, xunit_data)
 
 
 def get_runtime_from_storage(storage):
-    rt = float()
-    for item in storage:
-        rt += get_xunit_data_from_storage_item(item).runtime
-    return rt
+    return storage.runtime
+
+
+def emit_xunit_data(event, xunit_data, **data):
+    events.emit(
+        event,
+        runtime=xunit_data.runtime,
+        class_name=xunit_data.class_name,
+        method_name=xunit_data.method_name,
+        **data
+    )
+
+
+def is_same_runnable(record, runnable_object):
+    # id of runnable object is unique, but id() of other object
+    # can be given to new one after collection of the first one
+    if isinstance(runnable_object, (runnable.RunnableObject, runnable.RunnableSnapshot)):
+        return True
+    return record.runnable_object is runnable_object
+
+
+class ResultRecord(object):
+    """
+    Item of result storage.
+    Runnable object is referenced weakly, so record does not keep it,
+    snapshot of object is returned after it was collected.
+    Snapshot only is kept by record in low memory mode.
+    Record is unpacked as tuple of runnable object and xunit data,
+    records are equal by id of runnable object and xunit data.
+    """
+
+    __slots__ = (
+        '__xunit_data',
+        '__runnable_id',
+        '__runnable_ref',
+    )
+
+    def __init__(self, runnable_object, xunit_data):
+        self.__xunit_data = xunit_data
+        self.__runnable_ref = runnable.RunnableRef(runnable_object)
+
+        self.__runnable_id = runnable.id_of(runnable_object)
+
+    @classmethod
+    def from_item(cls, item):
+        if isinstance(item, cls):
+            return item
+
+        runnable_object, xunit_data = item
+        return cls(runnable_object, xunit_data)
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+    def __iter__(self):
+        yield self.runnable_object
+        yield self.__xunit_data
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, index):
+        return tuple(self)[index]
+
+    def __eq__(self, other):
+        try:
+            return self.key == self.from_item(other).key
+        except (TypeError, ValueError):
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.key)
+
+    @property
+    def key(self):
+        return self.__runnable_id, id(self.__xunit_data)
+
+    @property
+    def runnable_id(self):
+        return self.__runnable_id
+
+    @property
+    def runnable_object(self):
+        return self.__runnable_ref()
+
+    def compact(self):
+        """
+        Record with snapshot instead of runnable object
+        """
+        # reason should be formatted while object is alive
+        self.__xunit_data.reason
+
+        snapshot = self.__runnable_ref.snapshot
+
+        if not isinstance(snapshot, runnable.RunnableSnapshot):
+            snapshot = runnable.RunnableSnapshot(snapshot)
+        elif snapshot is self.runnable_object:
+            return self
+
+        return self.__class__(snapshot, self.__xunit_data)
+
+    @property
+    def xunit_data(self):
+        return self.__xunit_data
+
+
+class ResultStorage(object):
+    """
+    Ordered log of storage items with index by runnable object.
+    Item of runnable object is found and reset without scan of log.
+    Reset item is marked as removed in log, log is compacted
+    when removed items are more than a half of it.
+    Runtime of items is accumulated while they are added.
+    Items are compacted to snapshots in low memory mode.
+    """
+
+    def __init__(self, items=None, low_memory=False):
+        self.__low_memory = low_memory
+
+        self.__log = []
+        self.__index = {}
+        self.__removed = 0
+        self.__runtime = float()
+        self.__lock = Lock()
+
+        if items:
+            self.extend(items)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __len__(self):
+        return len(self.__log) - self.__removed
+
+    @property
+    def runtime(self):
+        return self.__runtime
+
+    def __bool__(self):
+        return self.__nonzero__()
+
+    def __nonzero__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        for item in self.__log:
+            if item is not None:
+                yield item
+
+    def __getitem__(self, index):
+        with self.__lock:
+            if self.__removed:
+                self.__compact()
+
+            return self.__log[index]
+
+    def __append(self, item):
+        record = ResultRecord.from_item(item)
+        position = len(self.__log)
+
+        if self.__low_memory:
+            record = record.compact()
+
+        # list of positions is created for repeated object only
+        positions = self.__index.get(record.runnable_id)
+
+        if positions is None:
+            self.__index[record.runnable_id] = position
+        elif isinstance(positions, list):
+            positions.append(position)
+        else:
+            self.__index[record.runnable_id] = [positions, position]
+
+        self.__log.append(record)
+
+    def __find(self, runnable_object):
+        positions = self.__index.get(runnable.id_of(runnable_object))
+
+        if positions is None:
+            return None
+
+        if not isinstance(positions, list):
+            positions = [positions]
+
+        for position in positions:
+            if is_same_runnable(self.__log[position], runnable_object):
+                return position
+
+        return None
+
+    def __remove(self, runnable_object, position):
+        key = runnable.id_of(runnable_object)
+        positions = self.__index[key]
+
+        if isinstance(positions, list):
+            positions.remove(position)
+
+            if len(positions) == 1:
+                self.__index[key] = positions[0]
+        else:
+            del self.__index[key]
+
+        self.__log[position] = None
+        self.__removed += 1
+
+    def __compact(self):
+        log = [item for item in self.__log if item is not None]
+
+        self.__log = []
+        self.__index = {}
+        self.__removed = 0
+
+        for item in log:
+            self.__append(item)
+
+    def append(self, item):
+        with self.__lock:
+            self.__append(item)
+            self.__runtime += get_xunit_data_from_storage_item(item).runtime
+
+    def extend(self, items):
+        if isinstance(items, ResultStorage):
+            runtime = items.runtime
+        else:
+            items = list(items)
+            runtime = sum(
+                get_xunit_data_from_storage_item(item).runtime for item in items
+            )
+
+        with self.__lock:
+            for item in items:
+                self.__append(item)
+
+            self.__runtime += runtime
+
+    def get(self, runnable_object):
+        """
+        Get xunit data of first item of runnable object
+        """
+        with self.__lock:
+            position = self.__find(runnable_object)
+
+            if position is not None:
+                return self.__log[position].xunit_data
+
+            return None
+
+    def reset(self, runnable_object, xunit_data):
+        """
+        Replace first item of runnable object with new one
+        which is moving to end of log
+        """
+        with self.__lock:
+            position = self.__find(runnable_object)
+
+            if position is None:
+                return False
+
+            self.__runtime -= self.__log[position].xunit_data.runtime
+            self.__remove(runnable_object, position)
+
+            self.__append((runnable_object, xunit_data))
+            self.__runtime += xunit_data.runtime
+
+            if self.__removed > len(self.__log) // 2:
+                self.__compact()
+
+        return True
+
+
+def get_sink():
+    """
+    Sink is working in process which did create it,
+    worker of multiprocessing group is writing to stream under lock
+    """
+    if sink is not None and sink.pid == os.getpid():
+        return sink
+    return None
+
+
+def start_sink():
+    global sink
+
+    sink = OutputSink()
+    sink.start()
+
+
+def stop_sink():
+    global sink
+
+    output_sink = get_sink()
+    sink = None
+
+    if output_sink is not None:
+        output_sink.stop()
+
+
+class OutputSink(object):
+    """
+    Output of consoles is written to streams by own thread,
+    so tests are not waiting for stream.
+    Data is written in order of put.
+    """
+
+    def __init__(self):
+        self.__pid = os.getpid()
+
+        self.__error = None
+        self.__thread = None
+        self.__queue = deque()
+        self.__is_writing = False
+        self.__is_stopped = False
+        self.__condition = threading.Condition()
+
+    @property
+    def pid(self):
+        return self.__pid
+
+    def start(self):
+        self.__thread = threading.Thread(target=self.__work)
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        self.flush()
+
+        with self.__condition:
+            self.__is_stopped = True
+            self.__condition.notify_all()
+
+        self.__thread.join()
+
+    def put(self, stream, data):
+        with self.__condition:
+            self.__queue.append((stream, data))
+            self.__condition.notify_all()
+
+    def flush(self):
+        """
+        Wait for data which was put before
+        """
+        with self.__condition:
+            while self.__queue or self.__is_writing:
+                self.__condition.wait()
+
+            error, self.__error = self.__error, None
+
+        if error is not None:
+            raise error
+
+    def __write(self, items):
+        streams = []
+
+        # workers of multiprocessing group are writing under lock
+        with lock:
+            for stream, data in items:
+                stream.write(data)
+
+                if stream not in streams:
+                    streams.append(stream)
+
+            for stream in streams:
+                stream.flush()
+
+    def __work(self):
+        while True:
+            with self.__condition:
+                while not self.__queue and not self.__is_stopped:
+                    self.__condition.wait()
+
+                if not self.__queue:
+                    return
+
+                items = list(self.__queue)
+                self.__queue.clear()
+                self.__is_writing = True
+
+            try:
+                self.__write(items)
+            except BaseException as error:
+                self.__error = error
+            finally:
+                with self.__condition:
+                    self.__is_writing = False
+                    self.__condition.notify_all()
+
+
+class CaptureBuffer(object):
+    """
+    Captured log which is spilled to temporary file
+    when it is bigger than "CAPTURE_MEMORY_LIMIT"
+    """
+
+    def __init__(self):
+        self.__size = 0
+        self.__file = tempfile.SpooledTemporaryFile(
+            max_size=CAPTURE_MEMORY_LIMIT,
+        )
+
+    def __len__(self):
+        return self.__size
+
+    def write(self, s):
+        if isinstance(s, pyv.unicode):
+            s = s.encode('utf-8')
+
+        self.__file.write(s)
+        self.__size += len(s)
+
+    def read(self, limit=CAPTURE_OUTPUT_LIMIT):
+        """
+        Tail of log which is not longer than limit
+        """
+        cut = max(self.__size - limit, 0)
+
+        self.__file.seek(cut)
+        data = self.__file.read().decode('utf-8', 'replace')
+        self.__file.seek(0, os.SEEK_END)
+
+        if cut:
+            return u'... {} bytes were cut\n{}'.format(cut, data)
+
+        return data
+
+    def close(self):
+        self.__file.close()
+
+
+def get_current_task():
+    """
+    Running asyncio task or None.
+    It is using where contextvars are not supported (python < 3.7).
+    """
+    asyncio = sys.modules.get('asyncio')
+
+    if asyncio is None:
+        return None
+
+    get_running_loop = getattr(asyncio, '_get_running_loop', None)
+    loop = get_running_loop() if get_running_loop is not None else None
+
+    if loop is None:
+        return None
+
+    return asyncio.Task.current_task(loop=loop)
+
+
+class CaptureLocal(object):
+    """
+    Value for running test.
+    It is local for asyncio task and local for thread or
+    greenlet of gevent out of tasks. Context variable is used
+    if it is supported, otherwise value is kept by current task.
+    """
+
+    def __init__(self):
+        if ContextVar is not None:
+            self.__var = ContextVar('capture', default=None)
+        else:
+            self.__local = threading.local()
+            self.__tasks = weakref.WeakKeyDictionary()
+
+    def get(self):
+        if ContextVar is not None:
+            return self.__var.get()
+
+        task = get_current_task()
+
+        if task is not None:
+            return self.__tasks.get(task)
+
+        return getattr(self.__local, 'value', None)
+
+    def set(self, value):
+        if ContextVar is not None:
+            self.__var.set(value)
+            return
+
+        task = get_current_task()
+
+        if task is not None:
+            if value is None:
+                self.__tasks.pop(task, None)
+            else:
+                self.__tasks[task] = value
+        else:
+            self.__local.value = value
 
 
 class CaptureStream(object):
+    """
+    Log of running test is written to own buffer,
+    log out of tests is written to common buffer.
+    """
 
     def __init__(self):
-        self.__buffer = []
+        self.__buffer = CaptureBuffer()
+        self.__current = CaptureLocal()
 
     def __getattr__(self, item):
         return getattr(sys.stderr, item)
 
+    def begin(self):
+        self.end(attach=False)
+        self.__current.set(CaptureBuffer())
+
+    def end(self, attach=True):
+        """
+        Get captured log of test
+        """
+        buffer = self.__current.get()
+
+        if buffer is None:
+            return None
+
+        self.__current.set(None)
+
+        try:
+            if attach and buffer:
+                return buffer.read()
+            return None
+        finally:
+            buffer.close()
+
     def write(self, s):
-        self.__buffer.append(s)
+        buffer = self.__current.get()
+
+        if buffer is not None:
+            buffer.write(s)
+        else:
+            self.__buffer.write(s)
 
     def flush(self, fp=None):
         if fp and self.__buffer:
             with lock:
                 fp.write('\nLogging capture:\n\n')
-                for s in self.__buffer:
-                    fp.write(s)
-                    fp.flush()
-            self.__buffer = []
+                fp.write(self.__buffer.read())
+                fp.flush()
 
+            self.__buffer.close()
+            self.__buffer = CaptureBuffer()
 
-class LogCapture(object):
 
-    was_captured = []
+def capture_handler(handler, stream):
+    if handler.__class__ == logging.StreamHandler:
+        handler.stream = stream
+
+
+def capture_added_handlers(add_handler, stream):
+    @wraps(add_handler)
+    def wrapper(logger, handler):
+        if logger is not logging.root:
+            capture_handler(handler, stream)
+        return add_handler(logger, handler)
+
+    wrapper.__capture_hook__ = True
+    wrapper.__add_handler__ = add_handler
+    return wrapper
+
+
+class LogCapture(object):
+    """
+    Stream handlers of loggers are writing to capture stream.
+    Loggers which are existing are captured once,
+    handlers which are added later are captured by hook of "addHandler".
+    Hook is installed on begin of result and removed on final.
+    """
+
+    was_captured = set()
     stream = CaptureStream()
 
     def __init__(self, config):
@@ -103,16 +664,30 @@ class LogCapture(object):
             if isinstance(logger, logging.Logger):
                 yield logger
 
+    @property
+    def is_hooked(self):
+        return getattr(logging.Logger.addHandler, '__capture_hook__', False)
+
     def make(self):
+        if self.is_hooked:
+            return
+
         for logger in self.loggers:
             if logger in self.was_captured:
                 continue
 
             for handler in logger.handlers:
-                if handler.__class__ == logging.StreamHandler:
-                    handler.stream = self.stream
+                capture_handler(handler, self.stream)
+
+            self.was_captured.add(logger)
+
+        logging.Logger.addHandler = capture_added_handlers(
+            logging.Logger.addHandler, self.stream,
+        )
 
-            self.was_captured.append(logger)
+    def release(self):
+        if self.is_hooked:
+            logging.Logger.addHandler = logging.Logger.addHandler.__add_handler__
 
     def flush(self, fp):
         self.stream.flush(fp)
@@ -176,11 +751,13 @@ class Console(object):
             yield
             self.__tabs = current_tabs
 
-        def flush(self, stream):
-            stream.write(
-                u''.join(self.__buffer),
-            )
+        def pop(self):
+            data = u''.join(self.__buffer)
             self.__buffer = []
+            return data
+
+        def flush(self, stream):
+            stream.write(self.pop())
 
     def __init__(self, stream=None, verbose=False):
         self.__buffer = []
@@ -199,6 +776,19 @@ class Console(object):
         return child_console
 
     def flush(self):
+        output_sink = get_sink()
+
+        if output_sink is not None:
+            data = u''.join(self.__buffer) + u''.join(
+                child.pop() for child in self.__children
+            )
+            self.__buffer = []
+
+            if data:
+                output_sink.put(self.__stream, data)
+
+            return
+
         with lock:
             self.__stream.write(
                 u''.join(self.__buffer),
@@ -302,14 +892,10 @@ class State(object):
         if self.__result.runtime is not None:
             return round(self.__result.runtime, xunit.ROUND_RUNTIME)
 
-        runtime = float()
-
-        for storage in (
-                self.__result.errors,
-                self.__result.skipped,
-                self.__result.failures,
-                self.__result.successes):
-            runtime += get_runtime_from_storage(storage)
+        runtime = self.__result.errors.runtime \
+            + self.__result.skipped.runtime \
+            + self.__result.failures.runtime \
+            + self.__result.successes.runtime
 
         return round(runtime, xunit.ROUND_RUNTIME)
 
@@ -342,15 +928,16 @@ class Result(object):
 
     __marker_class__ = Markers
 
-    def __init__(self, config, name=None, stream=None, current_state=None, is_proxy=False):
-        self.errors = []
-        self.skipped = []
-        self.failures = []
-        self.successes = []
+    def __init__(self, config, name=None, stream=None, current_state=None, is_proxy=False, channel=None):
+        self.errors = ResultStorage(low_memory=config.LOW_MEMORY)
+        self.skipped = ResultStorage(low_memory=config.LOW_MEMORY)
+        self.failures = ResultStorage(low_memory=config.LOW_MEMORY)
+        self.successes = ResultStorage(low_memory=config.LOW_MEMORY)
 
         self.proxies = []
 
         self.__config = config
+        self.__channel = channel
         self.__is_proxy = is_proxy
         self.__name = name or DEFAULT_NAME
         self.__current_state = current_state or State(self)
@@ -359,6 +946,7 @@ class Result(object):
         self._marker = self.__marker_class__(self.__config)
 
         self.__timer = None
+        self.__report = None
         self.__runtime = None
         self.__capture = None
         self.__console = Console(
@@ -390,8 +978,13 @@ class Result(object):
     def __exit__(self, *args, **kwargs):
         self.final()
 
-        if self.__config.XUNIT_REPORT:
-            self.create_report(self.__config.XUNIT_REPORT)
+        if self.__report is not None:
+            self.__report.close(self)
+
+        if self.__config.RUNTIME_HISTORY:
+            from .history import get_path_to_save
+
+            self.save_runtime_history(get_path_to_save(self.__config))
 
     def __repr__(self):
         state = self.get_state()
@@ -431,6 +1024,14 @@ class Result(object):
     def runtime(self, value):
         self.__runtime = value
 
+    @property
+    def channel(self):
+        return self.__channel
+
+    @channel.setter
+    def channel(self, value):
+        self.__channel = value
+
     @property
     def current_state(self):
         return self.__current_state
@@ -452,6 +1053,7 @@ class Result(object):
             self.__config,
             is_proxy=True,
             stream=self._stream,
+            channel=self.__channel,
             current_state=self.__current_state,
             **kwargs
         )
@@ -485,6 +1087,8 @@ class Result(object):
             proxy.set_timer(timer)
 
             self.proxies.append(proxy)
+
+            events.emit('suite_start', suite=proxy.name)
         else:
             proxy = self.create_proxy()
 
@@ -495,6 +1099,13 @@ class Result(object):
             self.extend(proxy)
             proxy.console.flush()
 
+            if runnable_object:
+                self.write_to_report(proxy)
+
+                events.emit(
+                    'suite_stop', suite=proxy.name, runtime=proxy.get_state().runtime,
+                )
+
     def get_state(self):
         return State(
             self, should_stop=self.__current_state.should_stop,
@@ -524,6 +1135,28 @@ class Result(object):
     def reset_success(self, runnable_object, xunit_data):
         return reset_item_of_storage(self.successes, runnable_object, xunit_data)
 
+    def write_to_report(self, result_proxy):
+        # worker of multiprocessing group is sending results
+        # to main process, so report is written by main process only
+        if self.__report is not None and self.__channel is None:
+            self.__report.write(result_proxy)
+
+    def begin_capture(self):
+        if not self.__config.NO_CAPTURE:
+            LogCapture.stream.begin()
+
+    def end_capture(self, attach=True):
+        """
+        Captured log of test which was started on the thread
+        """
+        if not self.__config.NO_CAPTURE:
+            return LogCapture.stream.end(attach=attach)
+        return None
+
+    def send_to_channel(self, status, runnable_object, xunit_data):
+        if self.__channel is not None:
+            self.__channel.send(status, runnable_object, xunit_data)
+
     def add_error(self, runnable_object, traceback, runtime, exc):
         error_reason = reason.create(
             runnable_object, traceback, config=self.__config,
@@ -532,12 +1165,18 @@ class Result(object):
         xunit_data = xunit.XUnitData(
             exc=exc,
             runtime=runtime,
-            reason=reason.format_reason(error_reason),
+            reason=error_reason,
+            system_out=self.end_capture(),
             class_name=runnable.class_name(runnable_object),
             method_name=runnable.stopped_on(runnable_object),
         )
 
         self.errors.append((runnable_object, xunit_data))
+        self.send_to_channel(ERRORS, runnable_object, xunit_data)
+        emit_xunit_data(
+            'error', xunit_data,
+            exc_type=xunit_data.exc_type, exc_message=xunit_data.exc_message,
+        )
         self.finish(self._marker.error())
 
         if self.__config.STOP:
@@ -551,18 +1190,26 @@ class Result(object):
         xunit_data = xunit.XUnitData(
             exc=exc,
             runtime=runtime,
-            reason=reason.format_reason(fail_reason),
+            reason=fail_reason,
+            system_out=self.end_capture(),
             class_name=runnable.class_name(runnable_object),
             method_name=runnable.stopped_on(runnable_object),
         )
 
         self.failures.append((runnable_object, xunit_data))
+        self.send_to_channel(FAILURES, runnable_object, xunit_data)
+        emit_xunit_data(
+            'fail', xunit_data,
+            exc_type=xunit_data.exc_type, exc_message=xunit_data.exc_message,
+        )
         self.finish(self._marker.fail())
 
         if self.__config.STOP:
             self.__current_state.should_stop = True
 
     def add_success(self, runnable_object, runtime):
+        self.end_capture(attach=False)
+
         xunit_data = xunit.XUnitData(
             runtime=runtime,
             class_name=runnable.class_name(runnable_object),
@@ -570,9 +1217,13 @@ class Result(object):
         )
 
         self.successes.append((runnable_object, xunit_data))
+        self.send_to_channel(SUCCESSES, runnable_object, xunit_data)
+        emit_xunit_data('success', xunit_data)
         self.finish(self._marker.success())
 
     def add_skip(self, runnable_object, reason, runtime):
+        self.end_capture(attach=False)
+
         xunit_data = xunit.XUnitData(
             reason=reason,
             runtime=runtime,
@@ -581,6 +1232,8 @@ class Result(object):
         )
 
         self.skipped.append((runnable_object, xunit_data))
+        self.send_to_channel(SKIPPED, runnable_object, xunit_data)
+        emit_xunit_data('skip', xunit_data, reason=reason)
         self.finish(self._marker.skip(reason))
 
     def create_report(self, file_path):
@@ -594,7 +1247,28 @@ class Result(object):
                 xunit.create_xml_document(self),
             )
 
+    def save_runtime_history(self, file_path):
+        if self.__is_proxy:
+            raise RuntimeError(
+                'Proxy result can not be independent',
+            )
+
+        from .history import RuntimeHistory
+
+        history = RuntimeHistory(file_path)
+        history.update(self)
+        history.save()
+
     def start(self, runnable_object):
+        self.begin_capture()
+
+        events.emit(
+            'case_start',
+            test=str(runnable_object),
+            class_name=runnable.class_name(runnable_object),
+            method_name=runnable.method_name(runnable_object),
+        )
+
         if self.__config.VERBOSE:
             self.__console.write(
                 '* {}: '.format(str(runnable_object)),
@@ -615,6 +1289,17 @@ class Result(object):
         if self.__capture:
             self.__capture.make()
 
+        if self.__config.XUNIT_REPORT:
+            self.__report = xunit.XUnitWriter(
+                self.__config.XUNIT_REPORT, self.__name,
+            )
+            self.__report.open()
+
+        start_sink()
+
+        if events.open_writer(self.__config):
+            events.emit('begin')
+
         self.__console.writeln('Seismograph is measuring:')
         self.__console.line_break()
         self.console.flush()
@@ -642,12 +1327,19 @@ class Result(object):
                     runnable_object, xunit_data = storage_item
                     if xunit_data.reason:
                         crash_reason = reason.create(
-                            runnable_object, xunit_data.reason, config=self.__config,
+                            runnable_object,
+                            xunit_data.reason,
+                            config=self.__config,
+                            with_data=False,
                         )
                         self.__console.writeln(
                             reason.format_reason_to_output(crash_reason),
                         )
 
+                    if xunit_data.system_out:
+                        self.__console.writeln('Logging capture:\n')
+                        self.__console.writeln(xunit_data.system_out)
+
         total = 'tests={} failures={} errors={} skipped={} successes={} runtime={}'.format(
             self.__current_state.tests,
             self.__current_state.failures,
@@ -680,5 +1372,19 @@ class Result(object):
         self.__console.writeln(total)
         self.__console.flush()
 
+        stop_sink()
+
+        events.emit(
+            'final',
+            tests=self.__current_state.tests,
+            failures=self.__current_state.failures,
+            errors=self.__current_state.errors,
+            skipped=self.__current_state.skipped,
+            successes=self.__current_state.successes,
+            runtime=self.__current_state.runtime,
+        )
+        events.close_writer()
+
         if self.__capture:
+            self.__capture.release()
             self.__capture.flush(self._stream)
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import weakref
+from itertools import count
 from functools import wraps
 from collections import OrderedDict
 from contextlib import contextmanager
@@ -8,6 +10,20 @@ from .utils import pyv
 from .utils.mp import MPSupportedValue
 
 
+# id of runnable object is unique for whole run,
+# id() can be given to other object after collection
+ids = count(1)
+
+
+def id_of(obj):
+    """
+    Id of runnable object or snapshot, id() of other objects
+    """
+    if isinstance(obj, (RunnableObject, RunnableSnapshot)):
+        return obj.id
+    return id(obj)
+
+
 def run(runnable, *args, **kwargs):
     return runnable.__run__(*args, **kwargs)
 
@@ -16,6 +32,24 @@ def reason(runnable):
     return runnable.__reason__()
 
 
+def reason_data(runnable):
+    """
+    Data of reason which is taken when error is added
+    and function to format it to string later.
+    Reason of object which is overriding "__reason__"
+    can not be split, so it is formatted at once.
+    """
+    owner = next(
+        (c for c in getattr(runnable.__class__, '__mro__', ()) if '__reason__' in c.__dict__),
+        None,
+    )
+
+    if owner is RunnableObject:
+        return runnable.__reason_data__(), runnable.__format_reason_data__
+
+    return reason(runnable), None
+
+
 def stopped_on(runnable, method_name=None):
     if method_name:
         runnable._stopped_on = method_name
@@ -83,7 +117,7 @@ class RunnableObject(object):
     __create_reason__ = False
 
     def __init__(self):
-        self.__id = id(self)
+        self.__id = next(ids)
         self.__stopped_on = MPSupportedValue(
             method_name(self),
         )
@@ -135,10 +169,17 @@ class RunnableObject(object):
         )
 
     def __reason__(self):
+        return self.__format_reason_data__(self.__reason_data__())
+
+    def __reason_data__(self):
         return 'Your reason can be here. This is from "{}.{}.__reason__" method.\n'.format(
             self.__class__.__module__, self.__class__.__name__,
         )
 
+    @classmethod
+    def __format_reason_data__(cls, data):
+        return data
+
     def __run__(self, *args, **kwargs):
         raise NotImplementedError(
             'Method "run" not implemented in "{}"'.format(
@@ -152,6 +193,90 @@ class RunnableObject(object):
         )
 
 
+class RunnableSnapshot(object):
+    """
+    Data of runnable object which is needed to result after run.
+    Result is keeping it instead of object which was collected.
+    """
+
+    __slots__ = (
+        '__id',
+        '__repr',
+        '__case_name',
+        '__suite_name',
+        '__method_name',
+    )
+
+    def __init__(self, runnable_object):
+        # mount data of suite has not name of suite
+        mount_data = getattr(runnable_object, '__mount_data__', None)
+        suite_name = getattr(mount_data, 'suite_name', None)
+
+        self.__id = id_of(runnable_object)
+        self.__repr = repr(runnable_object)
+        self.__method_name = method_name(runnable_object)
+
+        if suite_name is not None:
+            self.__suite_name = suite_name
+            self.__case_name = runnable_object.__class__.__name__
+        else:
+            self.__suite_name = None
+            self.__case_name = None
+
+    def __repr__(self):
+        return self.__repr
+
+    @property
+    def id(self):
+        return self.__id
+
+    @property
+    def case_name(self):
+        return self.__case_name
+
+    @property
+    def suite_name(self):
+        return self.__suite_name
+
+    @property
+    def method_name(self):
+        return self.__method_name
+
+
+class RunnableRef(object):
+    """
+    Weak reference to runnable object which is
+    returning snapshot of object after collection.
+    Snapshot and other objects are kept as is.
+    """
+
+    __slots__ = (
+        '__ref',
+        '__snapshot',
+    )
+
+    def __init__(self, runnable_object):
+        if isinstance(runnable_object, RunnableObject):
+            self.__ref = weakref.ref(runnable_object)
+            self.__snapshot = RunnableSnapshot(runnable_object)
+        else:
+            self.__ref = None
+            self.__snapshot = runnable_object
+
+    def __call__(self):
+        if self.__ref is not None:
+            runnable_object = self.__ref()
+
+            if runnable_object is not None:
+                return runnable_object
+
+        return self.__snapshot
+
+    @property
+    def snapshot(self):
+        return self.__snapshot
+
+
 class BuildObjectMixin(object):
 
     def __is_build__(self):
@@ -213,18 +213,20 @@ def _make_run_test():
 
 
 class CaseMeta(type):
+    """
+    Steps and names of tests are found once on creation of class
+    """
 
     def __new__(mcs, name, bases, dct):
         cls = type.__new__(mcs, name, bases, dct)
 
         steps = []
-
-        attributes = (
-            a for a in dir(cls)
-            if not a.startswith('_')
-        )
+        attributes = dir(cls)
 
         for atr in attributes:
+            if atr.startswith('_'):
+                continue
+
             method = getattr(cls, atr, None)
             if hasattr(method, STEP_ATTRIBUTE_NAME):
                 steps.append(method)
@@ -241,4 +243,35 @@ class CaseMeta(type):
             setattr(cls, CURRENT_FLOW_ATTRIBUTE_NAME, 'Without flows')
             setattr(cls, loader.DEFAULT_TEST_NAME, _make_run_test())
 
+            if loader.DEFAULT_TEST_NAME not in attributes:
+                attributes.append(loader.DEFAULT_TEST_NAME)
+
+        loader.get_test_names_of_case(cls, attributes=attributes)
+
         return cls
+
+    def __setattr__(cls, name, value):
+        if loader.is_test_name(name):
+            cls.__drop_test_names()
+
+        super(CaseMeta, cls).__setattr__(name, value)
+
+    def __delattr__(cls, name):
+        if loader.is_test_name(name):
+            cls.__drop_test_names()
+
+        super(CaseMeta, cls).__delattr__(name)
+
+    def __drop_test_names(cls):
+        """
+        Names of subclasses are dropped too, they are inheriting tests of class
+        """
+        classes = [cls]
+
+        while classes:
+            current = classes.pop()
+
+            if loader.TEST_NAMES_ATTRIBUTE_NAME in current.__dict__:
+                type.__delattr__(current, loader.TEST_NAMES_ATTRIBUTE_NAME)
+
+            classes.extend(type.__subclasses__(current))
@@ -8,11 +8,10 @@ from . import case
 from . import reason
 from . import loader
 from . import runnable
-from .utils import pyv
 from . import extensions
 from .utils.common import measure_time
 from .utils.common import call_to_chain
-from .groups.default import DefaultCaseGroup
+from .groups import make_case_group
 from .exceptions import ExtensionNotRequired
 from .exceptions import ALLOW_RAISED_EXCEPTIONS
 
@@ -53,7 +52,7 @@ class BuildRule(object):
     def __str__(self):
         if self.__suite_name and self.__case_name and self.__test_name:
             return '{}:{}.{}'.format(
-                self.__suite_name, self.__case_name, self.__case_name,
+                self.__suite_name, self.__case_name, self.__test_name,
             )
 
         if self.__suite_name and self.__case_name:
@@ -302,6 +301,8 @@ class Suite(runnable.RunnableObject, runnable.MountObjectMixin, runnable.BuildOb
 
     __layers__ = None
     __require__ = None
+    __timeout__ = None
+    __resources__ = None
     __create_reason__ = True
     __case_class__ = case.Case
     __case_group_class__ = None
@@ -323,12 +324,16 @@ class Suite(runnable.RunnableObject, runnable.MountObjectMixin, runnable.BuildOb
     def __class_name__(self):
         return self.__name
 
-    def __reason__(self):
-        if self.reason_storage:
+    def __reason_data__(self):
+        return tuple(self.reason_storage.items())
+
+    @classmethod
+    def __format_reason_data__(cls, data):
+        if data:
             return reason.item(
                 'Suite',
                 'info from suite',
-                *(u'{}: {}'.format(k, v) for k, v in self.reason_storage.items())
+                *(u'{}: {}'.format(k, v) for k, v in data)
             )
         return ''
 
@@ -337,33 +342,43 @@ class Suite(runnable.RunnableObject, runnable.MountObjectMixin, runnable.BuildOb
         self.__is_run = True
         timer = measure_time()
 
-        if result.current_state.should_stop or not self.__case_instances:
+        if result.current_state.should_stop:
+            return
+
+        self._build_cases()
+
+        if not self.__case_instances:
             return
 
         group = self._make_group()
 
-        with result.proxy(self, timer=timer) as result_proxy:
-            try:
-                self.__context.on_run(self)
-
-                with self.__context(self):
-                    group(result_proxy)
-            except ALLOW_RAISED_EXCEPTIONS:
-                raise
-            except BaseException as error:
-                self.__context.on_error(error, self, result_proxy)
-                result_proxy.add_error(
-                    self, traceback.format_exc(), timer(), error,
-                )
+        try:
+            with result.proxy(self, timer=timer) as result_proxy:
+                try:
+                    self.__context.on_run(self)
+
+                    with self.__context(self):
+                        group(result_proxy)
+                except ALLOW_RAISED_EXCEPTIONS:
+                    raise
+                except BaseException as error:
+                    self.__context.on_error(error, self, result_proxy)
+                    result_proxy.add_error(
+                        self, traceback.format_exc(), timer(), error,
+                    )
+        finally:
+            self._release_cases()
 
     #
     # Behavior on magic methods
     #
 
     def __iter__(self):
+        self._build_cases()
         return iter(self.__case_instances)
 
     def __nonzero__(self):
+        self._build_cases()
         return bool(self.__case_instances)
 
     def __bool__(self):  # please python 3
@@ -373,16 +388,24 @@ class Suite(runnable.RunnableObject, runnable.MountObjectMixin, runnable.BuildOb
     # Self code is starting here
     #
 
-    def __init__(self, name, require=None, layers=None):
+    def __init__(self, name, require=None, layers=None, resources=None, timeout=None):
         super(Suite, self).__init__()
 
         self.__name = name
+        self.__timeout = timeout or self.__timeout__
+
+        self.__resources = dict(self.__resources__ or {})
+
+        if resources:
+            self.__resources.update(resources)
 
         self.__is_run = False
         self.__is_build = False
 
+        self.__build_plan = None
         self.__case_classes = []
         self.__case_instances = []
+        self.__case_classes_by_name = {}
 
         self.__mount_data__ = None
 
@@ -447,49 +470,91 @@ class Suite(runnable.RunnableObject, runnable.MountObjectMixin, runnable.BuildOb
     def cases(self):
         return self.__case_classes
 
+    @property
+    def resources(self):
+        return self.__resources
+
+    def get_case(self, class_name):
+        """
+        Registered case class by name or None
+        """
+        return self.__case_classes_by_name.get(class_name)
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
     @property
     def context(self):
         return self.__context
 
-    def _make_group(self):
-        if self.__case_group_class__:
-            logger.debug(
-                'Use "__case_group_class__" to making case group',
-            )
+    def _build_cases(self):
+        """
+        Instantiate cases by plan of build.
+        Cases of lazy built suite are instantiated before run.
+        """
+        if self.__build_plan is None:
+            return
 
-            return self.__case_group_class__(
-                self.__case_instances, self.config,
+        plan, shuffle, order = self.__build_plan
+        self.__build_plan = None
+
+        for case_name, test_name in plan:
+            self.__build__(
+                case_name=case_name,
+                test_name=test_name,
             )
 
-        if self.config.GEVENT:
+        if shuffle:
+            shuffle(self.__case_instances)
+
+        if order:
+            order(self.__case_instances)
+
+    def _release_cases(self):
+        """
+        Cases are not needed after run in low memory mode,
+        result is keeping snapshots of them
+        """
+        if self.config.LOW_MEMORY:
             logger.debug(
-                'Use "GeventCaseGroup" to making case group',
+                'Release cases of suite "{}"'.format(runnable.class_name(self)),
             )
+            del self.__case_instances[:]
 
-            pyv.check_gevent_supported()
+    def _exclude_cases(self, ids):
+        """
+        Cases which were run already are not run again.
+        Box is made anew from the rest of its cases.
+        """
+        self._build_cases()
 
-            from .groups.gevent import GeventCaseGroup
+        instances = []
 
-            return GeventCaseGroup(
-                self.__case_instances, self.config,
-            )
+        for case_or_box in self.__case_instances:
+            if isinstance(case_or_box, case.CaseBox):
+                cases = [c for c in case_or_box if c.id not in ids]
+
+                if cases:
+                    instances.append(case_or_box.__class__(cases))
+            elif case_or_box.id not in ids:
+                instances.append(case_or_box)
+
+        self.__case_instances[:] = instances
 
-        if self.config.THREADING or self.config.MULTIPROCESSING:
+    def _make_group(self):
+        self._build_cases()
+
+        if self.__case_group_class__:
             logger.debug(
-                'Use "ThreadingCaseGroup" to making case group',
+                'Use "__case_group_class__" to making case group',
             )
 
-            from .groups.threading import ThreadingCaseGroup
-
-            return ThreadingCaseGroup(
+            return self.__case_group_class__(
                 self.__case_instances, self.config,
             )
 
-        logger.debug(
-            'Use "DefaultCaseGroup" to making case group',
-        )
-
-        return DefaultCaseGroup(
+        return make_case_group(
             self.__case_instances, self.config,
         )
 
@@ -553,10 +618,7 @@ class Suite(runnable.RunnableObject, runnable.MountObjectMixin, runnable.BuildOb
                 'cls': case_class,
                 'tests': dict(
                     (atr, getattr(case_class, atr))
-                    for atr in dir(case_class)
-                    if atr.startswith(loader.TEST_NAME_PREFIX)
-                    or
-                    atr == loader.DEFAULT_TEST_NAME,
+                    for atr in loader.get_test_names_of_case(case_class)
                 ),
             }
 
@@ -575,6 +637,7 @@ class Suite(runnable.RunnableObject, runnable.MountObjectMixin, runnable.BuildOb
                 layers=None,
                 static=False,
                 require=None,
+                resources=None,
                 case_class=None,
                 always_success=False,
                 assertion_class=None):
@@ -606,6 +669,9 @@ class Suite(runnable.RunnableObject, runnable.MountObjectMixin, runnable.BuildOb
                 else:
                     _class.__layers__ = tuple(layers)
 
+            if resources:
+                _class.__resources__ = dict(_class.__resources__ or {}, **resources)
+
             if assertion_class:
                 setattr(_class, '__assertion_class__', assertion_class)
 
@@ -615,6 +681,7 @@ class Suite(runnable.RunnableObject, runnable.MountObjectMixin, runnable.BuildOb
                     require=require,
                 ),
             )
+            self.__case_classes_by_name.setdefault(_class.__name__, _class)
 
             return _class
 
@@ -626,8 +693,37 @@ class Suite(runnable.RunnableObject, runnable.MountObjectMixin, runnable.BuildOb
 
         return wrapper
 
+    def iter_tests(self):
+        """
+        Pairs of case class and test name which are run by suite.
+        Cases of lazy built suite are not instantiated for it.
+        """
+        if self.__build_plan is None:
+            for case_or_box in self.__case_instances:
+                cases = case_or_box if isinstance(case_or_box, case.CaseBox) else [case_or_box]
+
+                for c in cases:
+                    yield c.__class__, runnable.method_name(c)
+
+            return
+
+        plan, _, _ = self.__build_plan
+
+        for case_name, test_name in plan:
+            if case_name:
+                classes = [loader.load_case_from_suite(case_name, self)]
+            else:
+                classes = self.__case_classes
+
+            for cls in classes:
+                for name in ([test_name] if test_name else loader.get_test_names_of_case(cls)):
+                    yield cls, name
+
     @runnable.mount_method
-    def build(self, case_name=None, test_name=None, shuffle=None):
+    def build(self, case_name=None, test_name=None, shuffle=None, order=None, lazy=False):
+        """
+        :param lazy: instantiate cases on first iteration or run of suite
+        """
         if self.__is_build:
             raise RuntimeError(
                 'Suite "{}" is already built'.format(
@@ -642,18 +738,21 @@ class Suite(runnable.RunnableObject, runnable.MountObjectMixin, runnable.BuildOb
         self.__context.install_extensions()
 
         if self.__context.build_rules and not case_name:
-            for rule in self.__context.build_rules:
-                self.__build__(
-                    case_name=rule.case_name,
-                    test_name=rule.test_name,
-                )
+            plan = [
+                (rule.case_name, rule.test_name)
+                for rule in self.__context.build_rules
+            ]
         else:
-            self.__build__(
-                case_name=case_name,
-                test_name=test_name,
-            )
+            plan = [(case_name, test_name)]
 
-        if shuffle:
-            shuffle(self.__case_instances)
+        self.__build_plan = (plan, shuffle, order)
+
+        if lazy:
+            # wrong commands should be found before run
+            for name, _ in plan:
+                if name:
+                    loader.load_case_from_suite(name, self)
+        else:
+            self._build_cases()
 
         self.__is_build = True
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+"""
+Timeouts of tests.
+
+Timeout is taken from "__timeout__" of case, then of suite,
+then from "--test-timeout" option. Exceeded test is stopped
+with CaseTimeout exception and it is recorded as error.
+Worker of multiprocessing group is killed by main process
+if test was not stopped in "KILL_DELAY" sec. after timeout.
+"""
+
+import ctypes
+import logging
+import threading
+from contextlib import contextmanager
+
+from .utils import pyv
+from .exceptions import CaseTimeout
+
+
+logger = logging.getLogger(__name__)
+
+
+# Delay in seconds after timeout of test
+# to kill worker process if test was not stopped
+KILL_DELAY = 1.0
+
+
+watcher = None
+
+
+def get_timeout(case):
+    return case.__timeout__ \
+        or case.__mount_data__.timeout \
+        or case.config.TEST_TIMEOUT
+
+
+def get_watcher(config):
+    global watcher
+
+    if watcher is None:
+        if config.GEVENT:
+            watcher = GeventWatcher()
+        else:
+            watcher = ThreadWatcher()
+
+    return watcher
+
+
+@contextmanager
+def watch(case):
+    timeout = get_timeout(case)
+    case_watcher = get_watcher(case.config)
+
+    if not timeout and not case_watcher.is_tracking:
+        yield
+        return
+
+    with case_watcher.watch(case, timeout):
+        yield
+
+
+def set_async_exc(thread_id, exc_class):
+    if pyv.IS_PYTHON_2:
+        thread_id = ctypes.c_long(thread_id)
+    else:
+        thread_id = ctypes.c_ulong(thread_id)
+
+    return ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        thread_id, ctypes.py_object(exc_class) if exc_class else None,
+    )
+
+
+class Alarm(object):
+    """
+    Raise exception in thread.
+    Exception is raised between instructions of python,
+    so blocking call will be stopped after return only.
+    """
+
+    def __init__(self, thread_id, exc_class=CaseTimeout):
+        self.__thread_id = thread_id
+        self.__exc_class = exc_class
+
+        self.__lock = threading.Lock()
+        self.__is_armed = True
+        self.__is_fired = False
+
+    def fire(self):
+        with self.__lock:
+            if self.__is_armed:
+                self.__is_fired = True
+                set_async_exc(self.__thread_id, self.__exc_class)
+
+    def disarm(self):
+        with self.__lock:
+            self.__is_armed = False
+
+            if self.__is_fired:
+                # test was done before exception was raised
+                set_async_exc(self.__thread_id, None)
+
+
+class ThreadWatcher(object):
+
+    def __init__(self, heartbeat=None):
+        self.__heartbeat = heartbeat
+
+    @property
+    def is_tracking(self):
+        return self.__heartbeat is not None
+
+    @contextmanager
+    def watch(self, case, timeout):
+        alarm = None
+        timer = None
+        slot = None
+
+        if self.__heartbeat is not None:
+            slot = self.__heartbeat.begin(
+                case.id, timeout + KILL_DELAY if timeout else None,
+            )
+
+        if timeout:
+            alarm = Alarm(threading.current_thread().ident)
+            timer = threading.Timer(timeout, alarm.fire)
+            timer.daemon = True
+            timer.start()
+
+        try:
+            yield
+        finally:
+            if timer is not None:
+                timer.cancel()
+                alarm.disarm()
+
+            if slot is not None:
+                self.__heartbeat.end(slot)
+
+
+class GeventWatcher(object):
+
+    is_tracking = False
+
+    @contextmanager
+    def watch(self, case, timeout):
+        from gevent import Timeout
+
+        with Timeout(timeout, CaseTimeout('Timeout "{}" of test was exceeded'.format(timeout))):
+            yield
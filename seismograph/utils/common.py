@@ -2,6 +2,7 @@
 
 import time
 
+from . import pyv
 from ..exceptions import TimeoutException
 
 
@@ -37,12 +38,24 @@ def waiting_for(func, timeout=None, exc_cls=None, message=None, delay=None, args
     raise TimeoutException(message)
 
 
+def maybe_await(value):
+    """
+    Result of coroutine is awaited on event loop of asyncio,
+    other values are returned as is
+    """
+    if pyv.is_awaitable(value):
+        from ..groups.asyncio import run_awaitable
+        return run_awaitable(value)
+
+    return value
+
+
 def call_to_chain(chain, method_name, *args, **kwargs):
     for obj in chain:
         if method_name:
-            getattr(obj, method_name)(*args, **kwargs)
+            maybe_await(getattr(obj, method_name)(*args, **kwargs))
         else:
-            obj(*args, **kwargs)
+            maybe_await(obj(*args, **kwargs))
 
 
 def measure_time():
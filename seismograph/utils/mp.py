@@ -4,6 +4,16 @@
 Multiprocessing utils
 """
 
+import time
+import select
+import threading
+
+
+# Max length in bytes of string value in shared memory
+STRING_WIDTH = 128
+# Num of strings in one block of shared memory
+STRINGS_PER_BLOCK = 1024
+
 
 class MPSupportedValue(object):
 
@@ -27,3 +37,137 @@ class MPSupportedValue(object):
 
     def set(self, value):
         self._value = value
+
+
+class SharedString(object):
+    """
+    String of fixed width in block of shared memory.
+
+    Value is written without lock. It is safe while
+    each string has only one writer at a time.
+    """
+
+    def __init__(self, block, offset, width):
+        self.__block = block
+        self.__width = width
+        self.__offset = offset
+
+    @property
+    def value(self):
+        raw = self.__block[self.__offset:self.__offset + self.__width]
+        return raw.split(b'\0', 1)[0].decode('utf-8', 'ignore')
+
+    @value.setter
+    def value(self, value):
+        data = (value or '').encode('utf-8')[:self.__width - 1]
+        self.__block[self.__offset:self.__offset + self.__width] = \
+            data + b'\0' * (self.__width - len(data))
+
+
+class SharedMemory(object):
+    """
+    Lock-free replacement of multiprocessing.Manager for values.
+
+    Strings are taken from blocks of shared memory one by one,
+    so a block is an array of strings indexed by order of creation.
+    All values should be created before fork of processes.
+    """
+
+    def __init__(self, string_width=STRING_WIDTH, strings_per_block=STRINGS_PER_BLOCK):
+        self.__blocks = []
+        self.__strings = 0
+        self.__string_width = string_width
+        self.__strings_per_block = strings_per_block
+
+    def string(self, value=None):
+        from multiprocessing.sharedctypes import RawArray
+
+        index = self.__strings % self.__strings_per_block
+
+        if index == 0:
+            self.__blocks.append(
+                RawArray('c', self.__string_width * self.__strings_per_block),
+            )
+
+        self.__strings += 1
+
+        shared_string = SharedString(
+            self.__blocks[-1], index * self.__string_width, self.__string_width,
+        )
+        shared_string.value = value
+
+        return shared_string
+
+    def Value(self, typecode, value):  # like in multiprocessing.Manager
+        if typecode == 's':
+            return self.string(value)
+
+        from multiprocessing.sharedctypes import RawValue
+
+        return RawValue(typecode, value)
+
+
+class Heartbeat(object):
+    """
+    Deadlines of tests which are running in worker process.
+
+    Worker writes id of runnable object and deadline to free slot,
+    main process reads them to find tests which are hanging.
+    Should be created before fork of worker.
+    """
+
+    def __init__(self, size):
+        from multiprocessing.sharedctypes import RawArray
+
+        self.__ids = RawArray('l', size)
+        self.__started = RawArray('d', size)
+        self.__deadlines = RawArray('d', size)
+        self.__lock = threading.Lock()
+
+    def begin(self, runnable_id, timeout=None):
+        """
+        Return num of slot or None if all of slots are busy
+        """
+        started = time.time()
+        deadline = started + timeout if timeout else float('inf')
+
+        with self.__lock:
+            for slot, value in enumerate(self.__deadlines):
+                if not value:
+                    self.__ids[slot] = runnable_id
+                    self.__started[slot] = started
+                    self.__deadlines[slot] = deadline
+                    return slot
+
+        return None
+
+    def end(self, slot):
+        self.__deadlines[slot] = 0
+
+    def running(self):
+        """
+        List of (runnable id, started, deadline)
+        """
+        return [
+            (self.__ids[slot], self.__started[slot], deadline)
+            for slot, deadline in enumerate(self.__deadlines)
+            if deadline
+        ]
+
+    def next_deadline(self):
+        deadlines = [d for _, _, d in self.running()]
+        return min(deadlines) if deadlines else None
+
+
+def wait_connections(connections, timeout=None):
+    """
+    Wait until one of connections will be ready for reading.
+    Returns list of ready connections.
+    """
+    try:
+        from multiprocessing.connection import wait
+    except ImportError:  # python 2
+        ready, _, _ = select.select(connections, [], [], timeout)
+        return ready
+
+    return wait(connections, timeout=timeout)
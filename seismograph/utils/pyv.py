@@ -6,6 +6,7 @@ Module for supporting py 2-3 versions.
 
 import sys
 import types
+import inspect
 
 from ..exceptions import PyVersionError
 
@@ -29,6 +30,11 @@ def check_gevent_supported():
         raise PyVersionError('gevent lib not supported with python 3')
 
 
+def check_asyncio_supported():
+    if sys.version_info < (3, 5):
+        raise PyVersionError('asyncio groups need python 3.5 and greater')
+
+
 if IS_PYTHON_2:
     basestring = basestring
 elif IS_PYTHON_3:
@@ -54,6 +60,12 @@ elif IS_PYTHON_3:
     reduce = reduce
 
 
+if IS_PYTHON_2:
+    intern = intern
+elif IS_PYTHON_3:
+    intern = sys.intern
+
+
 if IS_PYTHON_2:
     execfile = execfile
 elif IS_PYTHON_3:
@@ -77,6 +89,18 @@ def get_func_name(func):
     return func.__name__
 
 
+def is_awaitable(obj):
+    if IS_PYTHON_2:
+        return False
+
+    isawaitable = getattr(inspect, 'isawaitable', None)
+
+    if isawaitable is None:
+        return False
+
+    return isawaitable(obj)
+
+
 def is_class_type(obj):
     if IS_PYTHON_2:
         return isinstance(obj, (type, types.ClassType))
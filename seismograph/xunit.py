@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 
+import os
 import json
 import pickle
 import marshal
+import threading
 
 from .utils import pyv
+from .reason import Reason
+from .reason import format_reason
 
 
 XML_VERSION = '1.0'
@@ -13,7 +17,28 @@ XML_ENCODING = 'UTF-8'
 ROUND_RUNTIME = 3
 
 
+def intern_string(string):
+    # names of classes and methods are repeating in many records
+    if isinstance(string, str):
+        return pyv.intern(string)
+    return string
+
+
 class XUnitData(object):
+    """
+    Reason can be given as object of reason.Reason,
+    it is formatted once on first read of reason.
+    """
+
+    __slots__ = (
+        '__reason',
+        '__runtime',
+        '__system_out',
+        '__exc_type',
+        '__class_name',
+        '__method_name',
+        '__exc_message',
+    )
 
     def __init__(self,
                  exc=None,
@@ -22,7 +47,8 @@ class XUnitData(object):
                  exc_type=None,
                  class_name=None,
                  method_name=None,
-                 exc_message=None):
+                 exc_message=None,
+                 system_out=None):
         if exc:
             self.parse_exc(exc)
         else:
@@ -31,8 +57,9 @@ class XUnitData(object):
 
         self.__reason = reason
         self.__runtime = runtime
-        self.__class_name = class_name
-        self.__method_name = method_name
+        self.__system_out = system_out
+        self.__class_name = intern_string(class_name)
+        self.__method_name = intern_string(method_name)
 
     @classmethod
     def from_dict(cls, dct):
@@ -52,12 +79,18 @@ class XUnitData(object):
 
     @property
     def reason(self):
+        if isinstance(self.__reason, Reason):
+            self.__reason = format_reason(self.__reason)
         return self.__reason
 
     @reason.setter
     def reason(self, value):
         self.__reason = value
 
+    @property
+    def system_out(self):
+        return self.__system_out
+
     @property
     def runtime(self):
         return round(self.__runtime, ROUND_RUNTIME)
@@ -84,18 +117,19 @@ class XUnitData(object):
 
     def to_dict(self):
         return {
-            'reason': self.__reason,
+            'reason': self.reason,
             'runtime': self.__runtime,
             'exc_type': self.__exc_type,
             'class_name': self.__class_name,
             'exc_message': self.__exc_message,
             'method_name': self.__method_name,
+            'system_out': self.__system_out,
         }
 
     def parse_exc(self, exc):
-        self.__exc_type = '{}.{}'.format(
+        self.__exc_type = intern_string('{}.{}'.format(
             exc.__class__.__module__, exc.__class__.__name__,
-        )
+        ))
         self.__exc_message = pyv.get_exc_message(exc)
 
     def to_json(self):
@@ -143,89 +177,107 @@ def to_xml_tag(tag_name, contains, **attributes):
         tag_name, dict_to_tag_attributes(attributes))
 
 
-def create_xml_document(result):
-    def render_result_proxy(result_proxy):
-        cases_report = []
-
-        for _, xunit_data in result_proxy.successes:
-            cases_report.append(
-                to_xml_tag('testcase', None,
-                           time=xunit_data.runtime,
-                           name=xunit_data.method_name,
-                           classname=xunit_data.class_name,
-                           ),
-            )
+def render_header(result=None, name=None):
+    if result is not None:
+        attributes = dict(
+            name=result.name,
+            tests=result.current_state.tests,
+            time=result.current_state.runtime,
+            skip=result.current_state.skipped,
+            errors=result.current_state.errors,
+            failures=result.current_state.failures,
+        )
+    else:
+        attributes = dict(name=name)
 
-        for _, xunit_data in result_proxy.skipped:
-            cases_report.append(
-                to_xml_tag('testcase',
-                           to_xml_tag('skipped',
-                                      cdata(xunit_data.reason),
-                                      ),
-                           time=xunit_data.runtime,
-                           name=xunit_data.method_name,
-                           classname=xunit_data.class_name,
-                           ),
-            )
+    return u'<?xml version="{version}" encoding="{encoding}"?><testsuites{attributes}'.format(
+        version=XML_VERSION,
+        encoding=XML_ENCODING,
+        attributes=dict_to_tag_attributes(attributes),
+    )
 
-        for _, xunit_data in result_proxy.failures:
-            cases_report.append(
-                to_xml_tag('testcase',
-                           to_xml_tag('failure',
-                                      cdata(xunit_data.reason),
-                                      type=xunit_data.exc_type,
-                                      message=xunit_data.exc_message,
-                                      ),
-                           time=xunit_data.runtime,
-                           name=xunit_data.method_name,
-                           classname=xunit_data.class_name,
-                           ),
-            )
 
-        for _, xunit_data in result_proxy.errors:
-            cases_report.append(
-                to_xml_tag('testcase',
-                           to_xml_tag('error',
-                                      cdata(xunit_data.reason),
-                                      type=xunit_data.exc_type,
-                                      message=xunit_data.exc_message,
-                                      ),
-                           time=xunit_data.runtime,
-                           name=xunit_data.method_name,
-                           classname=xunit_data.class_name,
-                           ),
-            )
+def render_system_out(xunit_data):
+    if xunit_data.system_out:
+        return to_xml_tag('system-out', cdata(xunit_data.system_out))
+    return u''
+
 
-        state = result_proxy.get_state()
+def render_result_proxy(result_proxy):
+    cases_report = []
 
-        return to_xml_tag('testsuite',
-                          u''.join(cases_report),
-                          name=result_proxy.name,
-                          tests=state.tests,
-                          time=state.runtime,
-                          skip=state.skipped,
-                          errors=state.errors,
-                          failures=state.failures,
-                          )
+    for _, xunit_data in result_proxy.successes:
+        cases_report.append(
+            to_xml_tag('testcase', None,
+                       time=xunit_data.runtime,
+                       name=xunit_data.method_name,
+                       classname=xunit_data.class_name,
+                       ),
+        )
+
+    for _, xunit_data in result_proxy.skipped:
+        cases_report.append(
+            to_xml_tag('testcase',
+                       to_xml_tag('skipped',
+                                  cdata(xunit_data.reason),
+                                  ),
+                       time=xunit_data.runtime,
+                       name=xunit_data.method_name,
+                       classname=xunit_data.class_name,
+                       ),
+        )
+
+    for _, xunit_data in result_proxy.failures:
+        cases_report.append(
+            to_xml_tag('testcase',
+                       to_xml_tag('failure',
+                                  cdata(xunit_data.reason),
+                                  type=xunit_data.exc_type,
+                                  message=xunit_data.exc_message,
+                                  ) + render_system_out(xunit_data),
+                       time=xunit_data.runtime,
+                       name=xunit_data.method_name,
+                       classname=xunit_data.class_name,
+                       ),
+        )
+
+    for _, xunit_data in result_proxy.errors:
+        cases_report.append(
+            to_xml_tag('testcase',
+                       to_xml_tag('error',
+                                  cdata(xunit_data.reason),
+                                  type=xunit_data.exc_type,
+                                  message=xunit_data.exc_message,
+                                  ) + render_system_out(xunit_data),
+                       time=xunit_data.runtime,
+                       name=xunit_data.method_name,
+                       classname=xunit_data.class_name,
+                       ),
+        )
 
+    state = result_proxy.get_state()
+
+    return to_xml_tag('testsuite',
+                      u''.join(cases_report),
+                      name=result_proxy.name,
+                      tests=state.tests,
+                      time=state.runtime,
+                      skip=state.skipped,
+                      errors=state.errors,
+                      failures=state.failures,
+                      )
+
+
+def create_xml_document(result):
     data = u''.join(
         (
-            u'<?xml version="{version}" encoding="{encoding}"?>'.format(
-                version=XML_VERSION,
-                encoding=XML_ENCODING,
-            ),
-            to_xml_tag('testsuites',
-                       u''.join(
-                           map(render_result_proxy, result.proxies),
-                       )
-                       if result.proxies else render_result_proxy(result),
-                       name=result.name,
-                       tests=result.current_state.tests,
-                       time=result.current_state.runtime,
-                       skip=result.current_state.skipped,
-                       errors=result.current_state.errors,
-                       failures=result.current_state.failures,
-                       ),
+            render_header(result),
+            u'>',
+            u''.join(
+                map(render_result_proxy, result.proxies),
+            )
+            if result.proxies else render_result_proxy(result),
+            u'</testsuites>',
         ),
     )
 
@@ -233,3 +285,69 @@ def create_xml_document(result):
         return data.encode('utf-8')
 
     return data
+
+
+class XUnitWriter(object):
+    """
+    Report is written by suites as soon as they are done.
+
+    Place for attributes of "testsuites" is reserved at open
+    and they are written at close. Closing tag is written after
+    each suite, so report is valid if program was killed.
+    """
+
+    # bytes which are reserved for totals of "testsuites"
+    HEADER_RESERVE = 160
+
+    CLOSING_TAG = u'</testsuites>'.encode('utf-8')
+
+    def __init__(self, file_path, name):
+        self.__fp = None
+        self.__name = name
+        self.__file_path = file_path
+
+        self.__header_size = 0
+        self.__was_written = False
+        self.__lock = threading.Lock()
+
+    @property
+    def file_path(self):
+        return self.__file_path
+
+    def __write_header(self, header):
+        header = header.encode('utf-8')
+        padding = self.__header_size - len(header) - 1
+
+        assert padding >= 0, 'reserved place of report header is exceeded'
+
+        self.__fp.seek(0)
+        self.__fp.write(header + b' ' * padding + b'>')
+
+    def __write_to_end(self, data):
+        self.__fp.seek(-len(self.CLOSING_TAG), os.SEEK_END)
+        self.__fp.write(data.encode('utf-8') + self.CLOSING_TAG)
+        self.__fp.flush()
+
+    def open(self):
+        header = render_header(name=self.__name)
+        self.__header_size = len(header.encode('utf-8')) + self.HEADER_RESERVE + 1
+
+        self.__fp = open(self.__file_path, 'wb')
+        self.__write_header(header)
+        self.__fp.write(self.CLOSING_TAG)
+        self.__fp.flush()
+
+    def write(self, result_proxy):
+        data = render_result_proxy(result_proxy)
+
+        with self.__lock:
+            self.__write_to_end(data)
+            self.__was_written = True
+
+    def close(self, result):
+        with self.__lock:
+            if not self.__was_written:
+                self.__write_to_end(render_result_proxy(result))
+
+            self.__write_header(render_header(result))
+            self.__fp.close()
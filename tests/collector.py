@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import unittest
+import sys
+import os
+
+from mock import Mock, patch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/' + '..')
+from seismograph import collector
+from seismograph.case import Case
+from seismograph.suite import Suite
+from seismograph.suite import BuildRule
+from seismograph.exceptions import LoaderError
+
+
+class SplitToShardsTests(unittest.TestCase):
+    def testBalance(self):
+        weights = {'a': 5, 'b': 4, 'c': 3, 'd': 3, 'e': 1}
+        shards = collector.split_to_shards(list(weights), 2, weights.get)
+
+        self.assertEqual(
+            [8, 8], [sum(weights[u] for u in s) for s in shards],
+        )
+
+    def testEachUnitOnce(self):
+        units = ['u{}'.format(i) for i in range(20)]
+        shards = collector.split_to_shards(units, 3, lambda u: 1)
+
+        self.assertEqual(sorted(units), sorted(u for s in shards for u in s))
+
+    def testNotDependingOnOrder(self):
+        units = ['u{}'.format(i) for i in range(10)]
+        first = collector.split_to_shards(units, 4, lambda u: 1)
+        second = collector.split_to_shards(units[::-1], 4, lambda u: 1)
+
+        self.assertEqual(first, second)
+
+
+class ApplyRulesTests(unittest.TestCase):
+    def setUp(self):
+        self.first = Mock()
+        self.first.name = 'first'
+        self.second = Mock()
+        self.second.name = 'second'
+        self.suites = [self.first, self.second]
+
+    def testSuitesInOrderOfRules(self):
+        rules = [
+            BuildRule('first', case_name='A'),
+            BuildRule('second'),
+            BuildRule('first', case_name='B'),
+        ]
+        suites, not_applied = collector.apply_rules(self.suites, rules)
+
+        self.assertEqual([self.first, self.second], suites)
+        self.assertEqual([], not_applied)
+        self.assertEqual(
+            ['first:B', 'first:A'],
+            [str(c[0][0]) for c in self.first.assign_build_rule.call_args_list],
+        )
+
+    def testIndexIsUsed(self):
+        index = {'first': self.first}
+
+        with patch('seismograph.collector.loader.make_suite_index') as make_index:
+            suites, _ = collector.apply_rules(self.suites, [BuildRule('first')], index=index)
+
+        self.assertFalse(make_index.called)
+        self.assertEqual([self.first], suites)
+
+    def testNotIndexedSuite(self):
+        suites, _ = collector.apply_rules(self.suites, [BuildRule('second')], index={})
+        self.assertEqual([self.second], suites)
+
+    def testUnknownSuite(self):
+        self.assertRaises(
+            LoaderError, collector.apply_rules, self.suites, [BuildRule('nope')],
+        )
+
+
+class FakeProgram(object):
+    def __init__(self):
+        self.suites = []
+        self.config = Mock(REPEAT=0)
+
+    def __class_name__(self):
+        return 'program'
+
+
+class LazyBuildTests(unittest.TestCase):
+    def setUp(self):
+        created = self.created = []
+
+        class LazyCase(Case):
+            def __init__(self, *args, **kwargs):
+                created.append(args[0])
+                super(LazyCase, self).__init__(*args, **kwargs)
+
+            def test_one(self):
+                pass
+
+            def test_two(self):
+                pass
+
+        self.suite = Suite('lazy')
+        self.suite.register(LazyCase)
+        self.suite.mount_to(FakeProgram())
+
+    def testCasesAreCreatedOnIteration(self):
+        suites = list(collector.base_generator([self.suite], lazy=True))
+
+        self.assertEqual([self.suite], suites)
+        self.assertEqual([], self.created)
+
+        self.assertEqual(1, len(list(self.suite)))
+        self.assertEqual(['test_one', 'test_two'], self.created)
+
+    def testTestsOfLazySuite(self):
+        list(collector.base_generator([self.suite], lazy=True))
+
+        self.assertEqual(
+            ['test_one', 'test_two'], [name for _, name in self.suite.iter_tests()],
+        )
+        self.assertEqual([], self.created)
+
+    def testCaseByName(self):
+        self.assertEqual('LazyCase', self.suite.get_case('LazyCase').__name__)
+        self.assertIsNone(self.suite.get_case('Nope'))
+
+    def testExcludeCases(self):
+        list(collector.base_generator([self.suite], lazy=True))
+
+        [box] = list(self.suite)
+        first, second = list(box)
+
+        self.suite._exclude_cases(set([first.id]))
+        self.assertEqual([[second]], [list(b) for b in self.suite])
+
+        self.suite._exclude_cases(set([second.id]))
+        self.assertEqual([], list(self.suite))
+
+    def testWrongCommandIsFoundOnBuild(self):
+        rules = [BuildRule('lazy', case_name='Nope')]
+        generator = collector.generator_by_commands([self.suite], rules, lazy=True)
+
+        self.assertRaises(LoaderError, list, generator)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+import unittest
+import tempfile
+import shutil
+import json
+import sys
+import os
+
+from mock import Mock, patch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/' + '..')
+from seismograph import loader as _loader
+from seismograph import discovery as _discovery
+from seismograph.suite import Suite
+
+
+MODULE_WITH_SUITE = '''
+from seismograph import Suite
+
+suite = Suite('{}')
+'''
+
+MODULE_WITHOUT_SUITE = '''
+VALUE = 1
+'''
+
+
+class SuitesPathTestCase(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.package = os.path.basename(self.path)
+        self.cache_path = os.path.join(self.path, 'cache.json')
+
+        sys.path.append(os.path.dirname(self.path))
+        self.write('__init__.py', '')
+        self.write('first.py', MODULE_WITH_SUITE.format('first'))
+        self.write('second.py', MODULE_WITH_SUITE.format('second'))
+        self.write('helpers.py', MODULE_WITHOUT_SUITE)
+
+    def tearDown(self):
+        sys.path.remove(os.path.dirname(self.path))
+        shutil.rmtree(self.path)
+
+        for name in list(sys.modules):
+            if name.startswith(self.package):
+                del sys.modules[name]
+
+    def write(self, file_name, source):
+        with open(os.path.join(self.path, file_name), 'w') as fp:
+            fp.write(source)
+
+
+
+class DiscoveryTests(SuitesPathTestCase):
+    def load(self, suite_names=None, path=None, package=None):
+        cache = _discovery.DiscoveryCache(self.cache_path)
+        cache.add_root(path or self.path)
+
+        with patch('seismograph.loader.load_module', wraps=_loader.load_module) as load_module:
+            suites = list(
+                _loader.load_suites_from_path(
+                    path or self.path, Suite, package=package or self.package,
+                    cache=cache, suite_names=suite_names,
+                ),
+            )
+
+        if cache.is_changed:
+            cache.save()
+
+        loaded = sorted(c[0][0] for c in load_module.call_args_list)
+        return sorted(s.name for s in suites), loaded
+
+    def testFirstLoadImportsAll(self):
+        names, loaded = self.load()
+        self.assertEqual(['first', 'second'], names)
+        self.assertEqual(['first', 'helpers', 'second'], loaded)
+
+        with open(self.cache_path) as fp:
+            data = json.load(fp)
+
+        entry = data[os.path.join(self.path, 'first.py')]
+        self.assertEqual({'suite': 'first'}, entry['suites'])
+        self.assertEqual({}, data[os.path.join(self.path, 'helpers.py')]['suites'])
+
+    def testModuleWithoutSuitesIsSkipped(self):
+        self.load()
+        names, loaded = self.load()
+        self.assertEqual(['first', 'second'], names)
+        self.assertEqual(['first', 'second'], loaded)
+
+    def testOnlyRequiredSuitesAreImported(self):
+        self.load()
+        names, loaded = self.load(suite_names=set(['second']))
+        self.assertEqual(['second'], names)
+        self.assertEqual(['second'], loaded)
+
+    def testChangedModuleIsImported(self):
+        self.load()
+        self.write('helpers.py', MODULE_WITH_SUITE.format('helpers'))
+
+        names, loaded = self.load(suite_names=set(['helpers']))
+        self.assertEqual(['helpers'], names)
+        self.assertEqual(['helpers'], loaded)
+
+    def testRemovedModuleIsDropped(self):
+        self.load()
+        os.remove(os.path.join(self.path, 'second.py'))
+        self.load()
+
+        cache = _discovery.DiscoveryCache(self.cache_path)
+        self.assertEqual(2, len(cache))
+        self.assertNotIn(os.path.join(self.path, 'second.py'), cache)
+
+    def testOtherPathKeepsEntries(self):
+        self.load()
+
+        other = os.path.join(self.path, 'other')
+        os.mkdir(other)
+        self.write(os.path.join('other', '__init__.py'), '')
+        self.write(os.path.join('other', 'third.py'), MODULE_WITH_SUITE.format('third'))
+
+        names, _ = self.load(path=other, package='{}.other'.format(self.package))
+        self.assertEqual(['third'], names)
+
+        cache = _discovery.DiscoveryCache(self.cache_path)
+        self.assertIn(os.path.join(self.path, 'first.py'), cache)
+        self.assertIn(os.path.join(other, 'third.py'), cache)
+
+    def testModuleRegisteringOnOtherSuiteIsImported(self):
+        self.write('_common.py', MODULE_WITH_SUITE.format('shared'))
+        self.write(
+            'third.py',
+            'from seismograph import Case\n'
+            'from . import _common\n\n'
+            '@_common.suite.register\n'
+            'class SharedCase(Case):\n'
+            '    def test(self):\n'
+            '        pass\n',
+        )
+
+        self.load()
+        _, loaded = self.load(suite_names=set(['shared']))
+        self.assertEqual(['third'], loaded)
+
+    def testBrokenCacheIsRebuilt(self):
+        self.write('cache.json', '{')
+        names, loaded = self.load()
+        self.assertEqual(['first', 'second'], names)
+        self.assertEqual(3, len(_discovery.DiscoveryCache(self.cache_path)))
+
+    def testSuiteNamesOfConfig(self):
+        config = Mock(TESTS=['first:Case.test', 'second'])
+        self.assertEqual(set(['first', 'second']), _discovery.get_suite_names(config))
+
+        config = Mock(TESTS=[])
+        self.assertIsNone(_discovery.get_suite_names(config))
+
+
+class ScanTests(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def scan(self, source, module_name='pack.module'):
+        file_path = os.path.join(self.path, 'module.py')
+
+        with open(file_path, 'w') as fp:
+            fp.write(source)
+
+        return _discovery.scan_module((file_path, module_name, ('MySuiteClass', )))
+
+    def testLiteralNames(self):
+        names = self.scan(
+            'import seismograph\n'
+            'first = seismograph.Suite("first")\n'
+            'second = SeleniumSuite(name="second", require=["selenium"])\n',
+        )
+        self.assertEqual(set(['first', 'second']), names)
+
+    def testNameOfModule(self):
+        self.assertEqual(set(['pack.module']), self.scan('suite = Suite(__name__)\n'))
+
+    def testClassOfProgram(self):
+        self.assertEqual(set(['name']), self.scan('suite = MySuiteClass("name")\n'))
+
+    def testWithoutSuites(self):
+        self.assertIsNone(self.scan('def helper():\n    return Case("name")\n'))
+
+    def testImportOfNames(self):
+        self.assertIsNone(self.scan('from ._common import suite\n'))
+        self.assertIsNone(self.scan('from pack import helpers\nsuite = Suite("name")\n'))
+        self.assertEqual(
+            set(['name']),
+            self.scan('from seismograph import Suite\nsuite = Suite("name")\n'),
+        )
+
+    def testRegisterOnOtherSuite(self):
+        self.assertIsNone(
+            self.scan('import common\nsuite = Suite("name")\n\n@common.suite.register\ndef test():\n    pass\n'),
+        )
+        self.assertEqual(
+            set(['name']),
+            self.scan('suite = Suite("name")\n\n@suite.register\ndef test():\n    pass\n'),
+        )
+
+    def testUnknownName(self):
+        self.assertIsNone(self.scan('suite = Suite("prefix" + NAME)\n'))
+
+    def testSyntaxError(self):
+        self.assertIsNone(self.scan('suite = Suite(\n'))
+
+    def testScanInPool(self):
+        modules = []
+
+        for i in range(4):
+            file_path = os.path.join(self.path, 'm{}.py'.format(i))
+
+            with open(file_path, 'w') as fp:
+                fp.write('suite = Suite("s{}")\n'.format(i))
+
+            modules.append((file_path, 'm{}'.format(i)))
+
+        with patch.object(_discovery, 'SCAN_POOL_THRESHOLD', 2):
+            result = _discovery.scan_modules(modules)
+
+        self.assertEqual(
+            dict((f, set(['s{}'.format(i)])) for i, (f, _) in enumerate(modules)),
+            result,
+        )
+
+
+class LoadWithScanTests(SuitesPathTestCase):
+    def load(self, suite_names=None):
+        scan = _discovery.prescan(self.path, Suite)
+
+        with patch('seismograph.loader.load_module', wraps=_loader.load_module) as load_module:
+            suites = list(
+                _loader.load_suites_from_path(
+                    self.path, Suite, package=self.package,
+                    scan=scan, suite_names=suite_names,
+                ),
+            )
+
+        self.suites = suites
+        loaded = sorted(c[0][0] for c in load_module.call_args_list)
+        return sorted(s.name for s in suites), loaded
+
+    def testOnlyRequiredSuitesAreImported(self):
+        names, loaded = self.load(suite_names=set(['second']))
+        self.assertEqual(['second'], names)
+        # suites of helpers are unknown by source
+        self.assertEqual(['helpers', 'second'], loaded)
+
+    def testCasesOnSuiteOfOtherModule(self):
+        self.write('_common.py', MODULE_WITH_SUITE.format('shared'))
+        self.write(
+            'third.py',
+            'from seismograph import Case\n'
+            'from ._common import suite\n\n'
+            '@suite.register\n'
+            'class SharedCase(Case):\n'
+            '    def test(self):\n'
+            '        pass\n',
+        )
+
+        names, loaded = self.load(suite_names=set(['shared']))
+        self.assertEqual(['shared'], names)
+        self.assertEqual(['helpers', 'third'], loaded)
+        self.assertEqual(['SharedCase'], [c.__name__ for c in self.suites[0].cases])
+
+    def testAllModulesAreImportedWithoutNames(self):
+        names, loaded = self.load()
+        self.assertEqual(['first', 'second'], names)
+        self.assertEqual(['first', 'helpers', 'second'], loaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import unittest
+import json
+import time
+import sys
+import os
+
+from mock import patch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/' + '..')
+from seismograph import events as _events
+
+
+class EventWriterTests(unittest.TestCase):
+    def setUp(self):
+        self.read_fd, self.write_fd = os.pipe()
+        self.writer = _events.EventWriter(self.write_fd, close_fd=True)
+
+    def tearDown(self):
+        self.writer.close()
+        os.close(self.read_fd)
+
+    def read(self):
+        self.writer.close()
+
+        data = b''
+        while True:
+            chunk = os.read(self.read_fd, 65536)
+            if not chunk:
+                break
+            data += chunk
+
+        return [json.loads(line) for line in data.decode('utf-8').splitlines()]
+
+    def testLines(self):
+        self.writer.emit('case_start', test='test (suite:Case)')
+        self.writer.emit('success', runtime=0.5)
+
+        lines = self.read()
+        self.assertEqual(['case_start', 'success'], [l['event'] for l in lines])
+        self.assertEqual('test (suite:Case)', lines[0]['test'])
+        self.assertEqual(0.5, lines[1]['runtime'])
+        self.assertEqual(os.getpid(), lines[1]['worker'])
+
+    def testBufferedUntilEventOfStart(self):
+        with patch('os.write') as write:
+            self.writer.emit('case_start')
+            self.writer.emit('success')
+            self.assertFalse(write.called)
+
+            self.writer.emit('suite_start')
+            self.assertEqual(1, write.call_count)
+
+    @patch('seismograph.events.FLUSH_INTERVAL', 0.01)
+    def testFlushByTimer(self):
+        with patch('os.write') as write:
+            self.writer.emit('success')
+
+            for _ in range(100):
+                if write.called:
+                    break
+                time.sleep(0.01)
+
+            self.assertEqual(1, write.call_count)
+
+    @patch('seismograph.events.WRITE_SIZE', 100)
+    def testWriteByChunks(self):
+        with patch('os.write') as write:
+            for _ in range(10):
+                self.writer.emit('success', reason='x' * 40)
+            self.writer.flush()
+
+        self.assertEqual(10, write.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,405 @@
+# -*- coding: utf-8 -*-
+import unittest
+import threading
+import multiprocessing
+import marshal
+import itertools
+import time
+import sys
+import os
+
+from mock import Mock, MagicMock, patch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/' + '..')
+from seismograph.case import Case
+from seismograph.case import CaseBox
+from seismograph.suite import Suite
+from seismograph.utils import pyv
+from seismograph.result import Result
+from seismograph.runnable import RunnableObject
+from seismograph.groups.threading import SharedExecutor
+from seismograph.xunit import XUnitData
+from seismograph.groups import multiprocessing as _mp
+from seismograph.groups.multiprocessing import MPResult
+from seismograph.groups.multiprocessing import ResultChannel
+from seismograph.exceptions import EmergencyStop
+from seismograph.exceptions import WorkerError
+from seismograph.exceptions import CaseTimeout
+
+if pyv.IS_PYTHON_3:
+    import asyncio
+    from seismograph.groups import asyncio as _asyncio
+
+
+class SharedExecutorTests(unittest.TestCase):
+    def setUp(self):
+        self.executor = SharedExecutor(3)
+        self.executor.start()
+        self.lock = threading.Lock()
+        self.running = 0
+        self.maxRunning = 0
+
+    def task(self):
+        with self.lock:
+            self.running += 1
+            self.maxRunning = max(self.maxRunning, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+
+    def testLimitOfGroup(self):
+        self.executor.run([self.task] * 10, limit=2)
+        self.assertEqual(2, self.maxRunning)
+
+    def testNestedGroupsUnderGlobalCap(self):
+        def suite():
+            self.executor.run([self.task] * 5, limit=3)
+
+        self.executor.run([suite] * 4, limit=3)
+        self.assertEqual(0, self.running)
+        self.assertTrue(self.maxRunning <= 3)
+
+    def testErrorIsRaisedAfterAll(self):
+        done = []
+
+        def fail():
+            raise ValueError('fail')
+
+        self.assertRaises(
+            ValueError, self.executor.run, [fail, lambda: done.append(1)], limit=1,
+        )
+        self.assertEqual([1], done)
+
+    def testEmergencyStopCancelsQueued(self):
+        done = []
+
+        def stop():
+            raise EmergencyStop('stop')
+
+        self.assertRaises(
+            EmergencyStop, self.executor.run, [stop, lambda: done.append(1)], limit=1,
+        )
+        self.assertEqual([], done)
+
+    def tearDown(self):
+        self.executor.stop()
+
+
+class ParallelCase(object):
+    __repeatable__ = True
+    __parallel_methods__ = True
+
+    calls = []
+
+    def __init__(self):
+        self.config = Mock(REPEAT=0)
+
+    @classmethod
+    def setup_class(cls):
+        cls.calls.append('setup_class')
+
+    @classmethod
+    def teardown_class(cls):
+        cls.calls.append('teardown_class')
+
+
+class CaseBoxTests(unittest.TestCase):
+    @patch('seismograph.groups.make_case_group')
+    def testParallelMethods(self, mockMakeGroup):
+        cases = [ParallelCase() for _ in range(3)]
+        mockMakeGroup.return_value = Mock(side_effect=lambda r: ParallelCase.calls.append('group'))
+
+        CaseBox(cases)(Mock())
+
+        mockMakeGroup.assert_called_once_with(cases, cases[0].config)
+        self.assertEqual(['setup_class', 'group', 'teardown_class'], ParallelCase.calls)
+
+
+class LostCase(RunnableObject):
+    def __class_name__(self):
+        return 'suite.LostCase'
+
+    def __method_name__(self):
+        return 'test'
+
+
+class LostSuite(LostCase):
+    config = Mock(LOW_MEMORY=False)
+
+    def __init__(self, cases):
+        super(LostSuite, self).__init__()
+        self.cases = cases
+
+    def __iter__(self):
+        return iter(self.cases)
+
+
+class MPResultTests(unittest.TestCase):
+    def setUp(self):
+        self.result = Mock(errors=[], skipped=[], proxies=[])
+        self.mp_result = MPResult(self.result)
+        self.proxy = Result(Mock(LOW_MEMORY=False), is_proxy=True, stream=Mock())
+
+        self.case = LostCase()
+        self.suite = LostSuite([self.case])
+
+        self.worker = Mock(
+            result_proxy=self.proxy, suite_id=self.suite.id, suite_started=time.time(), suite_runtime=0.0,
+        )
+        self.worker.process.exitcode = 3
+
+    def testLostWorkerClosesSuite(self):
+        with patch.dict(MPResult.MATCH, {self.suite.id: self.suite, self.case.id: self.case}):
+            self.mp_result.lose(self.worker)
+
+        self.assertIsNone(self.worker.result_proxy)
+        self.assertEqual([self.proxy], self.result.proxies)
+        self.assertEqual(self.suite, self.proxy.errors[0][0])
+        self.assertTrue(self.proxy.errors[0][1].exc_type.endswith(WorkerError.__name__))
+        self.assertEqual([(self.case, self.proxy.skipped.get(self.case))], list(self.proxy.skipped))
+        self.result.write_to_report.assert_called_once_with(self.proxy)
+
+    def testWorkerWithoutSuite(self):
+        self.worker.result_proxy = None
+        self.mp_result.lose(self.worker)
+
+        self.assertEqual([], self.result.errors)
+        self.assertFalse(self.result.write_to_report.called)
+
+
+    @patch('seismograph.groups.multiprocessing.resources')
+    def testKillSuspendsSuite(self, _):
+        other = LostCase()
+        self.suite.cases.append(other)
+        now = time.time()
+
+        with patch.dict(MPResult.MATCH, {self.suite.id: self.suite, self.case.id: self.case}):
+            done = self.mp_result.kill(self.worker, [(self.case.id, now - 3.0, now - 1.0)])
+
+        self.assertEqual(set([self.case.id]), done)
+        self.assertIsNone(self.worker.result_proxy)
+        self.assertEqual([], self.result.proxies)
+        self.assertEqual([self.case], [c for c, _ in self.proxy.errors])
+        self.assertEqual(self.proxy, self.mp_result.suspended[self.suite.id][0])
+
+        # replacement of worker begins the rest of suite
+        worker = Mock(result_proxy=None)
+
+        with patch.dict(MPResult.MATCH, {self.suite.id: self.suite}):
+            self.mp_result.receive(worker, [(_mp.RECORD_BEGIN, self.suite.id)])
+            self.mp_result.receive(worker, [(_mp.RECORD_END, self.suite.id, 1.0)])
+
+        self.assertEqual({}, self.mp_result.suspended)
+        self.assertEqual([self.proxy], self.result.proxies)
+        self.assertTrue(self.proxy.runtime > 1.0)
+
+    @patch('seismograph.groups.multiprocessing.resources')
+    def testOtherRunningCaseIsNotDone(self, _):
+        other = LostCase()
+        self.suite.cases.append(other)
+        now = time.time()
+
+        with patch.dict(MPResult.MATCH, {self.suite.id: self.suite, self.case.id: self.case, other.id: other}):
+            done = self.mp_result.kill(
+                self.worker, [(self.case.id, now - 3.0, now - 1.0), (other.id, now - 1.0, now + 1.0)],
+            )
+
+        self.assertEqual(set([self.case.id]), done)
+
+    @patch('seismograph.groups.multiprocessing.resources')
+    def testKillOfLastCaseClosesSuite(self, _):
+        now = time.time()
+
+        with patch.dict(MPResult.MATCH, {self.suite.id: self.suite, self.case.id: self.case}):
+            done = self.mp_result.kill(self.worker, [(self.case.id, now - 3.0, now - 1.0)])
+
+        self.assertIsNone(done)
+        self.assertEqual({}, self.mp_result.suspended)
+        self.assertEqual([self.proxy], self.result.proxies)
+        self.assertEqual([], list(self.proxy.skipped))
+
+    def testReceive(self):
+        self.worker.result_proxy = None
+        self.result.successes = []
+        self.result.create_proxy.return_value = self.proxy
+
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        channel = ResultChannel(writer)
+        self.addCleanup(reader.close)
+
+        channel.put((_mp.RECORD_BEGIN, self.suite.id))
+        channel.send('successes', self.case, XUnitData(runtime=1.0))
+        channel.put((_mp.RECORD_END, self.suite.id, 2.0))
+        channel.close()
+
+        with patch.dict(MPResult.MATCH, {self.suite.id: self.suite, self.case.id: self.case}):
+            for _ in range(3):
+                self.mp_result.receive(self.worker, marshal.loads(reader.recv_bytes()))
+
+        self.assertIsNone(self.worker.result_proxy)
+        self.assertEqual(self.suite.id, self.worker.suite_id)
+        self.assertEqual([self.proxy], self.result.proxies)
+        self.assertEqual(2.0, self.proxy.runtime)
+        self.assertEqual(1.0, self.proxy.successes.get(self.case).runtime)
+        self.assertEqual([self.case], [c for c, _ in self.result.successes])
+        self.result.write_to_report.assert_called_once_with(self.proxy)
+
+
+class ResultChannelTests(unittest.TestCase):
+    def setUp(self):
+        self.connection = Mock()
+        self.channel = ResultChannel(self.connection)
+
+    def sent(self):
+        return [marshal.loads(c[0][0]) for c in self.connection.send_bytes.call_args_list]
+
+    def testRecordIsSentAtOnce(self):
+        self.channel.put(('begin', 1))
+        self.channel.send('successes', Mock(id=2), Mock(to_dict=Mock(return_value={})))
+
+        self.assertEqual([[('begin', 1)], [('successes', 2, {})]], self.sent())
+
+    def testRecordsOfWaitingThreadsAreSentByOneBatch(self):
+        sending = threading.Event()
+        release = threading.Event()
+
+        def send_bytes(data):
+            if not sending.is_set():
+                sending.set()
+                release.wait(5)
+
+        self.connection.send_bytes.side_effect = send_bytes
+
+        first = threading.Thread(target=self.channel.put, args=(1,))
+        first.start()
+        sending.wait(5)
+
+        others = [threading.Thread(target=self.channel.put, args=(i,)) for i in (2, 3)]
+        for thread in others:
+            thread.start()
+
+        # records are waiting for end of the first batch
+        time.sleep(0.1)
+
+        release.set()
+        for thread in [first] + others:
+            thread.join(5)
+
+        self.assertEqual([[1], [2, 3]], self.sent())
+
+    def testEmptyFlush(self):
+        self.channel.flush()
+        self.assertFalse(self.connection.send_bytes.called)
+
+    def testClose(self):
+        self.channel.close()
+
+        self.assertFalse(self.connection.send_bytes.called)
+        self.connection.close.assert_called_once_with()
+
+
+class Awaitable(object):
+    def __init__(self, calls, error=None, delay=0):
+        self.calls = calls
+        self.error = error
+        self.delay = delay
+
+    def __await__(self):
+        self.calls.append(threading.current_thread())
+        sleep = asyncio.ensure_future(asyncio.sleep(self.delay))
+        return itertools.chain(sleep.__await__(), self.raise_error())
+
+    def raise_error(self):
+        if self.error is not None:
+            raise self.error
+        yield
+
+
+class AsyncioCase(Case):
+    calls = []
+
+    def setup(self):
+        return Awaitable(self.calls)
+
+    def test_success(self):
+        return Awaitable(self.calls)
+
+    def test_fail(self):
+        return Awaitable(self.calls, error=AssertionError('fail'))
+
+    def test_error(self):
+        return Awaitable(self.calls, error=ValueError('error'))
+
+    def test_timeout(self):
+        return Awaitable(self.calls, delay=10)
+
+
+Suite('asyncio').register(AsyncioCase)
+
+
+@unittest.skipIf(pyv.IS_PYTHON_2, 'asyncio is allowed for python 3 only')
+class AsyncioTests(unittest.TestCase):
+    def setUp(self):
+        self.config = MagicMock(
+            REPEAT=0, TEST_TIMEOUT=None, ASYNC_SUITES=1, ASYNC_TESTS=4, GEVENT=False,
+        )
+        self.result = MagicMock()
+        self.result.current_state.should_stop = False
+        self.proxy = self.result.proxy.return_value.__enter__.return_value
+        AsyncioCase.calls = []
+
+    def tearDown(self):
+        _asyncio.stop_loop()
+
+    def testCoroutineOfTestIsAwaited(self):
+        AsyncioCase('test_success', config=self.config)(self.result)
+
+        self.assertEqual(1, self.proxy.add_success.call_count)
+        # setup and test are awaited
+        self.assertEqual(2, len(AsyncioCase.calls))
+
+    def testFailAndErrorOfCoroutine(self):
+        AsyncioCase('test_fail', config=self.config)(self.result)
+        self.assertEqual(1, self.proxy.add_fail.call_count)
+
+        AsyncioCase('test_error', config=self.config)(self.result)
+        self.assertEqual(1, self.proxy.add_error.call_count)
+
+        self.assertFalse(self.proxy.add_success.called)
+
+    def testCoroutinesOfGroupAreAwaitedOnOneLoop(self):
+        cases = [AsyncioCase('test_success', config=self.config) for _ in range(4)]
+
+        _asyncio.AsyncioSuiteGroup(
+            [_asyncio.AsyncioCaseGroup(cases, self.config)], self.config,
+        )(self.result)
+
+        self.assertEqual(4, self.proxy.add_success.call_count)
+        self.assertEqual(8, len(AsyncioCase.calls))
+        self.assertEqual(1, len(set(AsyncioCase.calls)))
+        self.assertNotEqual(threading.current_thread(), AsyncioCase.calls[0])
+        self.assertIsNone(_asyncio.loop)
+
+    def testTimeoutOfCoroutine(self):
+        case = AsyncioCase('test_timeout', config=self.config)
+        case.__timeout__ = 0.1
+
+        start = time.time()
+        case(self.result)
+
+        self.assertLess(time.time() - start, 5)
+        self.assertEqual(1, self.proxy.add_error.call_count)
+        self.assertIsInstance(self.proxy.add_error.call_args[0][3], CaseTimeout)
+
+    def testSkipOfCase(self):
+        case = AsyncioCase('test_success', config=self.config)
+        case.__skip__ = True
+
+        case(self.result)
+
+        self.assertEqual((case, 'no reason'), self.proxy.add_skip.call_args[0][:2])
+        self.assertEqual([], AsyncioCase.calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import unittest
+import tempfile
+import shutil
+import json
+import sys
+import os
+
+from mock import Mock, patch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/' + '..')
+import seismograph.history as _history
+from seismograph.case import CaseBox
+
+
+def rule_of(case):
+    return case.rule
+
+
+class RuntimeHistoryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpDir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpDir, 'history.json')
+
+        with open(self.path, 'w') as fp:
+            json.dump({'s:A.test_1': 3.0, 's:A.test_2': 1.0}, fp)
+
+        self.patcherRule = patch('seismograph.history.get_rule_of_case', rule_of)
+        self.patcherRule.start()
+
+    def testLoad(self):
+        history = _history.RuntimeHistory(self.path)
+        self.assertEqual(3.0, history.get('s:A.test_1'))
+        self.assertEqual(2, len(history))
+
+    def testNotExistingFile(self):
+        history = _history.RuntimeHistory(os.path.join(self.tmpDir, 'nope.json'))
+        self.assertEqual(0, len(history))
+        self.assertEqual(0.0, history.average)
+
+    def testBrokenFile(self):
+        with open(self.path, 'w') as fp:
+            fp.write('{')
+
+        history = _history.RuntimeHistory(self.path)
+        self.assertEqual(0, len(history))
+        self.assertEqual(0.0, history.average)
+
+    def testCostOfUnknownIsAverage(self):
+        history = _history.RuntimeHistory(self.path)
+        self.assertEqual(2.0, history.cost(Mock(rule='s:A.test_3')))
+
+    def testCostOfBox(self):
+        history = _history.RuntimeHistory(self.path)
+        box = CaseBox([Mock(rule='s:A.test_1'), Mock(rule='s:A.test_2')])
+        self.assertEqual(4.0, history.cost(box))
+
+    def testOrderCasesLongestFirst(self):
+        history = _history.RuntimeHistory(self.path)
+        short, long = Mock(rule='s:A.test_2'), Mock(rule='s:A.test_1')
+        cases = [short, long]
+        history.order_cases(cases)
+        self.assertEqual([long, short], cases)
+
+    @patch('seismograph.history.Case', Mock)
+    def testUpdateAndSave(self):
+        history = _history.RuntimeHistory(self.path)
+        result = Mock(
+            successes=[(Mock(rule='s:A.test_2'), Mock(runtime=5.0))],
+            failures=[],
+            errors=[(Mock(rule='s:B.test'), Mock(runtime=0.5))],
+        )
+        history.update(result)
+        history.save()
+
+        history = _history.RuntimeHistory(self.path)
+        self.assertEqual(5.0, history.get('s:A.test_2'))
+        self.assertEqual(0.5, history.get('s:B.test'))
+        self.assertEqual(3.0, history.get('s:A.test_1'))
+
+    def testPathToSave(self):
+        config = Mock(RUNTIME_HISTORY=self.path, SHARD_COUNT=0, SHARD_INDEX=0)
+        self.assertEqual(self.path, _history.get_path_to_save(config))
+
+        config.SHARD_COUNT, config.SHARD_INDEX = 3, 1
+        self.assertEqual(
+            os.path.join(self.tmpDir, 'history.shard1.json'), _history.get_path_to_save(config),
+        )
+
+    def tearDown(self):
+        self.patcherRule.stop()
+        shutil.rmtree(self.tmpDir)
+
+
+if __name__ == '__main__':
+    unittest.main()
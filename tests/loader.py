@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import unittest
+import sys
+import os
+
+from mock import patch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/' + '..')
+from seismograph import runnable
+from seismograph import loader as _loader
+from seismograph.case import Case
+from seismograph.steps import step
+from seismograph.suite import Suite
+from seismograph.exceptions import LoaderError
+
+
+class BaseCase(Case):
+    def test_base(self):
+        pass
+
+
+class ChildCase(BaseCase):
+    def test_child(self):
+        pass
+
+    def check_other(self):
+        pass
+
+
+class StepsCase(Case):
+    @step(2)
+    def second(self):
+        pass
+
+    @step(1)
+    def first(self):
+        pass
+
+
+class TestNamesTests(unittest.TestCase):
+    def testNamesOnCreationOfClass(self):
+        self.assertIn(_loader.TEST_NAMES_ATTRIBUTE_NAME, ChildCase.__dict__)
+        self.assertEqual(('test_base', 'test_child'), _loader.get_test_names_of_case(ChildCase))
+        self.assertEqual(('test_base', ), _loader.get_test_names_of_case(BaseCase))
+
+    def testDefaultTestOfSteps(self):
+        self.assertEqual(('test', ), _loader.get_test_names_of_case(StepsCase))
+        self.assertEqual(
+            ['first', 'second'],
+            [m.__name__ for m in StepsCase.__step_methods__],
+        )
+
+    def testOtherPrefix(self):
+        with patch.object(_loader, 'TEST_NAME_PREFIX', 'check'):
+            self.assertEqual(('check_other', ), _loader.get_test_names_of_case(ChildCase))
+
+        self.assertEqual(('test_base', 'test_child'), _loader.get_test_names_of_case(ChildCase))
+
+    def testNewTestMethod(self):
+        class NewCase(Case):
+            def test_one(self):
+                pass
+
+        self.assertEqual(('test_one', ), _loader.get_test_names_of_case(NewCase))
+
+        NewCase.test_two = lambda self: None
+        self.assertEqual(('test_one', 'test_two'), _loader.get_test_names_of_case(NewCase))
+
+        del NewCase.test_one
+        self.assertEqual(('test_two', ), _loader.get_test_names_of_case(NewCase))
+
+    def testNewTestMethodOfBaseClass(self):
+        class NewBaseCase(Case):
+            def test_one(self):
+                pass
+
+        class NewChildCase(NewBaseCase):
+            pass
+
+        class NewGrandChildCase(NewChildCase):
+            pass
+
+        self.assertEqual(('test_one', ), _loader.get_test_names_of_case(NewGrandChildCase))
+
+        NewBaseCase.test_two = lambda self: None
+        self.assertEqual(('test_one', 'test_two'), _loader.get_test_names_of_case(NewChildCase))
+        self.assertEqual(('test_one', 'test_two'), _loader.get_test_names_of_case(NewGrandChildCase))
+
+        del NewBaseCase.test_one
+        self.assertEqual(('test_two', ), _loader.get_test_names_of_case(NewGrandChildCase))
+
+    def testLoadTestByName(self):
+        class MountedCase(ChildCase):
+            pass
+
+        Suite('suite').register(MountedCase)
+
+        cases = list(_loader.load_tests_from_case(MountedCase, method_name='test_child'))
+        self.assertEqual(['test_child'], [runnable.method_name(c) for c in cases])
+
+        generator = _loader.load_tests_from_case(ChildCase, method_name='test_nope')
+        self.assertRaises(LoaderError, list, generator)
+
+
+if __name__ == '__main__':
+    unittest.main()
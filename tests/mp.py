@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import unittest
+import multiprocessing
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/' + '..')
+from seismograph.utils.mp import SharedMemory
+from seismograph.utils.mp import SharedString
+
+
+def write_value(shared_string, value):
+    shared_string.value = value
+
+
+def check_value(shared_string, value):
+    sys.exit(0 if shared_string.value == value else 1)
+
+
+class SharedStringTests(unittest.TestCase):
+    def setUp(self):
+        self.block = bytearray(b'\xff' * 24)
+        self.string = SharedString(self.block, 8, 8)
+
+    def testValue(self):
+        self.string.value = u'test'
+
+        self.assertEqual(u'test', self.string.value)
+        self.assertEqual(b'test\0\0\0\0', bytes(self.block[8:16]))
+
+    def testEmptyValue(self):
+        self.string.value = None
+        self.assertEqual(u'', self.string.value)
+
+        self.string.value = u''
+        self.assertEqual(u'', self.string.value)
+
+    def testOverflowIsCut(self):
+        self.string.value = u'0123456789'
+
+        self.assertEqual(u'0123456', self.string.value)
+        self.assertEqual(b'\xff' * 8, bytes(self.block[:8]))
+        self.assertEqual(b'\xff' * 8, bytes(self.block[16:]))
+
+    def testShorterValueAfterLonger(self):
+        self.string.value = u'0123456'
+        self.string.value = u'ab'
+
+        self.assertEqual(u'ab', self.string.value)
+
+    def testUnicode(self):
+        self.string.value = u'тес'
+        self.assertEqual(u'тес', self.string.value)
+
+    def testUnicodeOverflowIsCutByChar(self):
+        # 7 bytes are available, last char is cut in the middle
+        self.string.value = u'тест'
+
+        self.assertEqual(u'тес', self.string.value)
+        self.assertEqual(b'\xff' * 8, bytes(self.block[16:]))
+
+
+class SharedMemoryTests(unittest.TestCase):
+    def setUp(self):
+        self.memory = SharedMemory(string_width=8, strings_per_block=2)
+
+    def testStrings(self):
+        strings = [self.memory.string(str(i)) for i in range(5)]
+
+        self.assertEqual([u'0', u'1', u'2', u'3', u'4'], [s.value for s in strings])
+
+        strings[1].value = u'0123456789'
+        self.assertEqual(
+            [u'0', u'0123456', u'2', u'3', u'4'], [s.value for s in strings],
+        )
+
+    def testValue(self):
+        string = self.memory.Value('s', u'тес')
+        number = self.memory.Value('i', 1)
+
+        self.assertEqual(u'тес', string.value)
+        self.assertEqual(1, number.value)
+
+    def testReadOfOtherProcess(self):
+        string = self.memory.string()
+
+        process = multiprocessing.Process(
+            target=write_value, args=(string, u'тес'),
+        )
+        process.start()
+        process.join()
+
+        self.assertEqual(0, process.exitcode)
+        self.assertEqual(u'тес', string.value)
+
+    def testReadInOtherProcess(self):
+        string = self.memory.string()
+        string.value = u'test'
+
+        process = multiprocessing.Process(
+            target=check_value, args=(string, u'test'),
+        )
+        process.start()
+        process.join()
+
+        self.assertEqual(0, process.exitcode)
+
+
+if __name__ == '__main__':
+    unittest.main()
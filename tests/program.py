@@ -1,4 +1,5 @@
 import unittest
+import tempfile
 import sys
 import os
 
@@ -409,15 +410,25 @@ class ProgramInit(unittest.TestCase):
         self.program.load_suites()
         assert load_module.called
 
+    @patch('seismograph.program.discovery')
     @patch('seismograph.program.loader.load_suites_from_path')
     @patch('seismograph.program.loader.load_suites_from_module')
     @patch('seismograph.program.loader')
     @patch('seismograph.program.Program._make_result')
-    def testLoadSuitesWithPath(self,mockMakeResult ,mock_loader, load_module, load_path, mockContext, mockExt, mockExtensions):
+    def testLoadSuitesWithPath(self,mockMakeResult ,mock_loader, load_module, load_path, mock_discovery, mockContext, mockExt, mockExtensions):
         self.program = _program.Program()
         self.program.load_suites('lol')
         assert load_path.called
 
+    @patch('seismograph.program.discovery')
+    @patch('seismograph.program.loader')
+    @patch('seismograph.program.Program._make_result')
+    def testLoadSuitesSharesDiscoveryCache(self, mockMakeResult, mock_loader, mock_discovery, mockContext, mockExt, mockExtensions):
+        self.program = _program.Program()
+        self.program.load_suites('first')
+        self.program.load_suites('second')
+        self.assertEqual(1, mock_discovery.get_cache.call_count)
+
     def tearDown(self):
         self.patcherConfig.stop()
 
@@ -429,7 +440,10 @@ class ProgramMethods(unittest.TestCase):
         # self.patcherConfig = patch('seismograph.program.config')
         # self.mockConfig = self.patcherConfig.start()
 
-        self.config = Mock(OUTPUT='Test.txt')
+        fd, self.outputPath = tempfile.mkstemp()
+        os.close(fd)
+
+        self.config = Mock(OUTPUT=self.outputPath, SHARD_COUNT=0, RESOURCE_CAPACITY=None)
         _program.Program.__layers__ = None
         _program.Program.__config_class__ = Mock(return_value=self.config)
         # self.program = Program()
@@ -478,7 +492,7 @@ class ProgramMethods(unittest.TestCase):
         self.assertEqual(processingGroup, self.program._make_group())
 
     def tearDown(self):
-       pass
+        os.remove(self.outputPath)
 
 
 
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import unittest
+import sys
+import os
+
+from mock import Mock, patch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/' + '..')
+from seismograph import resources as _resources
+from seismograph.case import Case
+from seismograph.suite import Suite
+from seismograph.exceptions import ConfigError
+
+
+class ResourceLimiterTests(unittest.TestCase):
+    def setUp(self):
+        self.limiter = _resources.ResourceLimiter({'db': 2})
+
+    def testUndeclaredCapacityIsExclusive(self):
+        self.assertTrue(self.limiter.try_acquire({'grid': 1}))
+        self.assertFalse(self.limiter.try_acquire({'grid': 1}))
+        self.limiter.release({'grid': 1})
+        self.assertTrue(self.limiter.try_acquire({'grid': 1}))
+
+    def testAllOrNothing(self):
+        self.assertTrue(self.limiter.try_acquire({'grid': 1}))
+        self.assertFalse(self.limiter.try_acquire({'db': 1, 'grid': 1}))
+        self.assertTrue(self.limiter.try_acquire({'db': 2}))
+
+    def testRequiredMoreThanCapacity(self):
+        self.assertTrue(self.limiter.try_acquire({'db': 3}))
+        self.assertFalse(self.limiter.try_acquire({'db': 1}))
+        self.limiter.release({'db': 3})
+        self.assertTrue(self.limiter.try_acquire({'db': 2}))
+
+    def testIterAcquiredSkipsBusy(self):
+        self.limiter.try_acquire({'grid': 1})
+
+        objects = [Mock(name='first'), Mock(name='second')]
+        needs = {objects[0]: {'grid': 1}, objects[1]: {'db': 1}}
+
+        with patch('seismograph.resources.get_resources', needs.get):
+            acquired = self.limiter.iter_acquired(objects)
+            self.assertIs(objects[1], next(acquired))
+            self.limiter.release({'grid': 1})
+            self.assertIs(objects[0], next(acquired))
+
+
+class CheckTests(unittest.TestCase):
+    def setUp(self):
+        class DbCase(Case):
+            __resources__ = {'db': 2}
+
+            def test(self):
+                pass
+
+        self.suite = Suite('check', resources={'grid': 1})
+        self.suite.register(DbCase)
+        self.config = {'RESOURCES': {'db': 2}}
+
+    def testEnoughCapacity(self):
+        _resources.check(self.config, [self.suite])
+
+    def testRequiredMoreThanCapacity(self):
+        self.config['RESOURCES']['db'] = 1
+        self.assertRaises(ConfigError, _resources.check, self.config, [self.suite])
+
+    def testResourcesOfSuite(self):
+        self.suite.resources['grid'] = 2
+        self.assertRaises(ConfigError, _resources.check, self.config, [self.suite])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+import unittest
+import threading
+import logging
+import gc
+import weakref
+import sys
+import os
+
+from mock import Mock, patch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/' + '..')
+from seismograph import reason as _reason
+from seismograph.reason import Reason
+from seismograph.case import Case
+from seismograph.suite import Suite
+from seismograph.suite import MountData as SuiteMountData
+from seismograph.runnable import RunnableObject
+from seismograph.runnable import RunnableSnapshot
+from seismograph.xunit import XUnitData
+from seismograph.result import OutputSink
+from seismograph.result import CaptureBuffer
+from seismograph.result import LogCapture
+from seismograph.result import CaptureStream
+from seismograph.result import ResultRecord
+from seismograph.result import ResultStorage
+
+
+class ResultStorageTests(unittest.TestCase):
+    def setUp(self):
+        self.one = Mock()
+        self.two = Mock()
+        self.a = Mock(runtime=1.0)
+        self.b = Mock(runtime=2.0)
+        self.c = Mock(runtime=3.0)
+        self.storage = ResultStorage([(self.one, self.a), (self.two, self.b)])
+
+    def testGet(self):
+        self.assertEqual(self.a, self.storage.get(self.one))
+        self.assertEqual(self.b, self.storage.get(self.two))
+        self.assertEqual(None, self.storage.get(Mock()))
+
+    def testGetWaitsForLock(self):
+        found = []
+        lock = self.storage._ResultStorage__lock
+        lock.acquire()
+
+        thread = threading.Thread(target=lambda: found.append(self.storage.get(self.one)))
+        thread.start()
+        thread.join(0.05)
+        self.assertEqual([], found)
+
+        lock.release()
+        thread.join()
+        self.assertEqual([self.a], found)
+
+    def testReset(self):
+        self.assertTrue(self.storage.reset(self.one, self.c))
+        self.assertFalse(self.storage.reset(Mock(), self.c))
+
+        self.assertEqual(2, len(self.storage))
+        self.assertEqual([(self.two, self.b), (self.one, self.c)], list(self.storage))
+        self.assertEqual((self.one, self.c), self.storage[-1])
+        self.assertEqual(self.c, self.storage.get(self.one))
+        self.assertEqual(5.0, self.storage.runtime)
+
+    def testResetOfRepeatedObject(self):
+        self.storage.append((self.one, self.c))
+        self.storage.reset(self.one, self.b)
+
+        self.assertEqual(self.c, self.storage.get(self.one))
+        self.assertEqual(
+            [(self.two, self.b), (self.one, self.c), (self.one, self.b)], list(self.storage),
+        )
+        self.assertEqual(7.0, self.storage.runtime)
+
+    def testManyResets(self):
+        for i in range(100):
+            self.storage.reset(self.one, Mock(runtime=float(i)))
+
+        self.assertEqual(2, len(self.storage))
+        self.assertEqual(self.two, self.storage[0][0])
+        self.assertEqual(99.0, self.storage.get(self.one).runtime)
+        self.assertEqual(101.0, self.storage.runtime)
+
+    def testExtend(self):
+        storage = ResultStorage([(Mock(), self.c)])
+        storage.extend(self.storage)
+
+        self.assertEqual(3, len(storage))
+        self.assertEqual(6.0, storage.runtime)
+        self.assertEqual(self.a, storage.get(self.one))
+
+    def testRecordDoesNotKeepObject(self):
+        runnable_object = RunnableObject()
+        runnable_repr = repr(runnable_object)
+        runnable_id = runnable_object.id
+        object_ref = weakref.ref(runnable_object)
+        xunit_data = XUnitData(
+            reason=Reason(runnable_object, 'traceback', None), runtime=1.0,
+        )
+
+        storage = ResultStorage([(runnable_object, xunit_data)])
+        self.assertIs(runnable_object, storage[0][0])
+
+        del runnable_object
+        gc.collect()
+        self.assertIsNone(object_ref())
+
+        snapshot, _ = storage[0]
+        self.assertTrue(isinstance(snapshot, RunnableSnapshot))
+        self.assertEqual(runnable_id, snapshot.id)
+        self.assertEqual(runnable_repr, repr(snapshot))
+        self.assertEqual(u'traceback', xunit_data.reason)
+        self.assertEqual(1.0, storage.runtime)
+
+    def testRecordOfSuite(self):
+        suite = Suite('record')
+        suite.__mount_data__ = SuiteMountData()
+
+        snapshot = RunnableSnapshot(suite)
+        self.assertIsNone(snapshot.suite_name)
+        self.assertIsNone(snapshot.case_name)
+        self.assertIs(suite, ResultStorage([(suite, self.a)])[0][0])
+
+    def testRecordKeepsOtherObject(self):
+        runnable_object = Mock()
+        object_id = id(runnable_object)
+        storage = ResultStorage([(runnable_object, self.a)])
+
+        del runnable_object
+        gc.collect()
+        self.assertEqual(object_id, id(storage[0][0]))
+
+    def testHashOfEqualRecords(self):
+        runnable_object = RunnableObject()
+        record = ResultRecord(runnable_object, self.a)
+        snapshot = ResultRecord(RunnableSnapshot(runnable_object), self.a)
+
+        self.assertEqual(record, snapshot)
+        self.assertEqual(hash(record), hash(snapshot))
+        self.assertEqual(record, (runnable_object, self.a))
+        self.assertNotEqual(record, (runnable_object, self.b))
+        self.assertNotEqual(record, None)
+        self.assertEqual(1, len(set([record, snapshot])))
+
+    def testLowMemory(self):
+        runnable_object = RunnableObject()
+        runnable_repr = repr(runnable_object)
+        xunit_data = XUnitData(
+            reason=Reason(runnable_object, 'traceback', None), runtime=1.0,
+        )
+
+        storage = ResultStorage(low_memory=True)
+        storage.append((runnable_object, xunit_data))
+
+        self.assertEqual(xunit_data, storage.get(runnable_object))
+        self.assertTrue(storage.reset(runnable_object, xunit_data))
+
+        del runnable_object
+        gc.collect()
+
+        snapshot, _ = storage[0]
+        self.assertTrue(isinstance(snapshot, RunnableSnapshot))
+        self.assertEqual(runnable_repr, repr(snapshot))
+        self.assertEqual(u'traceback', xunit_data.reason)
+
+    def testNewObjectWithIdOfCollectedOne(self):
+        runnable_object = RunnableObject()
+        object_id = id(runnable_object)
+
+        storage = ResultStorage(low_memory=True)
+        storage.append((runnable_object, self.a))
+
+        del runnable_object
+        gc.collect()
+
+        # id() of collected object can be given to new one
+        others = []
+        for _ in range(100):
+            others.append(RunnableObject())
+            if id(others[-1]) == object_id:
+                break
+
+        snapshot, _ = storage[0]
+
+        for other in others:
+            self.assertNotEqual(snapshot.id, other.id)
+            self.assertIsNone(storage.get(other))
+
+        self.assertFalse(storage.reset(others[-1], self.b))
+        self.assertEqual(self.a, storage[0][1])
+
+    def testEmpty(self):
+        self.assertFalse(ResultStorage())
+        self.assertTrue(self.storage)
+
+
+class ReasonCase(Case):
+    def test(self):
+        pass
+
+
+Suite('reason').register(ReasonCase)
+
+
+class LazyReasonTests(unittest.TestCase):
+    def setUp(self):
+        self.case = ReasonCase('test', config=Mock())
+
+    def testFormatOnce(self):
+        self.case.reason_storage['attempt'] = 1
+
+        with patch('seismograph.reason.item', wraps=_reason.item) as item:
+            xunit_data = XUnitData(
+                reason=Reason(self.case, 'traceback', None), runtime=1.0,
+            )
+            self.assertFalse(item.called)
+
+            expected = u'Case (info from test case): \n  attempt: 1\n\ntraceback'
+            self.assertEqual(expected, xunit_data.reason)
+            self.assertEqual(expected, xunit_data.to_dict()['reason'])
+            self.assertEqual(1, item.call_count)
+
+    def testDataOfCaseIsTakenOnError(self):
+        reasons = []
+
+        for attempt in range(1, 4):
+            self.case.reason_storage['attempt'] = attempt
+            reasons.append(Reason(self.case, 'traceback', None))
+
+        self.case.reason_storage['attempt'] = 'teardown'
+
+        for attempt, r in enumerate(reasons, 1):
+            self.assertIn(u'attempt: {}\n'.format(attempt), _reason.format_reason(r))
+
+    def testOverriddenReasonIsFormattedAtOnce(self):
+        runnable_object = Mock(__create_reason__=True)
+        runnable_object.__reason__ = Mock(return_value=u'steps\n')
+
+        xunit_data = XUnitData(
+            reason=Reason(runnable_object, 'traceback', None), runtime=1.0,
+        )
+        self.assertEqual(1, runnable_object.__reason__.call_count)
+        self.assertEqual(u'steps\ntraceback', xunit_data.reason)
+        self.assertEqual(1, runnable_object.__reason__.call_count)
+
+    def testReasonOfSnapshot(self):
+        r = Reason(RunnableSnapshot(self.case), 'traceback', None)
+
+        self.assertEqual(u'traceback', _reason.format_reason(r))
+        self.assertIn(repr(self.case), _reason.format_reason_to_output(r))
+
+    def testReasonToOutputDoesNotTakeData(self):
+        runnable_object = Mock(__create_reason__=True)
+        runnable_object.__reason__ = Mock(return_value=u'steps\n')
+
+        r = _reason.create(runnable_object, 'traceback', with_data=False)
+        self.assertFalse(runnable_object.__reason__.called)
+        self.assertIn(u'traceback', _reason.format_reason_to_output(r))
+
+
+class OutputSinkTests(unittest.TestCase):
+    def setUp(self):
+        self.sink = OutputSink()
+        self.sink.start()
+
+    def tearDown(self):
+        self.sink.stop()
+
+    def testOrder(self):
+        stream = Mock()
+
+        for i in range(100):
+            self.sink.put(stream, str(i))
+
+        self.sink.flush()
+        self.assertEqual(
+            [str(i) for i in range(100)],
+            [c[0][0] for c in stream.write.call_args_list],
+        )
+        self.assertTrue(stream.flush.called)
+
+    def testErrorIsRaisedOnFlush(self):
+        stream = Mock()
+        stream.write.side_effect = IOError('broken')
+
+        self.sink.put(stream, 'data')
+        self.assertRaises(IOError, self.sink.flush)
+        self.sink.flush()
+
+
+
+class CaptureStreamTests(unittest.TestCase):
+    def setUp(self):
+        self.stream = CaptureStream()
+
+    def testLogOfTest(self):
+        self.stream.begin()
+        self.stream.write(u'line\n')
+        self.assertEqual(u'line\n', self.stream.end())
+        self.assertEqual(None, self.stream.end())
+
+    def testLogOfPassedTest(self):
+        self.stream.begin()
+        self.stream.write('line\n')
+        self.assertEqual(None, self.stream.end(attach=False))
+
+    def testLogOutOfTest(self):
+        fp = Mock()
+
+        self.stream.write('common\n')
+        self.stream.begin()
+        self.stream.write('line\n')
+        self.stream.end()
+        self.stream.flush(fp)
+
+        self.assertEqual(u'common\n', fp.write.call_args_list[-1][0][0])
+
+    def testTailOfBigLog(self):
+        buffer = CaptureBuffer()
+
+        for i in range(10):
+            buffer.write('{}\n'.format(i))
+
+        self.assertEqual(20, len(buffer))
+        self.assertEqual(u'... 16 bytes were cut\n8\n9\n', buffer.read(limit=4))
+        buffer.close()
+
+    def testLogOfTasksWithoutContextVar(self):
+        class Task(object):
+            pass
+
+        first, second = Task(), Task()
+
+        with patch('seismograph.result.ContextVar', None):
+            stream = CaptureStream()
+
+        with patch('seismograph.result.get_current_task') as current_task:
+            current_task.return_value = first
+            stream.begin()
+            stream.write(u'first\n')
+
+            current_task.return_value = second
+            stream.begin()
+            stream.write(u'second\n')
+
+            current_task.return_value = first
+            stream.write(u'first again\n')
+            self.assertEqual(u'first\nfirst again\n', stream.end())
+
+            current_task.return_value = second
+            self.assertEqual(u'second\n', stream.end())
+
+
+class LogCaptureTests(unittest.TestCase):
+    def setUp(self):
+        self.add_handler = logging.Logger.addHandler
+        self.capture = LogCapture(Mock(NO_CAPTURE=False))
+
+    def tearDown(self):
+        logging.Logger.addHandler = self.add_handler
+
+    def testLoggerCreatedLater(self):
+        existing = logging.getLogger('tests.result.existing')
+        existing_handler = logging.StreamHandler()
+        existing.addHandler(existing_handler)
+
+        self.capture.make()
+        self.assertTrue(self.capture.is_hooked)
+        self.assertTrue(existing_handler.stream is LogCapture.stream)
+
+        later = logging.getLogger('tests.result.later')
+        later_handler = logging.StreamHandler()
+        later.addHandler(later_handler)
+        self.assertTrue(later_handler.stream is LogCapture.stream)
+        self.assertEqual([later_handler], later.handlers)
+
+        file_handler = logging.FileHandler(os.devnull)
+        later.addHandler(file_handler)
+        self.assertFalse(file_handler.stream is LogCapture.stream)
+        file_handler.close()
+
+    def testHookIsInstalledOnce(self):
+        self.capture.make()
+        add_handler = logging.Logger.addHandler
+        self.capture.make()
+        self.assertEqual(add_handler, logging.Logger.addHandler)
+
+    def testHookIsRemovedOnRelease(self):
+        self.capture.make()
+        self.capture.release()
+
+        self.assertFalse(self.capture.is_hooked)
+        self.assertEqual(self.add_handler, logging.Logger.addHandler)
+
+        handler = logging.StreamHandler()
+        logging.getLogger('tests.result.released').addHandler(handler)
+        self.assertFalse(handler.stream is LogCapture.stream)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import unittest
+import time
+import sys
+import os
+
+from mock import Mock
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/' + '..')
+from seismograph import timeouts as _timeouts
+from seismograph.utils.mp import Heartbeat
+from seismograph.exceptions import CaseTimeout
+
+
+def busy(seconds):
+    t = time.time()
+    while time.time() - t < seconds:
+        pass
+
+
+class ThreadWatcherTests(unittest.TestCase):
+    def setUp(self):
+        self.case = Mock(id=1)
+
+    def testTimeoutIsRaised(self):
+        watcher = _timeouts.ThreadWatcher()
+
+        def run():
+            with watcher.watch(self.case, 0.1):
+                busy(2)
+
+        started = time.time()
+        self.assertRaises(CaseTimeout, run)
+        self.assertTrue(time.time() - started < 1)
+
+    def testNotRaisedAfterExit(self):
+        watcher = _timeouts.ThreadWatcher()
+
+        with watcher.watch(self.case, 0.1):
+            pass
+
+        busy(0.3)
+
+    def testHeartbeat(self):
+        heartbeat = Heartbeat(2)
+        watcher = _timeouts.ThreadWatcher(heartbeat=heartbeat)
+
+        with watcher.watch(self.case, 5):
+            running = heartbeat.running()
+            self.assertEqual(1, len(running))
+            self.assertEqual(1, running[0][0])
+            self.assertTrue(running[0][2] > time.time() + 5)
+
+        self.assertEqual([], heartbeat.running())
+        self.assertEqual(None, heartbeat.next_deadline())
+
+
+class HeartbeatTests(unittest.TestCase):
+    def testAllSlotsAreBusy(self):
+        heartbeat = Heartbeat(1)
+        self.assertEqual(0, heartbeat.begin(1))
+        self.assertEqual(None, heartbeat.begin(2))
+        heartbeat.end(0)
+        self.assertEqual(0, heartbeat.begin(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import unittest
+import tempfile
+import shutil
+import sys
+import os
+from xml.etree import ElementTree
+
+from mock import Mock
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + '/' + '..')
+from seismograph.xunit import XUnitData
+from seismograph.xunit import XUnitWriter
+
+
+def create_result(name, tests):
+    state = Mock(tests=tests, runtime=1.0, skipped=0, errors=0, failures=0)
+
+    result = Mock(
+        errors=[],
+        skipped=[],
+        failures=[],
+        successes=[
+            (None, XUnitData(runtime=0.5, class_name=name, method_name='test')),
+        ] * tests,
+        current_state=state,
+        get_state=Mock(return_value=state),
+    )
+    result.name = name
+
+    return result
+
+
+class XUnitWriterTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.tmp_dir, 'report.xml')
+        self.writer = XUnitWriter(self.file_path, 'seismograph')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def parse(self):
+        return ElementTree.parse(self.file_path).getroot()
+
+    def testReportIsValidBeforeClose(self):
+        self.writer.open()
+        self.assertEqual(0, len(self.parse()))
+
+        self.writer.write(create_result('one', 2))
+        root = self.parse()
+        self.assertEqual(1, len(root))
+        self.assertEqual(2, len(root[0]))
+        self.assertEqual(None, root.get('tests'))
+
+    def testClose(self):
+        self.writer.open()
+        self.writer.write(create_result('one', 2))
+        self.writer.write(create_result('two', 1))
+        self.writer.close(create_result('seismograph', 3))
+
+        root = self.parse()
+        self.assertEqual('3', root.get('tests'))
+        self.assertEqual(['one', 'two'], [s.get('name') for s in root])
+
+    def testCloseWithoutSuites(self):
+        self.writer.open()
+        self.writer.close(create_result('seismograph', 1))
+
+        root = self.parse()
+        self.assertEqual('1', root.get('tests'))
+        self.assertEqual(['seismograph'], [s.get('name') for s in root])
+
+
+if __name__ == '__main__':
+    unittest.main()